@@ -0,0 +1,2 @@
+# benchmark suite, asv style: time_* functions and methods, optionally with
+# params/param_names and a setup, discovered and run by benchmarks/run.py
@@ -0,0 +1,82 @@
+# construction of quarks, states, state tables and multiplets, and conservation checks
+import itertools
+
+import numpy as np
+
+from .common import catalog, synthetic, sizes
+from hadrons.core import quark, state, StateTable, generate
+from hadrons import multiplets, reactions
+
+class Construct():
+    # quarks and states are interned, so every call builds one under a fresh
+    # name, otherwise only the lookup of the interned object would be timed;
+    # the quarks made are dropped from the registry afterwards
+    def setup(self):
+        self.names = ( 'bench'+str(i) for i in itertools.count() )
+
+    def teardown(self):
+        for name in [ n for n in quark.registry if n.startswith(('bench', 'anti-bench')) ]:
+            del quark.registry[name]
+
+    def time_quark(self):
+        quark( next(self.names), '$c$', Q = 2/3, C = 1 )
+
+    def time_antiquark(self):
+        # a quark and its conjugate
+        quark( next(self.names), '$c$', Q = 2/3, C = 1 ).anti()
+
+    def time_state(self):
+        q = catalog.quarks
+        state( next(self.names), r'$\Lambda_c^+$', [q['u'], q['d'], q['c']] )
+
+def time_catalog():
+    StateTable.from_states( list(catalog.meson_table) + list(catalog.baryon_table) )
+
+class Synthetic():
+    params      = sizes
+    param_names = ['states']
+
+    def setup(self, n):
+        self.table = synthetic(n)
+
+    def time_table(self, n):
+        StateTable(self.table.quarks, self.table.content, self.table.names, self.table.titles)
+
+    def time_views(self, n):
+        for s in self.table:
+            s.Iz
+
+class Generate():
+    params      = [ 'meson', 'baryon', 'tetraquark', 'pentaquark' ]
+    param_names = ['kind']
+
+    def time_generate(self, kind):
+        quarks = [ catalog.quarks[f] for f in 'udscbt' ]
+        for k, table in generate(quarks, kinds=(kind,)):
+            pass
+
+class Decompose():
+    # flavour group and (quarks, antiquarks), from scratch: the memoized
+    # Kostka numbers are cleared before every call
+    params      = [ [3, 4, 5], ['1,1', '3,0', '2,2'] ]
+    param_names = ['flavours', 'product']
+
+    def time_decompose(self, n, product):
+        multiplets.kostka.cache_clear()
+        quarks = [ catalog.quarks[f] for f in 'udscb'[:n] ]
+        for r in multiplets.decompose(quarks, *map(int, product.split(','))):
+            r.table()
+
+class Conserve():
+    # random one to three body processes over the catalog
+    params      = sizes
+    param_names = ['processes']
+
+    def setup(self, n):
+        rng = np.random.default_rng(0)
+        self.table   = catalog.hadron_table
+        self.initial = rng.integers(0, len(self.table), (n,1))
+        self.final   = rng.integers(-1, len(self.table), (n,3))
+
+    def time_conserve(self, n):
+        reactions.conserve(self.table, self.initial, self.final, weak=True)
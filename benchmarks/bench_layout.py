@@ -0,0 +1,33 @@
+# overlap layout of the states sharing a site and the multiplet outlines
+from .common import stock, synthetic, sizes
+from hadrons.build import figure_states
+from hadrons.layout import spread, layer_hulls
+
+class Stock():
+    params      = stock
+    param_names = ['figure']
+
+    def setup(self, name):
+        self.keys = [ s.key(('Iz','S','C')) for s in figure_states(name) ]
+        self.sites = tuple(sorted(set(self.keys)))
+
+    def time_spread(self, name):
+        spread(self.keys)
+
+    def time_layer_hulls(self, name):
+        # the computation itself, not the per multiplet cache
+        layer_hulls.__wrapped__(self.sites)
+
+class Synthetic():
+    params      = sizes
+    param_names = ['states']
+
+    def setup(self, n):
+        self.keys = [ s.key(('Iz','S','C')) for s in synthetic(n) ]
+        self.sites = tuple(sorted(set(self.keys)))
+
+    def time_spread(self, n):
+        spread(self.keys)
+
+    def time_layer_hulls(self, n):
+        layer_hulls.__wrapped__(self.sites)
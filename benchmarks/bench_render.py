@@ -0,0 +1,89 @@
+# artist creation, drawing and export of the stock figures and of synthetic catalogs
+import os
+import tempfile
+
+import matplotlib.pyplot as plt
+
+from .common import stock, synthetic, sizes
+from hadrons.build import figures, make_figure, export
+from hadrons.plotting import plot, plot3d
+from hadrons.blit import Blitter
+
+class Stock():
+    params      = stock
+    param_names = ['figure']
+
+    def setup(self, name):
+        self.fig = make_figure(name)
+        self.fig.canvas.draw()
+
+    def teardown(self, name):
+        plt.close(self.fig)
+
+    def time_artists(self, name):
+        plt.close( make_figure(name) )
+
+    def time_draw(self, name):
+        self.fig.canvas.draw()
+
+class Blit():
+    # repainting half of the states over the cached background, against time_draw
+    params      = stock
+    param_names = ['figure']
+
+    def setup(self, name):
+        self.fig  = make_figure(name)
+        self.blit = Blitter(self.fig)
+        self.blit.update()
+        self.blit.show( list( range(0, self.blit.nstates, 2) ) )
+
+    def teardown(self, name):
+        self.blit.disconnect()
+        plt.close(self.fig)
+
+    def time_update(self, name):
+        self.blit.update()
+
+class Export():
+    params      = [ stock, ['pdf', 'png', 'svg'] ]
+    param_names = ['figure', 'format']
+
+    def setup(self, name, fmt):
+        self.fig = make_figure(name)
+        self.tmp = tempfile.mkdtemp()
+
+    def teardown(self, name, fmt):
+        plt.close(self.fig)
+        for f in os.listdir(self.tmp):
+            os.remove( os.path.join(self.tmp, f) )
+        os.rmdir(self.tmp)
+
+    def time_savefig(self, name, fmt):
+        export( self.fig, [ (os.path.join(self.tmp, name+'.'+fmt), None) ], **figures[name]['save'] )
+
+class Synthetic():
+    params      = [ sizes, ['plot', 'plot3d'] ]
+    param_names = ['states', 'panel']
+
+    def setup(self, n, panel):
+        self.states = list( synthetic(n) )
+        self.fig    = self.draw(panel)
+        self.fig.canvas.draw()
+
+    def teardown(self, n, panel):
+        plt.close(self.fig)
+
+    def draw(self, panel):
+        fig = plt.figure(figsize=(7,6))
+        if panel=='plot3d':
+            ax = fig.add_subplot(111, projection='3d')
+            plot3d( self.states, ax=ax, mes=None, bar=None, content=False, labels=None, batch=True )
+        else:
+            plot( self.states, ax=fig.add_subplot(111), hexr=None, batch=True )
+        return fig
+
+    def time_artists(self, n, panel):
+        plt.close( self.draw(panel) )
+
+    def time_draw(self, n, panel):
+        self.fig.canvas.draw()
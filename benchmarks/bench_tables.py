@@ -0,0 +1,29 @@
+# quantum number tables for the terminal
+import contextlib
+import io
+
+from .common import catalog, synthetic
+from hadrons.tables import print_quarks, print_states
+
+def quiet(f, *args):
+    with contextlib.redirect_stdout( io.StringIO() ):
+        f(*args)
+
+def time_print_quarks():
+    quiet( print_quarks, catalog.quarks )
+
+def time_print_mesons():
+    quiet( print_states, catalog.mesons, 'Mesons' )
+
+def time_print_baryons():
+    quiet( print_states, catalog.baryons, 'Baryons' )
+
+class Synthetic():
+    params      = [ 1000, 10000 ]
+    param_names = ['states']
+
+    def setup(self, n):
+        self.states = synthetic(n).as_dict()
+
+    def time_print_states(self, n):
+        quiet( print_states, self.states )
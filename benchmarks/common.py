@@ -0,0 +1,32 @@
+# shared inputs of the benchmarks: the stock figures and synthetic catalogs
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert( 0, os.path.dirname( os.path.dirname( os.path.abspath(__file__) ) ) )
+
+import matplotlib
+matplotlib.use('Agg')
+
+from hadrons import catalog
+from hadrons.core import StateTable
+
+# the eight stock isospin diagrams
+stock = [ f+'_'+k+'_s'+s for f in ('st','ch') for k in ('mes','bar') for s in '01' ]
+
+# synthetic catalog sizes
+sizes = [ 1000, 10000, 100000 ]
+
+def synthetic(n, seed=0):
+    # n random mesons and baryons over u, d, s, c and their antiquarks,
+    # without titles so that only the markers are drawn
+    quarks  = [ catalog.quarks[f] for f in ('u','d','s','c','ubar','dbar','sbar','cbar') ]
+    rng     = np.random.default_rng(seed)
+    content = np.full( (n,3), -1, dtype=np.intp )
+    baryon  = rng.random(n)<0.5
+    content[baryon]     = rng.integers(0, 4, (baryon.sum(), 3))
+    content[~baryon,0]  = rng.integers(0, 4, (~baryon).sum())
+    content[~baryon,1]  = rng.integers(4, 8, (~baryon).sum())
+    names = [ 's'+str(i) for i in range(n) ]
+    return StateTable(quarks, content, names, ['']*n)
@@ -0,0 +1,144 @@
+# run the benchmark suite and keep the results per commit
+#
+#   python benchmarks/run.py                  # everything, saved as results/<commit>.json
+#   python benchmarks/run.py -b spread -b 'Stock.*draw'
+#   python benchmarks/run.py --compare HEAD~3 HEAD
+#
+# the suite follows the asv conventions: module level time_* functions and
+# classes with time_* methods, an optional setup/teardown and params, a list
+# (or a list of lists, for the cartesian product) with param_names
+import argparse
+import glob
+import importlib
+import inspect
+import itertools
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+here = os.path.dirname( os.path.abspath(__file__) )
+root = os.path.dirname(here)
+results_dir = os.path.join(here, 'results')
+
+def git(*args):
+    return subprocess.run(['git']+list(args), cwd=root, capture_output=True, text=True).stdout.strip()
+
+def commit_of(rev):
+    return git('rev-parse', '--short=12', rev) or rev
+
+def discover():
+    # (name, function, class, parameter combinations) for every benchmark of the suite
+    sys.path.insert(0, root)
+    benchmarks = []
+    for path in sorted( glob.glob( os.path.join(here, '*.py') ) ):
+        module = os.path.splitext( os.path.basename(path) )[0]
+        if module in ('__init__', 'run', 'common'): continue
+        mod = importlib.import_module('benchmarks.'+module)
+        for name, obj in sorted( vars(mod).items() ):
+            if name.startswith('time_') and inspect.isfunction(obj) and obj.__module__==mod.__name__:
+                benchmarks.append( (module+'.'+name, obj, None, [()]) )
+            elif inspect.isclass(obj) and obj.__module__==mod.__name__:
+                params = getattr(obj, 'params', None)
+                if params is None: combos = [()]
+                elif params and isinstance(params[0], list): combos = list( itertools.product(*params) )
+                else: combos = [ (p,) for p in params ]
+                for meth in sorted( m for m in vars(obj) if m.startswith('time_') ):
+                    benchmarks.append( (module+'.'+name+'.'+meth, meth, obj, combos) )
+    return benchmarks
+
+def measure(f, repeat, budget, limit=10):
+    # time one call to calibrate the number of calls per sample, then take
+    # samples, slow benchmarks stop at two samples once past `limit` seconds
+    t = timeit.timeit(f, number=1)
+    number = max( 1, int( budget/max(t, 1e-9) ) )
+    samples = [ t ] if number==1 else []
+    while len(samples)<repeat and not ( len(samples)>=2 and sum(samples)*number>limit ):
+        samples.append( timeit.timeit(f, number=number)/number )
+    return dict( median=statistics.median(samples), min=min(samples), number=number, repeat=len(samples) )
+
+def run(patterns, repeat, budget, quiet=False):
+    results = {}
+    for name, f, cls, combos in discover():
+        for combo in combos:
+            key = name + ( '(' + ', '.join( str(c) for c in combo ) + ')' if combo else '' )
+            if patterns and not any( re.search(p, key) for p in patterns ): continue
+            if cls is not None:
+                bench = cls()
+                if hasattr(bench, 'setup'): bench.setup(*combo)
+                call = lambda: getattr(bench, f)(*combo)
+            else:
+                call = f
+            try:
+                results[key] = measure(call, repeat, budget)
+            finally:
+                if cls is not None and hasattr(bench, 'teardown'): bench.teardown(*combo)
+            if not quiet:
+                print( '{:60s} {:>12s}'.format(key, format_time(results[key]['median'])), flush=True )
+    return results
+
+def format_time(secs):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if secs>=scale: return '{:.3g} {:s}'.format(secs/scale, unit)
+    return '{:.3g} ns'.format(secs/1e-9)
+
+def machine():
+    import numpy, matplotlib
+    return dict( python=platform.python_version(), numpy=numpy.__version__, matplotlib=matplotlib.__version__,
+                 platform=platform.platform(), cpus=os.cpu_count() )
+
+def result_path(rev):
+    if os.path.exists(rev): return rev
+    return os.path.join( results_dir, commit_of(rev)+'.json' )
+
+def compare(old, new, threshold):
+    # ratio new/old of the median of every benchmark in both runs, returns the regressions
+    a = json.load( open( result_path(old) ) )['results']
+    b = json.load( open( result_path(new) ) )['results']
+    regressions = []
+    label = lambda rev: os.path.splitext( os.path.basename(rev) )[0][:12]
+    print( '{:60s} {:>12s} {:>12s} {:>7s}'.format('benchmark', label(old), label(new), 'ratio') )
+    for key in sorted( set(a) & set(b) ):
+        ratio = b[key]['median'] / a[key]['median']
+        flag  = '  +' if ratio>threshold else ( '  -' if ratio<1/threshold else '' )
+        if ratio>threshold: regressions.append(key)
+        print( '{:60s} {:>12s} {:>12s} {:7.2f}{:s}'.format(key, format_time(a[key]['median']), format_time(b[key]['median']), ratio, flag) )
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the hadrons benchmark suite and store the results per commit')
+    parser.add_argument('-b', '--bench', action='append', default=[], metavar='REGEX', help='only run benchmarks matching this regex (repeatable)')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='samples per benchmark (default %(default)s)')
+    parser.add_argument('--budget', type=float, default=0.05, help='seconds of calls per sample (default %(default)s)')
+    parser.add_argument('-o', '--output', help='result file (default results/<commit>.json)')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='compare two stored runs, by commit or file, instead of running')
+    parser.add_argument('--threshold', type=float, default=1.1, help='slowdown ratio reported as a regression (default %(default)s)')
+    opts = parser.parse_args(argv)
+
+    if opts.compare:
+        regressions = compare(*opts.compare, opts.threshold)
+        if regressions:
+            sys.exit('{:d} regression(s) over {:.2f}x'.format(len(regressions), opts.threshold))
+        return
+
+    commit = commit_of('HEAD')
+    dirty  = bool( git('status', '--porcelain', '--untracked-files=no') )
+    start  = time.time()
+    results = run(opts.bench, opts.repeat, opts.budget)
+    out = opts.output or os.path.join( results_dir, commit+('-dirty' if dirty else '')+'.json' )
+    os.makedirs( os.path.dirname( os.path.abspath(out) ), exist_ok=True )
+    # a partial run (-b) updates the stored results of the same commit
+    if os.path.exists(out):
+        results = dict( json.load( open(out) )['results'], **results )
+    with open(out, 'w') as f:
+        json.dump( dict( commit=commit, dirty=dirty, date=time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(start)),
+                         machine=machine(), results=results ), f, indent=1, sort_keys=True )
+    print('saved', os.path.relpath(out))
+
+if __name__ == "__main__":
+    main()
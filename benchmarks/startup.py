@@ -0,0 +1,50 @@
+# startup benchmark: importing the physics core and the catalog must stay
+# cheap and must not drag in matplotlib or tabulate
+#
+#   python benchmarks/startup.py [-n 15] [--budget 0.5]
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+root = os.path.dirname( os.path.dirname( os.path.abspath(__file__) ) )
+
+# run in a fresh interpreter each time so that nothing is already imported
+core_script = '''
+import sys, time
+t0 = time.perf_counter()
+import hadrons
+from hadrons import catalog, generate, quark
+mesons = catalog.mesons
+t1 = time.perf_counter()
+heavy = [ m for m in ('matplotlib', 'mpl_toolkits', 'tabulate') if m in sys.modules ]
+print(t1 - t0, ','.join(heavy))
+'''
+
+def time_import_core(script=core_script):
+    out = subprocess.run([sys.executable, '-c', script], cwd=root, check=True,
+                         capture_output=True, text=True).stdout.split()
+    return float(out[0]), out[1].split(',') if len(out) > 1 else []
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time a cold import of the hadrons core and catalog')
+    parser.add_argument('-n', type=int, default=15, help='number of fresh interpreters (default %(default)s)')
+    parser.add_argument('--budget', type=float, default=0.5, help='maximum median import time in seconds (default %(default)s)')
+    opts = parser.parse_args(argv)
+
+    times = []
+    for _ in range(opts.n):
+        secs, heavy = time_import_core()
+        if heavy:
+            sys.exit('import hadrons pulled in {}'.format(', '.join(heavy)))
+        times.append(secs)
+
+    median = statistics.median(times)
+    print('import hadrons: median {:.1f} ms, min {:.1f} ms over {} runs (budget {:.0f} ms)'.format(
+          median*1e3, min(times)*1e3, opts.n, opts.budget*1e3))
+    if median > opts.budget:
+        sys.exit('over budget')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# hadrons: quark model states and their isospin diagrams
+#
+# the physics core and the catalog only need numpy; the drawing, table and
+# build modules pull in matplotlib and tabulate, so they are imported on first use
+from .core import quark, state, StateTable, multiquarks, contents, generate, make_anti, meson
+from .index import StateIndex, minimal_contents
+from .pdg import load_mcd
+from .multiplets import decompose, irrep
+from .reactions import processes, conserve
+from . import catalog
+
+# public names of the lazily imported modules
+_lazy = {
+    'plot'        : 'plotting',
+    'plot3d'      : 'plotting',
+    'plot_facets' : 'plotting',
+    'LineBatch'   : 'plotting',
+    'place_labels': 'plotting',
+    'spread'      : 'layout',
+    'scaffold3d'  : 'layout',
+    'print_quarks': 'tables',
+    'print_states': 'tables',
+    'figures'     : 'build',
+    'build_figure': 'build',
+    'export'      : 'build',
+    'main'        : 'build',
+}
+
+def __getattr__(name):
+    if name in _lazy:
+        import importlib
+        value = getattr( importlib.import_module('.'+_lazy[name], __name__), name )
+        globals()[name] = value
+        return value
+    if name in ('plotting', 'layout', 'tables', 'build'):
+        import importlib
+        return importlib.import_module('.'+name, __name__)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+def __dir__():
+    return sorted( set(globals()) | set(_lazy) )
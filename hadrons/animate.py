@@ -0,0 +1,131 @@
+# rotating views of the 3d diagrams as a gif, an mp4 or numbered png frames
+#
+#   python -m hadrons.animate ch_bar_s1 -o ch_bar_s1.gif --frames 180 --fps 30 -j 4
+#   python -m hadrons.animate ch_mes_s0 -o frames/ch_mes_s0_%04d.png --elev 10 40
+#
+# every worker process builds the scene once and then only moves the camera
+# of its 3d axes and redraws for each of its frames; png frames are written as
+# asked, for a gif or an mp4 the workers leave raw rgba buffers in a temporary
+# directory (no png compression) that are assembled at the end
+import argparse
+import concurrent.futures
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+
+# the figure of the worker process, built once by its initializer
+scene = None
+
+def views(frames, azim=(-84, 276), elev=(18, 18)):
+    # (elev, azim) of each frame: the azimuth sweeps linearly without repeating
+    # its first view, the elevation swings from elev[0] to elev[1] and back so
+    # the animation loops without a jump
+    t = np.arange(frames)/frames
+    a = azim[0] + (azim[1]-azim[0])*t
+    e = elev[0] + (elev[1]-elev[0])*0.5*(1-np.cos(2*np.pi*t))
+    return list( zip( e.tolist(), a.tolist() ) )
+
+def build_scene(name, dpi=None):
+    global scene
+    import matplotlib
+    matplotlib.use('Agg')
+    from .build import make_figure
+    scene = make_figure(name)
+    if dpi: scene.set_dpi(dpi)
+    return scene
+
+def render_frames(frames, pattern):
+    # draw the scene at each (index, elev, azim) and write it as png, or as a
+    # raw .npy buffer when the pattern asks for one
+    import matplotlib.image
+    axes = [ ax for ax in scene.axes if ax.name=='3d' ]
+    paths = []
+    for i, elev, azim in frames:
+        for ax in axes:
+            ax.view_init(elev=elev, azim=azim)
+        scene.canvas.draw()
+        path = pattern % i
+        buf  = np.asarray( scene.canvas.buffer_rgba() )
+        if path.endswith('.npy'): np.save(path, buf)
+        else:                     matplotlib.image.imsave(path, buf, format='png')
+        paths.append(path)
+    return paths
+
+def render(name, pattern, frames, jobs=1, dpi=None):
+    # write all frames, split in contiguous chunks over `jobs` processes that
+    # each build the scene once
+    work   = [ (i,) + v for i, v in enumerate(frames) ]
+    chunks = [ c for c in np.array_split( np.arange(len(work)), max(jobs,1)*4 ) if len(c) ]
+    if jobs>1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=build_scene, initargs=(name, dpi)) as pool:
+            done = pool.map( render_frames, [ [ work[i] for i in c ] for c in chunks ], [pattern]*len(chunks) )
+            return [ p for paths in done for p in paths ]
+    build_scene(name, dpi)
+    return render_frames(work, pattern)
+
+def write_gif(paths, output, fps):
+    from PIL import Image
+    frames = [ Image.fromarray( np.load(p)[...,:3] ).convert('P', palette=Image.ADAPTIVE) for p in paths ]
+    frames[0].save( output, save_all=True, append_images=frames[1:], duration=round(1000/fps), loop=0, optimize=False )
+
+def write_mp4(paths, output, fps):
+    # raw frames piped into ffmpeg, padded to even dimensions for yuv420p,
+    # which every player understands
+    h, w = np.load(paths[0], mmap_mode='r').shape[:2]
+    proc = subprocess.Popen( [ 'ffmpeg', '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgba',
+                               '-s', '{:d}x{:d}'.format(w, h), '-framerate', str(fps), '-i', '-',
+                               '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p', '-c:v', 'libx264', output ],
+                             stdin=subprocess.PIPE )
+    for p in paths:
+        proc.stdin.write( np.load(p).tobytes() )
+    proc.stdin.close()
+    if proc.wait()!=0:
+        raise RuntimeError('ffmpeg failed writing '+output)
+
+def animate(name, output, frames=120, fps=24, azim=(-84, 276), elev=(18, 18), jobs=1, dpi=None):
+    # animate a stock figure into output: .gif, .mp4 or a png pattern such as frames/%04d.png
+    ext = os.path.splitext(output)[1].lower()
+    if '%' not in output and ext not in ('.gif', '.mp4'):
+        raise ValueError('output must be a .gif, an .mp4 or a png pattern with a %d field: '+output)
+    if ext=='.mp4' and shutil.which('ffmpeg') is None:
+        raise RuntimeError('writing mp4 needs ffmpeg on the PATH')
+    directory = os.path.dirname(output)
+    if directory: os.makedirs(directory, exist_ok=True)
+
+    if '%' in output:
+        return render(name, output, views(frames, azim, elev), jobs, dpi)
+    with tempfile.TemporaryDirectory() as tmp:
+        pattern = os.path.join(tmp, 'frame%05d.npy')
+        paths = render(name, pattern, views(frames, azim, elev), jobs, dpi)
+        if ext=='.gif': write_gif(paths, output, fps)
+        else:           write_mp4(paths, output, fps)
+    return [output]
+
+def main(argv=None):
+    from .build import figures
+    parser = argparse.ArgumentParser(prog='python -m hadrons.animate', description='Write a rotating view of a 3d diagram')
+    parser.add_argument('figure', choices=[ n for n, s in figures.items() if s['kind']!='plot' ], metavar='FIGURE',
+                        help='stock 3d figure to animate')
+    parser.add_argument('-o', '--output', help='.gif, .mp4 or png frame pattern like frames/%%04d.png (default FIGURE.gif)')
+    parser.add_argument('--frames', type=int, default=120, help='number of frames (default %(default)s)')
+    parser.add_argument('--fps', type=float, default=24, help='frames per second (default %(default)s)')
+    parser.add_argument('--azim', type=float, nargs=2, default=(-84, 276), metavar=('START', 'END'), help='azimuth sweep in degrees (default -84 276)')
+    parser.add_argument('--elev', type=float, nargs=2, default=(18, 18), metavar=('LOW', 'HIGH'), help='elevation swing in degrees (default 18 18)')
+    parser.add_argument('--dpi', type=float, help='resolution of the frames (default the figure dpi)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='worker processes (default %(default)s)')
+    opts = parser.parse_args(argv)
+
+    output = opts.output or opts.figure+'.gif'
+    start  = time.perf_counter()
+    try:
+        animate( opts.figure, output, opts.frames, opts.fps, tuple(opts.azim), tuple(opts.elev), opts.jobs, opts.dpi )
+    except (ValueError, RuntimeError) as err:
+        parser.error(str(err))
+    print('wrote {:s} ({:d} frames) in {:.2f}s with {:d} job(s)'.format(output, opts.frames, time.perf_counter()-start, opts.jobs))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+# render many diagrams from declarative specs in one process
+#
+#   python -m hadrons.batch figures.toml more.json -o out
+#   python -m hadrons.batch --dump stock.json        (the stock figures as a spec file)
+#
+# a spec file is TOML or JSON with one table per figure under `figures` and
+# optional `defaults` merged into each of them, e.g.
+#
+#   [defaults]
+#   formats = ["png", "png@300"]
+#
+#   [figures.kaons]
+#   catalog = "mesons"                       # mesons, baryons or all
+#   kind    = "plot"                         # plot, plot3d or facets
+#   states  = ["Kp", "Km", "Kz", "Kzb"]
+#   figsize = [6, 6]
+#   save    = { bbox_inches = "tight", pad_inches = 0.1 }
+#   args    = { hexr = "none", hulls = true }
+#
+# TOML has no null, so argument values of "none" stand for None
+#
+# figures are plain matplotlib Figures that pyplot never sees, drawn on one
+# Agg canvas that is handed from figure to figure (its renderer buffer is kept
+# while the size does not change) and cleared as soon as their outputs are
+# written, so memory does not grow with the number of diagrams
+import argparse
+import gc
+import inspect
+import json
+import os
+import resource
+import time
+
+spec_fields = { 'catalog', 'kind', 'states', 'figsize', 'args', 'save', 'formats' }
+kinds = ('plot', 'plot3d', 'facets')
+default_figsize = { 'plot': (6,6), 'plot3d': (7,6), 'facets': (21,6) }
+
+def read_specs(path):
+    # the figure specs of a TOML or JSON file by name, checked and with defaults filled in
+    if path.endswith('.toml'):
+        import tomllib
+        with open(path, 'rb') as f:
+            doc = tomllib.load(f)
+    else:
+        with open(path) as f:
+            doc = json.load(f)
+    if not isinstance(doc.get('figures'), dict):
+        raise ValueError(path+': no [figures] table')
+    defaults = doc.get('defaults', {})
+    return { name: normalize( dict(defaults, **spec), path+': '+name ) for name, spec in doc['figures'].items() }
+
+def normalize(spec, where):
+    from .build import check_formats, resolve_states
+    from .plotting import plot, plot3d
+    unknown = set(spec) - spec_fields
+    if unknown: raise ValueError(where+': unknown field(s) '+', '.join(sorted(unknown)))
+    kind = spec.get('kind', 'plot3d')
+    if kind not in kinds: raise ValueError(where+': kind must be one of '+', '.join(kinds))
+    args = { k: None if v=='none' else v for k, v in spec.get('args', {}).items() }
+    if kind!='facets':
+        known = inspect.signature( plot if kind=='plot' else plot3d ).parameters
+        bad   = [ k for k in args if k not in known or k in ('states', 'ax') ]
+        if bad: raise ValueError(where+': unknown {:s} argument(s) '.format(kind)+', '.join(bad))
+    spec = dict( catalog=spec.get('catalog', 'all'), kind=kind, states=list( spec.get('states', []) ),
+                 figsize=tuple( spec.get('figsize', default_figsize[kind]) ), args=args,
+                 save=dict( spec.get('save', {}) ), formats=list( spec.get('formats', ['png']) ) )
+    try:
+        check_formats(spec['formats'])
+        resolve_states(spec)
+    except (KeyError, ValueError) as err:
+        raise ValueError(where+': '+str(err))
+    return spec
+
+def dump_specs(path):
+    # the stock figures as a JSON spec file, a starting point for new ones
+    from .build import figures
+    doc = dict( defaults=dict( formats=['pdf', 'png'] ), figures={ name: dict(spec) for name, spec in figures.items() } )
+    with open(path, 'w') as f:
+        json.dump(doc, f, indent=1)
+
+class Batch():
+    # one Agg canvas and the specs drawn on it, one figure alive at a time
+    def __init__(self, outdir='.'):
+        self.outdir = outdir
+        self.canvas = None
+
+    def figure(self, figsize):
+        # a new pyplot-free figure on the shared canvas
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=figsize)
+        if self.canvas is None:
+            self.canvas = FigureCanvasAgg(fig)
+        else:
+            fig.set_canvas(self.canvas)
+            self.canvas.figure = fig
+        return fig
+
+    def render(self, name, spec):
+        # draw one spec and write its outputs, releasing the figure whatever happens
+        from .build import new_figure, export, output_paths, parse_format, resolve_states
+        paths = output_paths(name, self.outdir, spec['formats'])
+        for path in paths:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        fig = self.figure(spec['figsize'])
+        try:
+            new_figure( spec['kind'], resolve_states(spec), spec['figsize'], spec['args'], fig=fig )
+            export( fig, [ (path, parse_format(token)[1]) for path, token in zip(paths, spec['formats']) ], **spec['save'] )
+        finally:
+            fig.clear()
+            self.canvas.figure = None
+            del fig
+            # 3d axes and their artists refer to each other, collect them now
+            # instead of whenever the allocator next triggers the collector
+            gc.collect()
+        return paths
+
+    def run(self, specs, quiet=False):
+        done = {}
+        for name, spec in specs.items():
+            start = time.perf_counter()
+            done[name] = self.render(name, spec)
+            if not quiet:
+                print('{:24s} {:7.2f}s  {:s}'.format(name, time.perf_counter()-start, ' '.join(done[name])), flush=True)
+        return done
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m hadrons.batch', description='Render diagrams from TOML or JSON figure specs')
+    parser.add_argument('specs', nargs='*', help='spec files, later files override figures of the same name')
+    parser.add_argument('-o', '--outdir', default='.', help='directory holding the <format>/ outputs')
+    parser.add_argument('--dump', metavar='JSON', help='write the stock figures as a spec file and exit')
+    parser.add_argument('-q', '--quiet', action='store_true', help='only print the summary')
+    opts = parser.parse_args(argv)
+
+    if opts.dump:
+        dump_specs(opts.dump)
+        return
+    if not opts.specs:
+        parser.error('no spec files given')
+
+    import matplotlib
+    matplotlib.use('Agg')
+    specs = {}
+    try:
+        for path in opts.specs:
+            specs.update( read_specs(path) )
+    except (OSError, ValueError) as err:
+        parser.error(str(err))
+
+    start = time.perf_counter()
+    Batch(opts.outdir).run(specs, opts.quiet)
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/2**10
+    print('rendered {:d} figure(s) in {:.2f}s, max rss {:.0f} MB'.format(len(specs), time.perf_counter()-start, rss))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# draw the states of a diagram over a cached, pre-rendered background
+#
+#   fig = new_figure('plot3d', states, (7,6), dict(mes=0, bar=None))     # any canvas
+#   b   = Blitter(fig, config=('plot3d', 'mes=0'))
+#   b.show([0, 2, 5]); b.update()          # only states 0, 2 and 5
+#
+#   for rgba in render_subsets('plot3d', states, subsets, (7,6), dict(mes=0, bar=None)): ...
+#
+# the grid, axes, ticks and outlines of a diagram do not depend on the states
+# shown, so they are drawn once with the state artists (labelled '_state...' by
+# the plotting functions) set aside as animated, copied with copy_from_bbox and
+# kept in an LRU keyed by the configuration, the dpi and size and every axes'
+# position, limits, title and view; later frames restore that region and draw
+# only the state artists with draw_artist, then blit, which is what
+# interactive backends repaint and a no-op for Agg
+import collections
+import threading
+
+import numpy as np
+
+class BackgroundCache():
+    # LRU of background regions by key, bounded in entries (one is w*h*4 bytes)
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.entries = collections.OrderedDict()
+        self.lock    = threading.Lock()
+        self.hits    = 0
+        self.misses  = 0
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        return dict( hits=self.hits, misses=self.misses, size=len(self.entries), maxsize=self.maxsize )
+
+backgrounds = BackgroundCache()
+
+def is_state(artist):
+    label = artist.get_label()
+    return isinstance(label, str) and label.startswith('_state')
+
+def background_key(fig, config):
+    # everything the background pixels depend on once the states are set aside
+    axes = []
+    for ax in fig.axes:
+        entry = ( ax.name, tuple( np.round(ax.get_position().bounds, 6) ), ax.get_xlim(), ax.get_ylim(), ax.get_title() )
+        if ax.name=='3d':
+            entry += ( ax.get_zlim(), ax.elev, ax.azim, ax.roll )
+        axes.append(entry)
+    return repr( (config, fig.dpi, tuple( fig.get_size_inches() ), fig.canvas.get_width_height(), axes) )
+
+class Blitter():
+    # the state artists of a figure drawn over its cached background
+    # config names the diagram configuration (kind and plot arguments, not the
+    # states) so that figures of the same configuration share backgrounds;
+    # without it the background is only reused by this figure
+    def __init__(self, fig, config=None, cache=backgrounds):
+        self.fig    = fig
+        self.config = config if config is not None else ('figure', id(fig))
+        self.cache  = cache
+        self.artists = []
+        for a in fig.findobj(is_state):
+            if a not in self.artists: self.artists.append(a)
+        for a in self.artists:
+            a.set_animated(True)
+        # the full data and the state rows of the artists holding many states, to mask in show()
+        self.data = {}
+        for a in self.artists:
+            label = a.get_label()
+            if not label.startswith('_states'): continue
+            if hasattr(a, 'get_data_3d'): data = [ np.asarray(v) for v in a.get_data_3d() ]
+            elif hasattr(a, 'get_offsets'): data = [ np.asarray( a.get_offsets() ) ]
+            else: continue
+            rows = np.array( label[8:].split(','), dtype=np.intp ) if ':' in label else np.arange(len(data[0]))
+            self.data[a] = (data, rows)
+        self.nstates = max( [ rows.max()+1 for d, rows in self.data.values() if len(rows) ] +
+                            [ int(a.get_label()[7:])+1 for a in self.artists if a.get_label().startswith('_state:') ], default=0 )
+        self.cid = fig.canvas.mpl_connect('draw_event', self.on_draw)
+
+    def show(self, keep=None):
+        # show only some states, a boolean mask or row indices, None for all
+        n = self.nstates
+        if keep is None:
+            mask = np.ones(n, dtype=bool)
+        else:
+            keep = np.asarray(keep)
+            mask = keep.astype(bool) if keep.dtype==bool else np.isin( np.arange(n), keep )
+        for a in self.artists:
+            label = a.get_label()
+            if label.startswith('_state:'):
+                a.set_visible( bool( mask[ int(label[7:]) ] ) )
+            elif a in self.data:
+                data, rows = self.data[a]
+                sel = mask[rows]
+                if len(data)==3: a.set_data_3d( *[ v[sel] for v in data ] )
+                else:            a.set_offsets( data[0][sel] )
+
+    def on_draw(self, event):
+        # a full draw (first frame, resize, pan or rotation) leaves out the
+        # animated states: keep its pixels as the background, then add them
+        canvas = self.fig.canvas
+        self.cache.put( background_key(self.fig, self.config), canvas.copy_from_bbox(self.fig.bbox) )
+        self.draw_states()
+        canvas.blit(self.fig.bbox)
+
+    def draw_states(self):
+        # by zorder, on top of everything in the background
+        for a in sorted( self.artists, key=lambda a: a.get_zorder() ):
+            if not a.get_visible(): continue
+            if hasattr(a, 'do_3d_projection'): a.do_3d_projection()
+            a.axes.draw_artist(a)
+
+    def update(self):
+        # repaint the states over the background, drawing it only when it is
+        # not cached; returns the RGBA buffer of the canvas
+        canvas = self.fig.canvas
+        key = background_key(self.fig, self.config)
+        region = self.cache.get(key)
+        if region is None:
+            canvas.draw()
+        else:
+            canvas.restore_region(region)
+            # the projection of every 3d axes, as its own draw would set it
+            for ax in self.fig.axes:
+                if ax.name=='3d':
+                    ax.M    = ax.get_proj()
+                    ax.invM = np.linalg.inv(ax.M)
+            self.draw_states()
+            canvas.blit(self.fig.bbox)
+        return np.asarray( canvas.buffer_rgba() )
+
+    def disconnect(self):
+        self.fig.canvas.mpl_disconnect(self.cid)
+        for a in self.artists:
+            a.set_animated(False)
+
+def render_subsets(kind, states, subsets, figsize, args, dpi=None, cache=backgrounds):
+    # RGBA images of one diagram of `states` showing only each subset in turn
+    # (masks or row indices), on a pyplot-free figure whose background is drawn
+    # once; the states keep the layout they have in the full diagram
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from .build import new_figure
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    new_figure(kind, states, figsize, args, fig=fig)
+    blitter = Blitter( fig, (kind, repr( sorted( args.items() ) )), cache )
+    try:
+        for keep in subsets:
+            blitter.show(keep)
+            yield blitter.update().copy()
+    finally:
+        blitter.disconnect()
+        fig.clear()
@@ -0,0 +1,381 @@
+# the figure build driver: stock figure specs, the rebuild cache, export and the command line
+import argparse
+import concurrent.futures
+import contextlib
+import cProfile
+import fnmatch
+import hashlib
+import inspect
+import io
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+import matplotlib.image
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.transforms import Bbox
+import numpy as np
+
+from . import catalog, layout, plotting, stages
+from .plotting import plot, plot3d, plot_facets
+from .tables import print_quarks, print_states
+
+# the stock diagrams, in build order
+# each entry gives the catalog to draw from, the state keys, the plot function and its arguments
+figures = {
+    # scalar state charm mesons
+    'ch_mes_s0': dict( catalog='mesons', kind='plot3d', figsize=(7,6), args=dict(mes=0, bar=None),
+                       save=dict(bbox_inches='tight', pad_inches=-0.4),
+                       states=[ 'pip','pim','piz','Kp', 'Km', 'Kz', 'Kzb', 'eta', 'etapr', 'etac', 'Dm','Dp','Dz','Dzb','Dsm','Dsp'] ),
+    # vector state charm mesons
+    'ch_mes_s1': dict( catalog='mesons', kind='plot3d', figsize=(7,6), args=dict(mes=1, bar=None),
+                       save=dict(bbox_inches='tight', pad_inches=-0.4),
+                       states=[ 'rhop','rhom','rhoz','Kstp', 'Kstm', 'Kstz', 'Kstzb', 'omega', 'phi', 'jpsi', 'Dstm','Dstp','Dstz','Dstzb','Dsstm','Dsstp'] ),
+    # 1/2 state charm baryons
+    'ch_bar_s0': dict( catalog='baryons', kind='plot3d', figsize=(7,6), args=dict(mes=None, bar=0),
+                       save=dict(bbox_inches='tight', pad_inches=-0.4),
+                       states=[ 'p', 'n', 'sigp', 'sigm', 'sigz', 'lbz', 'xim', 'xiz', 'sigcz', 'sigcp','sigcpp','xicz','xicp','lbcp','Omegacz', 'xiccp', 'xiccpp', 'Omegaccp' ] ),
+    # 3/2 state charm baryons
+    'ch_bar_s1': dict( catalog='baryons', kind='plot3d', figsize=(7,6), args=dict(mes=None, bar=1),
+                       save=dict(bbox_inches='tight', pad_inches=-0.4),
+                       states=[ 'delm','delz','delp','delpp','sigp', 'sigm', 'sigz', 'xim', 'xiz', 'Omega','sigcz', 'sigcp','sigcpp','xicz','xicp','Omegacz', 'xiccp', 'xiccpp', 'Omegaccp','Omegaccpp' ] ),
+    # scalar state strange mesons
+    'st_mes_s0': dict( catalog='mesons', kind='plot', figsize=(6,6), args=dict(),
+                       save=dict(),
+                       states=[ 'pip','pim','piz','Kp', 'Km', 'Kz', 'Kzb', 'eta', 'etapr' ] ),
+    # vector state strange mesons
+    'st_mes_s1': dict( catalog='mesons', kind='plot', figsize=(6,6), args=dict(),
+                       save=dict(),
+                       states=[ 'rhop', 'rhom', 'rhoz', 'omega', 'phi', 'Kstp', 'Kstm', 'Kstz', 'Kstzb' ] ),
+    # 1/2 state strange baryons
+    'st_bar_s0': dict( catalog='baryons', kind='plot', figsize=(6,6), args=dict(hexc=(0,-1)),
+                       save=dict(),
+                       states=[ 'p', 'n', 'sigp', 'sigm', 'sigz', 'lbz', 'xim', 'xiz' ] ),
+    # 3/2 state strange baryons
+    'st_bar_s1': dict( catalog='baryons', kind='plot', figsize=(6,6), args=dict(hexc=(0,-1), hexr=None, tri=((-1.5,1.5,0,-1.5),(0,0,-3,0))),
+                       save=dict(),
+                       states=[ 'delm', 'delz', 'delp', 'delpp', 'sigstm', 'sigstz', 'sigstp', 'xistm', 'xistz', 'Omega' ] ),
+    # scalar state bottom mesons, one panel per bottomness
+    'bt_mes_s0': dict( catalog='mesons', kind='facets', figsize=(21,6), args=dict(by='Bt', panel='plot3d', hulls=True),
+                       save=dict(bbox_inches='tight', pad_inches=0.1),
+                       states=[ 'pip','pim','piz','Kp', 'Km', 'Kz', 'Kzb', 'eta', 'etapr', 'etac', 'Dm','Dp','Dz','Dzb','Dsm','Dsp',
+                                'etab', 'Bp', 'Bm', 'Bz', 'Bzb', 'Bsz', 'Bszb', 'Bcp', 'Bcm' ] ),
+    # 1/2 state bottom baryons, one panel per bottomness
+    'bt_bar_s0': dict( catalog='baryons', kind='facets', figsize=(14,6), args=dict(by='Bt', panel='plot3d', hulls=True),
+                       save=dict(bbox_inches='tight', pad_inches=0.1),
+                       states=[ 'p', 'n', 'sigp', 'sigm', 'sigz', 'lbz', 'xim', 'xiz', 'sigcz', 'sigcp','sigcpp','xicz','xicp','lbcp','Omegacz', 'xiccp', 'xiccpp', 'Omegaccp',
+                                'lbb', 'sigbp', 'sigbz', 'sigbm', 'xibz', 'xibm', 'Omegabm' ] ),
+}
+
+def resolve_states(spec):
+    # the states a spec names, from its catalog of mesons, baryons or all
+    states = { 'mesons': catalog.mesons, 'baryons': catalog.baryons,
+               'all': dict( catalog.mesons, **catalog.baryons ) }.get(spec['catalog'])
+    if states is None: raise ValueError('unknown catalog '+str(spec['catalog']))
+    unknown = [ key for key in spec['states'] if key not in states ]
+    if unknown: raise ValueError('unknown state(s) '+', '.join(unknown))
+    if not spec['states']: raise ValueError('no states')
+    return [ states[key] for key in spec['states'] ]
+
+def figure_states(name):
+    return resolve_states(figures[name])
+
+# drawing code whose source enters the cache key of each kind of figure
+renderers = {
+    'plot'   : ('plot', 'guides2d', 'LineBatch', 'spread', 'state_hulls', 'layer_hulls'),
+    'plot3d' : ('plot3d', 'scaffold3d', 'LineBatch', 'spread', 'hex3d', 'tri3d', 'hulls3d', 'state_hulls', 'layer_hulls',
+                'text_extent', 'BoxIndex', 'text_boxes', 'place_labels'),
+    'facets' : ('plot_facets', 'facet_limits', 'limit_ticks', 'plot', 'guides2d', 'plot3d', 'scaffold3d', 'LineBatch', 'spread',
+                'hex3d', 'tri3d', 'hulls3d', 'state_hulls', 'layer_hulls', 'text_extent', 'BoxIndex', 'text_boxes', 'place_labels'),
+}
+
+def figure_key(name):
+    # content hash of everything that goes into drawing a figure:
+    # the states with their titles and quantum numbers, the plot arguments,
+    # the drawing code, the matplotlib version and the style
+    spec   = figures[name]
+    states = [ (s.name, s.title, [ q.title for q in s.quarks ], list( s.key() )) for s in figure_states(name) ]
+    style  = { k: repr(v) for k, v in matplotlib.rcParams.items() if not k.startswith('backend') }
+    code   = [ inspect.getsource(getattr(plotting, f, None) or getattr(layout, f)) for f in renderers[spec['kind']] ]
+    inputs = dict( states=states, kind=spec['kind'], args=spec['args'], figsize=spec['figsize'], save=spec['save'],
+                   code=code, matplotlib=matplotlib.__version__, style=style )
+    return hashlib.sha256( json.dumps(inputs, sort_keys=True, default=repr).encode() ).hexdigest()
+
+manifest_name = '.hadrons-cache.json'
+
+def load_manifest(outdir='.'):
+    # maps each output path to the key of the figure last written there
+    try:
+        with open(os.path.join(outdir, manifest_name)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(manifest, outdir='.'):
+    path = os.path.join(outdir, manifest_name)
+    os.makedirs(outdir, exist_ok=True)
+    with open(path+'.tmp', 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(path+'.tmp', path)
+
+def layout_window(fig, bbox_inches=None, pad_inches=None):
+    # draw a figure on its Agg canvas and measure what savefig would write:
+    # the bbox (tight or given) snapped to whole pixels and its pixel window
+    # (left, top, right, bottom) in the Agg buffer, None if it leaves the canvas
+    # or the canvas is not Agg
+    agg = isinstance(fig.canvas, FigureCanvasAgg)
+    if agg:
+        with stages.stage('draw', fig):
+            fig.canvas.draw()
+        renderer = fig.canvas.get_renderer()
+    else:
+        renderer = None
+
+    bbox = None
+    if bbox_inches=='tight':
+        if pad_inches is None: pad_inches = matplotlib.rcParams['savefig.pad_inches']
+        bbox = fig.get_tightbbox(renderer).padded(pad_inches)
+    elif bbox_inches is not None:
+        bbox = bbox_inches
+
+    # snap the bbox to whole pixels so the cropped and saved outputs agree
+    if bbox is not None:
+        x0, y0, x1, y1 = np.round( bbox.extents*fig.dpi ) / fig.dpi
+        bbox = Bbox.from_extents(x0, y0, x1, y1)
+
+    window = None
+    if agg:
+        w, h = fig.canvas.get_width_height()
+        if bbox is None:
+            window = (0, 0, w, h)
+        else:
+            x0, y0, x1, y1 = np.round( bbox.extents*fig.dpi ).astype(int)
+            if x0>=0 and y0>=0 and x1<=w and y1<=h and x1>x0 and y1>y0:
+                window = (x0, h-y1, x1, h-y0)
+    return bbox, window
+
+def export(fig, outputs, bbox_inches=None, pad_inches=None):
+    # write a figure to several files from a single layout pass
+    # outputs are paths or (path, dpi) pairs, the format follows the extension
+    # the figure is drawn once on the Agg canvas, which also measures the tight
+    # bbox, and raster outputs at the figure dpi are cropped from that buffer;
+    # the other formats reuse the measured bbox so savefig skips its own
+    # measuring draw
+    outputs = [ (out, None) if isinstance(out, str) else tuple(out) for out in outputs ]
+    bbox, window = layout_window(fig, bbox_inches, pad_inches)
+
+    # the cropped outputs first: a raster savefig at another dpi redraws the Agg buffer
+    def cropped(out):
+        return out[0].lower().endswith('.png') and window is not None and out[1] in (None, fig.dpi)
+    for path, dpi in sorted( outputs, key=lambda out: not cropped(out) ):
+        fmt = os.path.splitext(path)[1][1:].lower()
+        with stages.stage( 'export:'+fmt+( '@'+str(dpi) if dpi else '' ) ):
+            if cropped( (path, dpi) ):
+                left, top, right, bottom = window
+                buf = np.asarray( fig.canvas.buffer_rgba() )[top:bottom, left:right]
+                matplotlib.image.imsave(path, buf, format='png', origin='upper', dpi=fig.dpi)
+            else:
+                fig.savefig(path, dpi=dpi or fig.dpi, bbox_inches=bbox)
+
+def render_rgba(fig, bbox_inches=None, pad_inches=None):
+    # the pixels export would write as png at the figure dpi, without a file
+    bbox, window = layout_window(fig, bbox_inches, pad_inches)
+    if window is not None:
+        left, top, right, bottom = window
+        return np.array( np.asarray( fig.canvas.buffer_rgba() )[top:bottom, left:right] )
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=fig.dpi, bbox_inches=bbox)
+    buf.seek(0)
+    return ( matplotlib.image.imread(buf, format='png')*255 ).round().astype(np.uint8)
+
+def parse_format(token):
+    # 'png' or 'png@300' -> (extension, dpi)
+    fmt, _, dpi = token.partition('@')
+    return fmt, float(dpi) if dpi else None
+
+def check_formats(formats):
+    # raise ValueError for a format savefig cannot write or a bad @dpi, before anything is drawn
+    supported = FigureCanvasAgg.get_supported_filetypes()
+    for token in formats:
+        try:
+            fmt, dpi = parse_format(token)
+        except ValueError:
+            raise ValueError('bad resolution in format '+token+', expected e.g. png@300')
+        if fmt not in supported:
+            raise ValueError('unknown format '+token+', choose from '+', '.join(sorted(supported)))
+        if dpi is not None and dpi<=0:
+            raise ValueError('bad resolution in format '+token)
+
+def output_paths(name, outdir='.', formats=('pdf','png')):
+    paths = []
+    for token in formats:
+        fmt, dpi = parse_format(token)
+        stem = name if dpi is None else name+'@'+token.partition('@')[2]
+        paths.append( os.path.normpath( os.path.join(outdir, fmt, stem+'.'+fmt) ) )
+    return paths
+
+def up_to_date(name, key, manifest, outdir='.', formats=('pdf','png')):
+    return all( [ manifest.get(path)==key and os.path.exists(path) for path in output_paths(name, outdir, formats) ] )
+
+def build_figure(name, outdir='.', formats=('pdf','png'), close=True, profile=False, cprofile=None, memory=False):
+    # draw one stock figure and save it in each format
+    # returns the name, wall time, the written paths and, with `profile`, the
+    # stage report of the build with the mathtext cache hits and misses it
+    # made; `memory` adds the peak memory of each stage from a second, traced
+    # build into a scratch directory; `cprofile` is a directory for a cProfile dump
+    start  = time.perf_counter()
+    report = stages.Profile() if profile else None
+    prof   = cProfile.Profile() if cprofile else None
+    before = plotting.mathtext_cache.snapshot()
+    paths  = output_paths(name, outdir, formats)
+    with ( report.figure(name) if report else contextlib.nullcontext() ):
+        if prof: prof.enable()
+        fig = draw_and_export(name, paths, formats)
+        if prof: prof.disable()
+    if prof:
+        os.makedirs(cprofile, exist_ok=True)
+        prof.dump_stats( os.path.join(cprofile, name+'.prof') )
+    if close: plt.close(fig)
+    secs = time.perf_counter()-start
+    if not report: return name, secs, paths, None
+
+    record = report.figures[name]
+    record['mathtext'] = plotting.mathtext_cache.counts_since(before)
+    if memory:
+        # mathtext is cached by now, so its parses do not show up in this pass
+        traced = stages.Profile(memory=True)
+        with tempfile.TemporaryDirectory() as scratch, traced.figure(name):
+            plt.close( draw_and_export( name, output_paths(name, scratch, formats), formats ) )
+        stages.add_memory( record, traced.figures[name] )
+    return name, secs, paths, record
+
+def draw_and_export(name, paths, formats):
+    spec = figures[name]
+    with stages.stage('catalog'):
+        states = figure_states(name)
+    fig = make_figure(name, states)
+    for path in paths:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    export( fig, [ (path, parse_format(token)[1]) for path, token in zip(paths, formats) ], **spec['save'] )
+    return fig
+
+def make_figure(name, states=None):
+    # create the figure of a stock spec and all of its artists, without drawing
+    spec = figures[name]
+    return new_figure( spec['kind'], figure_states(name) if states is None else states, spec['figsize'], spec['args'] )
+
+def new_figure(kind, states, figsize, args, fig=None):
+    # a figure with one plot3d, plot or facets diagram of the states, drawn
+    # into `fig` when given and otherwise into a new pyplot figure
+    if fig is None: fig = plt.figure(figsize=figsize)
+    with stages.stage('artists', fig):
+        if kind=='plot3d':
+            ax = fig.add_subplot(111,projection='3d')
+            plot3d( states, ax=ax, **args )
+        elif kind=='facets':
+            plot_facets( states, fig=fig, **args )
+        else:
+            ax = fig.add_subplot(111)
+            plot( states, ax=ax, **args )
+        fig.tight_layout()
+    return fig
+
+def select_figures(patterns):
+    # expand figure names and globs, keeping build order
+    if not patterns: return list(figures)
+    selected = []
+    for pat in patterns:
+        match = fnmatch.filter(figures, pat)
+        if not match:
+            raise ValueError('no figure matches '+pat+', choose from '+', '.join(figures))
+        selected += [ m for m in match if m not in selected ]
+    return [ name for name in figures if name in selected ]
+
+def write_profile(path, reports, opts):
+    # machine-readable stage report of a build, one entry per built figure
+    # the mathtext cache counts of each build are added up, as with -j they come from other processes
+    outputs = {}
+    for record in reports.values():
+        for out, counts in record.get('mathtext', {}).items():
+            total = outputs.setdefault( out, dict(hits=0, misses=0) )
+            total['hits']   += counts['hits']
+            total['misses'] += counts['misses']
+    mathtext = dict( hits=sum( [ c['hits'] for c in outputs.values() ] ), misses=sum( [ c['misses'] for c in outputs.values() ] ),
+                     outputs=dict( sorted(outputs.items()) ), maxsize=plotting.mathtext_cache.maxsize )
+    report = dict( catalog=dict( wall=catalog.load_time ), jobs=max(opts.jobs,1), formats=opts.formats,
+                   matplotlib=matplotlib.__version__, mathtext=mathtext, figures=reports )
+    if path=='-':
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    else:
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=1)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m hadrons', description='Make isospin diagrams for various known hadrons')
+    parser.add_argument('targets', nargs='*', help='figure names or globs to build, default all of: '+', '.join(figures))
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='number of figures to render in parallel')
+    parser.add_argument('-o', '--outdir', default='.', help='directory holding the pdf/ and png/ outputs')
+    parser.add_argument('-i', '--interactive', action='store_true', help='show the figures after building (serial only)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='do not print the quark and hadron tables')
+    parser.add_argument('--formats', nargs='+', default=['pdf','png'], metavar='FMT',
+                        help='output formats, png@DPI adds a png at another resolution (default: pdf png)')
+    parser.add_argument('-f', '--force', action='store_true', help='rebuild figures even if their outputs are up to date')
+    parser.add_argument('--profile', nargs='?', const='hadrons-profile.json', metavar='JSON',
+                        help='write the wall time, artists and peak RSS of every build stage to JSON (default %(const)s, - for stdout)')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='with --profile, build each figure a second time under tracemalloc for the peak memory of every stage')
+    parser.add_argument('--cprofile', metavar='DIR', help='also dump a cProfile of each figure build to DIR/<name>.prof')
+    opts = parser.parse_args(argv)
+
+    try:
+        check_formats(opts.formats)
+        names = select_figures(opts.targets)
+    except ValueError as err:
+        parser.error(str(err))
+
+    if not opts.quiet:
+        print_quarks(catalog.quarks)
+        print_states(catalog.mesons , 'Mesons')
+        print_states(catalog.baryons, 'Baryons')
+
+    # skip figures whose inputs match the manifest, interactive runs draw everything
+    start    = time.perf_counter()
+    manifest = load_manifest(opts.outdir)
+    keys     = { name: figure_key(name) for name in names }
+    stale    = [ name for name in names if opts.force or opts.interactive or not up_to_date(name, keys[name], manifest, opts.outdir, opts.formats) ]
+
+    profile = opts.profile is not None or opts.profile_memory
+    if opts.jobs>1 and not opts.interactive:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=opts.jobs) as pool:
+            results = list( pool.map(build_figure, stale, itertools.repeat(opts.outdir), itertools.repeat(opts.formats),
+                                     itertools.repeat(True), itertools.repeat(profile), itertools.repeat(opts.cprofile),
+                                     itertools.repeat(opts.profile_memory)) )
+    else:
+        results = [ build_figure(name, opts.outdir, opts.formats, not opts.interactive, profile, opts.cprofile, opts.profile_memory)
+                    for name in stale ]
+
+    for name, secs, paths, report in results:
+        manifest.update( { path: keys[name] for path in paths } )
+    if results: save_manifest(manifest, opts.outdir)
+
+    if profile:
+        write_profile( opts.profile or 'hadrons-profile.json', { name: report for name, secs, paths, report in results }, opts )
+
+    built = { name: (secs, paths) for name, secs, paths, report in results }
+    width = max( [ len(name) for name in names ], default=0 )
+    for name in names:
+        if name in built:
+            secs, paths = built[name]
+            print('{:<{w}s} {:7.2f}s  {:s}'.format(name, secs, ' '.join(paths), w=width))
+        else:
+            print('{:<{w}s} {:>8s}  {:s}'.format(name, 'cached', ' '.join(output_paths(name, opts.outdir, opts.formats)), w=width))
+    print('built {:d} of {:d} figure(s) in {:.2f}s with {:d} job(s)'.format(len(results), len(names), time.perf_counter()-start, max(opts.jobs,1)))
+
+    if opts.interactive:
+        plt.show()
@@ -0,0 +1,129 @@
+# the quark and hadron catalog
+import time
+
+from .core import quark, StateTable
+from .index import StateIndex
+
+start = time.perf_counter()
+
+# make quarks
+u = quark( 'u', '$u$', Q =    2/3, Iz =    0.5 )
+d = quark( 'd', '$d$', Q = -1/3, Iz = -0.5 )
+s = quark( 's', '$s$', Q = -1/3, S    = -1     )
+c = quark( 'c', '$c$', Q =    2/3, C    =    1     )
+b = quark( 'b', '$b$', Q = -1/3, Bt = -1     )
+t = quark( 't', '$t$', Q =    2/3, T    =    1     )
+
+ubar = u.anti('ubar', r'$\bar{u}$')
+dbar = d.anti('dbar', r'$\bar{d}$')
+sbar = s.anti('sbar', r'$\bar{s}$')
+cbar = c.anti('cbar', r'$\bar{c}$')
+bbar = b.anti('bbar', r'$\bar{b}$')
+tbar = t.anti('tbar', r'$\bar{t}$')
+
+quarks = { 'u': u, 'd': d, 's': s, 'c': c, 'b': b, 't': t,
+           'ubar': ubar, 'dbar': dbar, 'sbar': sbar, 'cbar': cbar, 'bbar': bbar, 'tbar': tbar }
+
+meson_table = StateTable.from_entries([
+    # light unflavoured
+    ('pip'  , '$\pi^+$'               , [u, dbar]),
+    ('pim'  , '$\pi^-$'               , [ubar, d]),
+    ('piz'  , '$\pi^0$'               , [u, ubar]),
+    ('eta'  , '$\eta$'                , [d, dbar]),
+    ('etapr', '$\eta\'$'              , [s, sbar]),
+    ('rhop' , r'$\rho^{\!+}$'         , [u, dbar]),
+    ('rhom' , r'$\rho^{\!-}$'         , [ubar, d]),
+    ('rhoz' , r'$\rho^0$'             , [u, ubar]),
+    # strange
+    ('Kp'   , '$K^{\!+}$'             , [u, sbar]),
+    ('Km'   , '$K^{\!-}$'             , [ubar, s]),
+    ('Kz'   , '$K^0$'                 , [d, sbar]),
+    ('Kzb'  , r'$\overline{K}^0$'     , [dbar, s]),
+    ('omega', '$\omega$'              , [d, dbar]),
+    ('phi'  , '$\phi\'$'              , [s, sbar]),
+    ('Kstp' , '$K^{*\!+}$'            , [u, sbar]),
+    ('Kstm' , '$K^{*\!-}$'            , [ubar, s]),
+    ('Kstz' , '$K^{*0}$'              , [d, sbar]),
+    ('Kstzb', r'$\overline{K}^{*0}$'  , [dbar, s]),
+    # charm
+    ('etac' , '$\eta_c$'              , [c, cbar]),
+    ('Dm'   , '$D^{\!-}$'             , [cbar, d]),
+    ('Dp'   , '$D^{\!+}$'             , [c, dbar]),
+    ('Dz'   , '$D^{0}$'               , [c, ubar]),
+    ('Dzb'  , '$\overline{D}^{0}$'    , [cbar, u]),
+    ('Dsm'  , '$D_s^{\!-}$'           , [cbar, s]),
+    ('Dsp'  , '$D_s^{\!+}$'           , [c, sbar]),
+    ('jpsi' , '$J/\psi$'              , [c, cbar]),
+    ('Dstm' , '$D^{*\!-}$'            , [cbar, d]),
+    ('Dstp' , '$D^{*\!+}$'            , [c, dbar]),
+    ('Dstz' , '$D^{*0}$'              , [c, ubar]),
+    ('Dstzb', '$\overline{D}^{*0}$'   , [cbar, u]),
+    ('Dsstm', '$D_s^{*\!-}$'          , [cbar, s]),
+    ('Dsstp', '$D_s^{*\!+}$'          , [c, sbar]),
+    # bottom
+    ('etab' , '$\eta_b$'              , [b, bbar]),
+    ('Bp'   , '$B^{\!+}$'             , [u, bbar]),
+    ('Bm'   , '$B^{\!-}$'             , [b, ubar]),
+    ('Bz'   , '$B^0$'                 , [d, bbar]),
+    ('Bzb'  , r'$\overline{B}^0$'     , [b, dbar]),
+    ('Bsz'  , '$B_s^0$'               , [s, bbar]),
+    ('Bszb' , r'$\overline{B}_s^0$'   , [b, sbar]),
+    ('Bcp'  , '$B_c^{\!+}$'           , [c, bbar]),
+    ('Bcm'  , '$B_c^{\!-}$'           , [b, cbar]),
+])
+
+baryon_table = StateTable.from_entries([
+    # unflavoured (spin 1/2)
+    ('p'         , '$p$'                    , [u,u,d]),
+    ('n'         , '$n$'                    , [u,d,d]),
+    # unflavoured (spin 3/2)
+    ('delm'      , '$\Delta^-$'             , [d,d,d]),
+    ('delz'      , '$\Delta^0$'             , [u,d,d]),
+    ('delp'      , '$\Delta^+$'             , [u,u,d]),
+    ('delpp'     , '$\Delta^{+\!\!+}$'      , [u,u,u]),
+    # strange (spin 1/2)
+    ('sigp'      , '$\Sigma^+$'             , [u,u,s]),
+    ('sigm'      , '$\Sigma^-$'             , [d,d,s]),
+    ('sigz'      , '$\Sigma^0$'             , [u,d,s]),
+    ('lbz'       , '$\Lambda^0$'            , [u,d,s]),
+    ('xim'       , '$\Xi^-$'                , [d,s,s]),
+    ('xiz'       , '$\Xi^0$'                , [u,s,s]),
+    # strange (spin 3/2)
+    ('sigstp'    , '$\Sigma^{*+}$'          , [u,u,s]),
+    ('sigstm'    , '$\Sigma^{*-}$'          , [d,d,s]),
+    ('sigstz'    , '$\Sigma^{*0}$'          , [u,d,s]),
+    ('xistm'     , '$\Xi^{*-}$'             , [d,s,s]),
+    ('xistz'     , '$\Xi^{*0}$'             , [u,s,s]),
+    ('Omega'     , '$\Omega^-$'             , [s,s,s]),
+    # charm (spin 1/2)
+    ('sigcz'     , '$\Sigma_c^0$'           , [d,d,c]),
+    ('sigcp'     , '$\Sigma_c^+$'           , [u,d,c]),
+    ('sigcpp'    , '$\Sigma_c^{+\!\!+}$'    , [u,u,c]),
+    ('xicz'      , '$\Xi_c^0$'              , [d,s,c]),
+    ('xicp'      , '$\Xi_c^+$'              , [u,s,c]),
+    ('lbcp'      , '$\Lambda_c^+$'          , [u,d,c]),
+    ('Omegacz'   , '$\Omega_c^0$'           , [s,s,c]),
+    ('Omegaccp'  , '$\Omega_{cc}^+$'        , [s,c,c]),
+    ('xiccp'     , '$\Xi_{cc}^+$'           , [d,c,c]),
+    ('xiccpp'    , '$\Xi_{cc}^{+\!\!+}$'    , [u,c,c]),
+    ('Omegaccpp' , '$\Omega_{cc}^{+\!\!+}$' , [c,c,c]),
+    # bottom (spin 1/2)
+    ('lbb'       , '$\Lambda_b^0$'           , [u,d,b]),
+    ('sigbp'     , '$\Sigma_b^+$'            , [u,u,b]),
+    ('sigbz'     , '$\Sigma_b^0$'            , [u,d,b]),
+    ('sigbm'     , '$\Sigma_b^-$'            , [d,d,b]),
+    ('xibz'      , '$\Xi_b^0$'               , [u,s,b]),
+    ('xibm'      , '$\Xi_b^-$'               , [d,s,b]),
+    ('Omegabm'   , '$\Omega_b^-$'            , [s,s,b]),
+])
+
+mesons  = meson_table.as_dict()
+baryons = baryon_table.as_dict()
+
+# every hadron of the catalog in one table with a quantum number index,
+# e.g. index.query(S=-1, C=1) or index.with_content(['u','d','s'])
+hadron_table = StateTable.from_states( list(meson_table) + list(baryon_table) )
+index = StateIndex(hadron_table)
+
+# seconds spent building the catalog on import
+load_time = time.perf_counter()-start
@@ -0,0 +1,351 @@
+# physics core: quarks, states and the columnar StateTable
+# only needs numpy so that it imports quickly without any plotting
+import itertools
+import math
+import weakref
+
+import numpy as np
+
+# every quantum number is stored exactly as a small integer in units of 1/6,
+# charges and baryon number come in thirds and isospin in halves
+units   = 6
+fields  = ('Q','B','Iz','S','C','Bt','T')
+columns = fields + ('Y',)
+ints    = ('S','C','Bt','T')
+
+def sixths(x):
+    # exact number of sixths in x, accepts ints, Fractions and floats such as 2/3
+    n = round(x*units)
+    if abs(x*units - n)>1e-6:
+        raise ValueError('quantum number '+str(x)+' is not a multiple of 1/'+str(units))
+    return int(n)
+
+def fraction(n):
+    # display string of n sixths as a reduced fraction, e.g. 4 -> '2/3'
+    g = math.gcd(n, units)
+    return str(n//g) if g==units else '{:d}/{:d}'.format(n//g, units//g)
+
+def _value(f, n):
+    # n sixths in natural units, int for the flavour quantum numbers
+    return n//units if f in ints else n/units
+
+def _qn(f):
+    i = columns.index(f)
+    return property( lambda self: _value(f, self.qn[i]) )
+
+class quark():
+    # quarks are interned by name: building one that exists returns it, and
+    # anti() always returns the one canonical antiquark, e.g. u.anti() is ubar
+    __slots__ = ('name', 'title', 'qn', '_anti')
+    registry  = {}
+
+    def __new__(cls, name, title, Q=0, B=1/3, Iz=0, S=0, C=0, Bt=0, T=0):
+        qn = [ sixths(x) for x in (Q, B, Iz, S, C, Bt, T) ]
+        for f, n in zip(fields, qn):
+            if f in ints and n%units:
+                raise ValueError('Creation of quark '+name+' failed. '+f+' must be an integer')
+        Y  = qn[1] + sum(qn[3:])
+        if Y != 2*(qn[0]-qn[2]):
+            raise RuntimeError('Creation of quark '+name+' failed. Hypercharge inconsistent '+fraction(Y)+' '+fraction(2*(qn[0]-qn[2])))
+        # electric charge, baryon number, 3rd component of isospin, strangeness,
+        # charmness, bottomness, topness and hypercharge, all in sixths
+        return cls._intern( name, title, tuple(qn) + (Y,) )
+
+    @classmethod
+    def _intern(cls, name, title, qn):
+        q = cls.registry.get(name)
+        if q is not None:
+            if q.qn != qn:
+                raise ValueError('Creation of quark '+name+' failed. A quark of that name with other quantum numbers exists')
+            if q.title != title:
+                raise ValueError('Creation of quark '+name+' failed. A quark of that name with title '+q.title+' exists')
+            return q
+        q = object.__new__(cls)
+        q.name  = name
+        q.title = title
+        q.qn    = qn
+        q._anti = None
+        cls.registry[name] = q
+        return q
+
+    def __reduce__(self):
+        # unpickles to the interned quark of the same name
+        return ( quark._intern, (self.name, self.title, self.qn) )
+
+    Q  = _qn('Q')
+    B  = _qn('B')
+    Iz = _qn('Iz')
+    S  = _qn('S')
+    C  = _qn('C')
+    Bt = _qn('Bt')
+    T  = _qn('T')
+    Y  = _qn('Y')
+
+    def key(self, names=columns):
+        # exact quantum numbers in sixths, usable for hashing, grouping and sorting
+        return tuple( [ self.qn[columns.index(f)] for f in names ] )
+
+    def anti(self,name='',title=''):
+        # the canonical antiquark, created and linked both ways on first use;
+        # naming it explicitly makes that one canonical
+        if self._anti is not None and name in ('', self._anti.name):
+            return self._anti
+        if name=='': name = 'anti-'+self.name
+        anti = quark._intern( name, title, tuple( [ -n for n in self.qn ] ) )
+        self._anti, anti._anti = anti, self
+        return anti
+
+    def __str__(self):
+        return 'quark({:s},Iz={:3.1f},S={:d},C={:d},Bt={:d},T={:d})'.format(self.name, self.Iz, self.S, self.C, self.Bt, self.T)
+
+class StateTable():
+    # struct-of-arrays catalog of states
+    # an int8 (nstates, 8) matrix of quantum numbers in sixths, in the order of
+    # `columns`, plus a (nstates, nquarks) matrix of indices into self.quarks,
+    # shorter contents are padded with -1, and `data` holds any further per-row
+    # arrays such as the PDG mass and width
+    fields = fields
+    ints   = ints
+
+    def __init__(self, quarks, content, names=None, titles=None, check=True, data=None):
+        self.quarks  = list(quarks)
+        content = np.asarray(content, dtype=np.intp)
+        self.content = content if content.ndim==2 else content.reshape(len(content), -1)
+        n = len(self.content)
+        self.names  = np.array( list(names)  if names  is not None else ['']*n, dtype=object )
+        self.titles = np.array( list(titles) if titles is not None else ['']*n, dtype=object )
+        self.data   = dict(data or {})
+
+        # quantum numbers of the quark table, the extra zero row is picked up by the -1 padding
+        qn = np.zeros( (len(self.quarks)+1, len(columns)), dtype=np.int16 )
+        for i, q in enumerate(self.quarks):
+            qn[i] = q.qn
+        sums = qn[self.content].sum(axis=1, dtype=np.int32)
+        if sums.size and np.abs(sums).max()>np.iinfo(np.int8).max:
+            raise OverflowError('quantum numbers of more than 127/6 do not fit the int8 table')
+        self.qn = sums.astype(np.int8)
+
+        if check: self.check()
+
+    # columns in natural units: floats for Q, B, Iz and Y, ints for the rest
+    def column(self, f):
+        return _value( f, self.qn[:,columns.index(f)].astype(int) )
+
+    Q  = property( lambda self: self.column('Q') )
+    B  = property( lambda self: self.column('B') )
+    Iz = property( lambda self: self.column('Iz') )
+    S  = property( lambda self: self.column('S') )
+    C  = property( lambda self: self.column('C') )
+    Bt = property( lambda self: self.column('Bt') )
+    T  = property( lambda self: self.column('T') )
+    Y  = property( lambda self: self.column('Y') )
+
+    def key(self, names=columns):
+        # exact (nstates, len(names)) int8 matrix in sixths for grouping and sorting
+        return self.qn[:, [ columns.index(f) for f in names ]]
+
+    @classmethod
+    def from_entries(cls, entries, check=True):
+        # entries are (name, title, quarks) tuples
+        entries = list(entries)
+        quarks  = []
+        index   = {}
+        nmax    = max( [ len(e[2]) for e in entries ], default=0 )
+        content = np.full( (len(entries), nmax), -1, dtype=np.intp )
+        for i, (name, title, qs) in enumerate(entries):
+            for j, q in enumerate(qs):
+                if id(q) not in index:
+                    index[id(q)] = len(quarks)
+                    quarks.append(q)
+                content[i,j] = index[id(q)]
+        return cls(quarks, content, [e[0] for e in entries], [e[1] for e in entries], check=check)
+
+    @classmethod
+    def from_states(cls, states, check=True):
+        return cls.from_entries( [ (s.name, s.title, s.quarks) for s in states ], check=check )
+
+    def check(self):
+        # vectorized hypercharge check, reports every inconsistent row at once
+        Q, Iz, Y = self.key(('Q','Iz','Y')).astype(int).T
+        bad = np.flatnonzero( Y != 2*(Q-Iz) )
+        if len(bad)>0:
+            rows = [ '{:s} {:s} {:s}'.format(self.names[i], fraction(Y[i]), fraction(2*(Q[i]-Iz[i]))) for i in bad ]
+            raise RuntimeError('Creation of states failed. Hypercharge inconsistent for '+str(len(bad))+' state(s): '+'; '.join(rows))
+
+    def take(self, idx):
+        # slice with an index array, boolean mask or slice without recomputing sums
+        sub = StateTable.__new__(StateTable)
+        sub.quarks = self.quarks
+        for f in ('content','names','titles','qn'):
+            setattr(sub, f, getattr(self,f)[idx])
+        sub.data = { k: v[idx] for k, v in self.data.items() }
+        return sub
+
+    def __len__(self):
+        return len(self.content)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, (int, np.integer)):
+            if idx<0: idx += len(self)
+            if idx<0 or idx>=len(self): raise IndexError('state index out of range')
+            return state.view(self, int(idx))
+        return self.take(idx)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield state.view(self, i)
+
+    def as_dict(self):
+        return { s.name: s for s in self }
+
+def _column(f):
+    i = columns.index(f)
+    return property( lambda self: _value(f, int(self.qn[i])) )
+
+class state():
+    # one hadron, either a lightweight view of a row of a StateTable or a
+    # standalone state built from quarks, which keeps its quantum numbers and
+    # quarks in tuples rather than in a one-row table of its own
+    # states built from quarks are interned by (name, content, spin), so
+    # equal ones are the same object and share their cached conjugate
+    __slots__ = ('_anti', '__weakref__')
+    interned  = weakref.WeakValueDictionary()
+
+    def __new__(cls, name, title, quarks, spin=None):
+        quarks = list(quarks)
+        key = ( name, tuple( sorted( [ q.name for q in quarks ] ) ), spin )
+        self = cls.interned.get(key)
+        if self is not None:
+            if self.title != title:
+                raise ValueError('Creation of state '+name+' failed. A state of that name and content with title '+self.title+' exists')
+            return self
+        self = cls.single(name, title, quarks, spin)
+        cls.interned[key] = self
+        return self
+
+    @classmethod
+    def single(cls, name, title, quarks, spin=None):
+        # a new standalone state, not interned
+        quarks = tuple(quarks)
+        qn = tuple( [ sum( [ q.qn[i] for q in quarks ] ) for i in range(len(columns)) ] )
+        if any( [ abs(n)>np.iinfo(np.int8).max for n in qn ] ):
+            raise OverflowError('quantum numbers of more than 127/6 do not fit the int8 table')
+        Q, Iz, Y = [ qn[columns.index(f)] for f in ('Q','Iz','Y') ]
+        if Y != 2*(Q-Iz):
+            raise RuntimeError('Creation of state '+name+' failed. Hypercharge inconsistent '+fraction(Y)+' '+fraction(2*(Q-Iz)))
+        self = object.__new__(_single)
+        self.name, self.title, self._quarks, self.qn, self.spin = name, title, quarks, qn, spin
+        self._anti = None
+        return self
+
+    @classmethod
+    def view(cls, table, row):
+        self = object.__new__(_view)
+        self.table = table
+        self.row   = row
+        self._anti = None
+        return self
+
+    Q  = _column('Q')
+    B  = _column('B')
+    Iz = _column('Iz')
+    S  = _column('S')
+    C  = _column('C')
+    Bt = _column('Bt')
+    T  = _column('T')
+    Y  = _column('Y')
+
+    def key(self, names=columns):
+        # exact quantum numbers in sixths, usable for hashing, grouping and sorting
+        qn = self.qn
+        return tuple( [ int(qn[columns.index(f)]) for f in names ] )
+
+    def anti(self,name='',title=''):
+        # the conjugate over the canonical antiquarks, cached and linked both
+        # ways; a named one is interned like any state, an unnamed one belongs
+        # to this state alone, so states of the same content never share it
+        if self._anti is not None and name in ('', self._anti.name):
+            return self._anti
+        quarks = [ q.anti() for q in self.quarks ]
+        anti = state(name, title, quarks, self.spin) if name else state.single(name, title, quarks, self.spin)
+        self._anti, anti._anti = anti, self
+        return anti
+
+    def __str__(self):
+        content = ','.join( [ q.name for q in self.quarks ] )
+        return '{:s}({:s}) Iz={:3.1f},S={:d},C={:d},B={:3.1f})'.format(self.name,content,self.Iz, self.S, self.C, self.B)
+
+class _view(state):
+    # a state reading row `row` of `table`
+    __slots__ = ('table', 'row')
+
+    def __reduce__(self):
+        return ( state.view, (self.table, self.row) )
+
+    name   = property( lambda self: self.table.names[self.row] )
+    title  = property( lambda self: self.table.titles[self.row] )
+    quarks = property( lambda self: [ self.table.quarks[j] for j in self.table.content[self.row] if j>=0 ] )
+    qn     = property( lambda self: self.table.qn[self.row] )
+
+    def __getattr__(self, name):
+        # the extra per-row data of the table, e.g. mass and width
+        if name!='table' and name in self.table.data: return self.table.data[name][self.row].item()
+        raise AttributeError("'state' object has no attribute '"+name+"'")
+
+    @property
+    def spin(self):
+        spin = self.table.data.get('spin')
+        return None if spin is None else spin[self.row].item()
+
+class _single(state):
+    # a standalone state, its quantum numbers a tuple in sixths in the order of `columns`
+    __slots__ = ('name', 'title', '_quarks', 'qn', 'spin')
+
+    def __reduce__(self):
+        # an interned state unpickles to the interned one, any other to a copy
+        key = ( self.name, tuple( sorted( [ q.name for q in self._quarks ] ) ), self.spin )
+        interned = state.interned.get(key) is self
+        return ( state if interned else state.single, (self.name, self.title, self._quarks, self.spin) )
+
+    quarks = property( lambda self: list(self._quarks) )
+
+# number of (quarks, antiquarks) in each kind of multiquark state
+multiquarks = {
+    'meson'      : (1,1),
+    'baryon'     : (3,0),
+    'tetraquark' : (2,2),
+    'pentaquark' : (4,1),
+}
+
+def contents(nq, nqbar, nflav):
+    # lazily yield canonical (sorted) content keys as index tuples into
+    # quarks + antiquarks, so permutations of the same content never appear
+    qs    = itertools.combinations_with_replacement( range(nflav), nq )
+    for q in qs:
+        qbars = itertools.combinations_with_replacement( range(nflav, 2*nflav), nqbar )
+        for qbar in qbars:
+            yield q + qbar
+
+def generate(quarks, kinds=('meson','baryon','tetraquark','pentaquark'), antiquarks=None, batch=4096):
+    # stream every multiquark content over the given quark subset as
+    # (kind, StateTable) batches of at most `batch` rows
+    # kinds can be names in `multiquarks` or explicit (nquarks, nantiquarks) tuples
+    quarks = list(quarks)
+    if antiquarks is None: antiquarks = [ q.anti() for q in quarks ]
+    if len(antiquarks) != len(quarks):
+        raise ValueError('need one antiquark per quark')
+    table = quarks + list(antiquarks)
+
+    for kind in kinds:
+        nq, nqbar = multiquarks[kind] if isinstance(kind, str) else kind
+        keys = contents(nq, nqbar, len(quarks))
+        while True:
+            chunk = np.fromiter( itertools.chain.from_iterable( itertools.islice(keys, batch) ), dtype=np.intp )
+            if len(chunk)==0: break
+            yield kind, StateTable(table, chunk.reshape(-1, nq+nqbar), check=False)
+
+def make_anti(parts):
+    return ( (-a,-b) for a,b in parts )
+
+def meson(a,b):
+    return (a[0]+b[0],a[1]+b[1])
@@ -0,0 +1,156 @@
+# golden image checks of the stock figures
+#
+#   python -m hadrons.golden                 # compare every figure with golden/<name>.png
+#   python -m hadrons.golden 'ch_*' -j 4     # some of them, in parallel
+#   python -m hadrons.golden --update        # accept the current renders as the new goldens
+#
+# each figure is rendered in memory to the RGBA pixels its png export would
+# have, and compared with its golden image by a perceptual distance per pixel
+# (the YIQ colour difference of pixelmatch, over a white background); a figure
+# fails if it changes size or more than --max-fraction of its pixels differ by
+# more than --threshold, and a heatmap of the differing pixels over the faded
+# golden is then written to golden/diff/<name>.png
+# the exit status is the number of failures, so it can run before every commit
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+import numpy as np
+
+# upper bound of the YIQ distance, black and white are 0.93 of it apart
+max_delta = 35215.0
+
+# the goldens are only comparable under the matplotlib (and so freetype) that drew them
+version_file = 'matplotlib.txt'
+
+def golden_version(directory='golden'):
+    try:
+        with open(os.path.join(directory, version_file)) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def flatten(rgba):
+    # float RGB of an RGBA image composited over white
+    rgba  = np.asarray(rgba, dtype=np.float64)
+    alpha = rgba[...,3:4]/255
+    return rgba[...,:3]*alpha + 255*(1-alpha)
+
+def yiq(rgb):
+    r, g, b = rgb[...,0], rgb[...,1], rgb[...,2]
+    return ( 0.29889531*r + 0.58662247*g + 0.11448223*b,
+             0.59597799*r - 0.27417610*g - 0.32180189*b,
+             0.21147017*r - 0.52261711*g + 0.31114694*b )
+
+def distance(a, b):
+    # perceptual distance of every pixel of two equally sized RGBA images, 0 to 1
+    ya, ia, qa = yiq( flatten(a) )
+    yb, ib, qb = yiq( flatten(b) )
+    return ( 0.5053*(ya-yb)**2 + 0.299*(ia-ib)**2 + 0.1957*(qa-qb)**2 ) / max_delta
+
+def heatmap(golden, delta, threshold):
+    # the golden faded to light grey with the differing pixels in red, brighter for larger differences
+    grey = yiq( flatten(golden) )[0]
+    out  = np.empty( delta.shape + (4,), dtype=np.uint8 )
+    out[...,:3] = ( 255 - 0.25*(255-grey) )[...,None]
+    bad  = delta>threshold
+    heat = np.clip( np.sqrt(delta[bad]), 0.25, 1 )
+    out[bad,0] = 255
+    out[bad,1] = ( 255*(1-heat) ).astype(np.uint8)
+    out[bad,2] = ( 255*(1-heat) ).astype(np.uint8)
+    out[...,3] = 255
+    return out
+
+def render(name):
+    # the png pixels of a stock figure, rendered on a pyplot-free figure
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from .build import figures, new_figure, figure_states, render_rgba
+    spec = figures[name]
+    fig  = Figure(figsize=spec['figsize'])
+    FigureCanvasAgg(fig)
+    try:
+        new_figure( spec['kind'], figure_states(name), spec['figsize'], spec['args'], fig=fig )
+        return render_rgba( fig, **spec['save'] )
+    finally:
+        fig.clear()
+
+def check(name, directory='golden', threshold=0.01, max_fraction=0.0, update=False):
+    # compare one figure with its golden image, or write it with `update`;
+    # returns (name, status, fraction of differing pixels, seconds)
+    import matplotlib.image
+    start  = time.perf_counter()
+    pixels = render(name)
+    path   = os.path.join(directory, name+'.png')
+    if update:
+        os.makedirs(directory, exist_ok=True)
+        matplotlib.image.imsave(path, pixels, format='png')
+        return name, 'updated', 0.0, time.perf_counter()-start
+    if not os.path.exists(path):
+        return name, 'missing', 1.0, time.perf_counter()-start
+    golden = ( matplotlib.image.imread(path)*255 ).round().astype(np.uint8)
+    if golden.shape[-1]==3:
+        golden = np.concatenate( (golden, np.full(golden.shape[:2]+(1,), 255, dtype=np.uint8)), axis=2 )
+    if golden.shape!=pixels.shape:
+        return name, 'size {:d}x{:d} != {:d}x{:d}'.format(pixels.shape[1], pixels.shape[0], golden.shape[1], golden.shape[0]), 1.0, time.perf_counter()-start
+    delta = distance(pixels, golden)
+    fraction = float( (delta>threshold).mean() )
+    if fraction>max_fraction:
+        os.makedirs(os.path.join(directory, 'diff'), exist_ok=True)
+        matplotlib.image.imsave( os.path.join(directory, 'diff', name+'.png'), heatmap(golden, delta, threshold), format='png' )
+        return name, 'differs', fraction, time.perf_counter()-start
+    return name, 'ok', fraction, time.perf_counter()-start
+
+def init_worker():
+    import matplotlib
+    matplotlib.use('Agg')
+
+def main(argv=None):
+    from .build import select_figures
+    parser = argparse.ArgumentParser(prog='python -m hadrons.golden', description='Compare the stock figures with their golden images')
+    parser.add_argument('targets', nargs='*', help='figure names or globs, default all')
+    parser.add_argument('-d', '--dir', default='golden', help='directory of the golden images (default %(default)s)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='figures compared in parallel (default %(default)s)')
+    parser.add_argument('--threshold', type=float, default=0.01,
+                        help='perceptual distance, 0 to 1, beyond which a pixel differs (default %(default)s)')
+    parser.add_argument('--max-fraction', type=float, default=0.0,
+                        help='fraction of differing pixels a figure may have (default %(default)s)')
+    parser.add_argument('--update', action='store_true', help='write the current renders as the golden images')
+    opts = parser.parse_args(argv)
+
+    try:
+        names = select_figures(opts.targets)
+    except ValueError as err:
+        parser.error(str(err))
+
+    import matplotlib
+    if opts.update:
+        os.makedirs(opts.dir, exist_ok=True)
+        with open(os.path.join(opts.dir, version_file), 'w') as f:
+            f.write(matplotlib.__version__+'\n')
+    elif golden_version(opts.dir) not in (None, matplotlib.__version__):
+        print('warning: the goldens were drawn with matplotlib {:s}, this is {:s}'.format(golden_version(opts.dir), matplotlib.__version__), file=sys.stderr)
+
+    start = time.perf_counter()
+    args  = (opts.dir, opts.threshold, opts.max_fraction, opts.update)
+    if opts.jobs>1 and len(names)>1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=opts.jobs, initializer=init_worker) as pool:
+            results = list( pool.map( check, names, *[ [a]*len(names) for a in args ] ) )
+    else:
+        init_worker()
+        results = [ check(name, *args) for name in names ]
+
+    failed = 0
+    width  = max( [ len(name) for name in names ], default=0 )
+    for name, status, fraction, secs in results:
+        if status not in ('ok', 'updated'): failed += 1
+        print('{:<{w}s} {:7.2f}s  {:8s} {:.4%}'.format(name, secs, status, fraction, w=width)
+              + ( '  ' + os.path.join(opts.dir, 'diff', name+'.png') if status=='differs' else '' ))
+    print('{:d} of {:d} figure(s) {:s} in {:.2f}s'.format( len(names)-failed, len(names), 'updated' if opts.update else 'match',
+                                                           time.perf_counter()-start ))
+    sys.exit( min(failed, 125) )
+
+if __name__ == "__main__":
+    main()
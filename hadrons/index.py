@@ -0,0 +1,124 @@
+# quantum number index over a StateTable: point, range and content queries,
+# and the inverse query for the minimal quark contents with given quantum numbers
+import functools
+
+import numpy as np
+
+from .core import columns, sixths, StateTable
+
+def encode(key):
+    # pack rows of int8 sixths into one uint64 per row, the first column most
+    # significant, so that sorting the codes sorts the rows lexicographically
+    code = np.zeros(len(key), dtype=np.uint64)
+    for j in range(key.shape[1]):
+        code = (code << np.uint64(8)) | (key[:,j].astype(np.int16) + 128).astype(np.uint64)
+    return code
+
+class StateIndex():
+    # the rows of a table sorted by the codes of a few columns, built on first use
+    # for each combination of columns that is queried; every lookup is then a
+    # pair of binary searches instead of a scan over the table
+    def __init__(self, table):
+        self.table   = table
+        self.sorted  = {}
+        self.content = None
+
+    def order(self, names):
+        if names not in self.sorted:
+            code  = encode( self.table.key(names) )
+            order = np.argsort(code, kind='stable')
+            self.sorted[names] = (code[order], order)
+        return self.sorted[names]
+
+    def lookup(self, names, lo, hi):
+        # rows whose columns `names` lie between the keys lo and hi (inclusive)
+        code, order = self.order(names)
+        lo = np.searchsorted( code, encode(np.array([lo])), 'left' )[0]
+        hi = np.searchsorted( code, encode(np.array([hi])), 'right' )[0]
+        return order[lo:hi]
+
+    def rows(self, **target):
+        # row indices matching every condition, a value for equality or an
+        # inclusive (lo, hi) range where either end can be None, e.g.
+        # rows(S=-1, C=1) or rows(Q=(0, None), B=1)
+        for f in target:
+            if f not in columns:
+                raise ValueError('unknown quantum number '+f+', use one of '+', '.join(columns))
+        eq    = { f: sixths(v) for f, v in target.items() if not isinstance(v, tuple) }
+        ranges = {}
+        for f, v in target.items():
+            if isinstance(v, tuple):
+                lo, hi = v
+                # clipped to the int8 range the keys are packed from
+                ranges[f] = ( -128 if lo is None else max(sixths(lo), -128), 127 if hi is None else min(sixths(hi), 127) )
+        # no row has a value beyond the int8 range, and an empty range matches nothing
+        if any( not -128<=v<=127 for v in eq.values() ) or any( lo>hi for lo, hi in ranges.values() ):
+            return np.array([], dtype=np.intp)
+
+        # the equalities and one range make a single contiguous block of the
+        # rows sorted by those columns, any further ranges filter that block
+        names = tuple( sorted(eq, key=columns.index) )
+        if ranges:
+            first = min( ranges, key=lambda f: ranges[f][1]-ranges[f][0] )
+            lo, hi = ranges.pop(first)
+            rows = self.lookup( names + (first,), tuple(eq[f] for f in names) + (lo,), tuple(eq[f] for f in names) + (hi,) )
+        elif names:
+            key  = tuple( eq[f] for f in names )
+            rows = self.lookup( names, key, key )
+        else:
+            rows = np.arange(len(self.table))
+
+        for f, (lo, hi) in ranges.items():
+            col  = self.table.qn[rows, columns.index(f)]
+            rows = rows[ (col>=lo) & (col<=hi) ]
+        return np.sort(rows)
+
+    def query(self, **target):
+        return self.table.take( self.rows(**target) )
+
+    def contents(self, quarks):
+        # rows with exactly this quark content in any order, quarks or their names
+        if self.content is None:
+            names = [ q.name for q in self.table.quarks ]
+            self.content = {}
+            for i, row in enumerate(self.table.content):
+                key = tuple( sorted( [ names[j] for j in row if j>=0 ] ) )
+                self.content.setdefault(key, []).append(i)
+        key = tuple( sorted( [ q if isinstance(q, str) else q.name for q in quarks ] ) )
+        return np.array( self.content.get(key, []), dtype=np.intp )
+
+    def with_content(self, quarks):
+        return self.table.take( self.contents(quarks) )
+
+@functools.lru_cache(maxsize=16)
+def content_index(quarks, antiquarks, max_size):
+    # one index per number of constituents over every colour singlet content,
+    # i.e. (quarks - antiquarks) a multiple of three
+    from .core import generate
+    sizes = []
+    for size in range(1, max_size+1):
+        kinds = [ (nq, size-nq) for nq in range(size+1) if (2*nq-size)%3==0 ]
+        if not kinds: continue
+        tables = [ table for kind, table in generate(quarks, kinds, antiquarks, batch=1<<20) ]
+        sizes.append( (size, [ StateIndex(table) for table in tables ]) )
+    return sizes
+
+def minimal_contents(quarks=None, antiquarks=None, max_size=6, **target):
+    # every colour singlet quark content with the fewest constituents that has
+    # the target quantum numbers, as a StateTable with one row per content;
+    # quantum numbers left out of the target are free
+    # e.g. minimal_contents(B=1, S=-2, Q=0, C=0, Bt=0, T=0) -> (u,s,s)
+    # a fully neutral target gives the quark-antiquark pairs
+    if quarks is None:
+        from . import catalog
+        quarks     = [ catalog.quarks[f] for f in 'udscbt' ]
+        antiquarks = [ catalog.quarks[f+'bar'] for f in 'udscbt' ]
+    quarks = tuple(quarks)
+    antiquarks = tuple(antiquarks) if antiquarks is not None else tuple( [ q.anti() for q in quarks ] )
+    for size, indexes in content_index(quarks, antiquarks, max_size):
+        found = [ index.query(**target) for index in indexes ]
+        found = [ table for table in found if len(table)>0 ]
+        if found:
+            if len(found)==1: return found[0]
+            return StateTable.from_states( [ s for table in found for s in table ], check=False )
+    return StateTable(quarks+antiquarks, np.empty((0,0), dtype=np.intp), check=False)
@@ -0,0 +1,200 @@
+# diagram geometry that does not need matplotlib: overlap layout, the
+# screen-space box index used for labels, limits and the hand-drawn grids
+import functools
+import itertools
+
+import numpy as np
+
+# unit offsets for up to four states sharing a site, indexed [n][rep]
+spread_patterns = {
+    1: [ ( 0,     0) ],
+    2: [ ( 1,     0), (-1,     0) ],
+    3: [ ( 0, 0.866), (-1,-0.866), ( 1,-0.866) ],
+    4: [ (-1,     1), ( 1,     1), (-1,    -1), ( 1,    -1) ],
+}
+
+# plot3d puts three states on a taller triangle, as it always has
+spread_patterns3d = { **spread_patterns, 3: [ ( 0,     1), (-1,    -1), ( 1,    -1) ] }
+
+def spread(coords, ring=8, patterns=spread_patterns):
+    # offsets, in units of the marker radius, that separate states sharing a site
+    # states are grouped by site with a hash map in a single pass keeping a
+    # counter per site (coords are hashable site keys, e.g. the exact integer
+    # quantum numbers of state.key), then the offsets are computed for all states at once:
+    # up to four use the fixed `patterns`, up to `ring` sit on a ring around
+    # the site and larger groups on a square lattice
+    sites = {}
+    site  = np.empty(len(coords), dtype=np.intp)
+    rep   = np.empty(len(coords), dtype=np.intp)
+    seen  = []
+    for i, c in enumerate(coords):
+        k = sites.setdefault(c, len(sites))
+        if k==len(seen): seen.append(0)
+        site[i] = k
+        rep[i]  = seen[k]
+        seen[k] += 1
+    n = np.array(seen, dtype=np.intp)[site] if len(coords)>0 else site
+
+    off = np.zeros( (len(coords), 2) )
+    for m, pattern in patterns.items():
+        sel = n==m
+        off[sel] = np.array(pattern)[rep[sel]]
+
+    # rings, spaced so that neighbouring markers just touch
+    sel = (n>len(patterns)) & (n<=ring)
+    ang = np.pi/2 + 2*np.pi*rep[sel]/n[sel]
+    off[sel] = np.column_stack( (np.cos(ang), np.sin(ang)) ) / np.sin(np.pi/n[sel])[:,None]
+
+    # lattices, centred on the site
+    sel  = n>max(ring, len(patterns))
+    cols = np.ceil( np.sqrt(n[sel]) ).astype(np.intp)
+    rows = -(-n[sel] // cols)
+    off[sel] = np.column_stack( (2*(rep[sel]%cols) - (cols-1), (rows-1) - 2*(rep[sel]//cols)) )
+
+    return off[:,0], off[:,1]
+
+def guides2d(xmin, xmax, ymin, hexc=(0,0)):
+    # the dashed strangeness and electric charge lines of a 2d diagram
+    lines = []
+    # strange lines
+    for s in np.linspace(-2,2,5):
+        lines.append( ((xmin, xmax), (s,s)) )
+
+    # isospin lines
+    #for i in np.linspace(-1,1,5):
+        #ax.plot( (i,i), (ymin,ymax), 'k--', lw=1 )
+
+    # electric charge lines
+    for q in np.linspace(-2,2,5):
+        lines.append( ((xmin+hexc[1]/2, q-ymin/2+hexc[1]/2), (2*q-2*xmin, ymin)) )
+    return lines
+
+@functools.lru_cache(maxsize=256)
+def layer_hulls(points):
+    # convex hull of every layer of a multiplet, cached per multiplet
+    # points is a sorted tuple of distinct integer (x, y, layer) sites, such as
+    # the (Iz, S, C) keys of its states in sixths, so the geometry is exact;
+    # returns ((layer, vertices), ...) by layer with the (k,2) vertices counter
+    # clockwise, a segment for collinear layers and one site for single ones
+    p = np.array(points, dtype=np.int64).reshape(-1,3)
+    if len(p)==0: return ()
+    p = p[ np.lexsort( (p[:,1], p[:,0], p[:,2]) ) ]
+    layers, first, count = np.unique( p[:,2], return_index=True, return_counts=True )
+
+    # every layer padded to m sites by repeating its first one, (L, m, 2)
+    m   = count.max()
+    pos = np.arange(m)
+    valid = pos[None,:] < count[:,None]
+    xy  = p[ first[:,None] + np.where(valid, pos[None,:], 0), :2 ]
+
+    # (i, j) is an edge of the hull when no site k lies right of i->j and the
+    # collinear ones lie between i and j, all layers and pairs at once
+    v     = xy[:,None,:,:] - xy[:,:,None,:]                   # (L, i, j, 2): site j - site i
+    d, r  = v[:,:,:,None,:], v[:,:,None,:,:]                  # i->j against i->k
+    cross = d[...,0]*r[...,1] - d[...,1]*r[...,0]
+    dot   = d[...,0]*r[...,0] + d[...,1]*r[...,1]
+    norm  = (v**2).sum(axis=3)[:,:,:,None]
+    ok    = (cross>0) | ( (cross==0) & (dot>=0) & (dot<=norm) )
+    edge  = ok.all(axis=3) & valid[:,:,None] & valid[:,None,:] & (norm[...,0]>0)
+    vert  = edge.any(axis=2) | (count[:,None]==1) & (pos[None,:]==0)
+
+    # hull vertices ordered by angle around their centroid
+    li, vi = np.nonzero(vert)
+    n      = np.bincount(li, minlength=len(layers))
+    ctr    = np.stack( [ np.bincount(li, xy[li,vi,c], len(layers)) for c in (0,1) ], axis=1 ) / n[:,None]
+    ang    = np.arctan2( xy[li,vi,1]-ctr[li,1], xy[li,vi,0]-ctr[li,0] )
+    order  = np.lexsort( (ang, li) )
+    verts  = np.split( xy[li,vi][order], np.cumsum(n)[:-1] )
+    return tuple( zip( layers.tolist(), verts ) )
+
+class BoxIndex():
+    # uniform grid over screen-space boxes (x0,y0,x1,y1) answering overlap queries
+    def __init__(self, cell):
+        self.cell  = float(cell)
+        self.cells = {}
+        self.boxes = []
+
+    def _span(self, box):
+        i0, j0, i1, j1 = np.floor( np.asarray(box)/self.cell ).astype(int)
+        return itertools.product( range(i0, i1+1), range(j0, j1+1) )
+
+    def add(self, box):
+        for key in self._span(box):
+            self.cells.setdefault(key, []).append( len(self.boxes) )
+        self.boxes.append(box)
+
+    def overlap(self, boxes):
+        # total overlap area of each query box with the stored boxes
+        boxes = np.asarray(boxes, dtype=float)
+        hull  = ( boxes[:,0].min(), boxes[:,1].min(), boxes[:,2].max(), boxes[:,3].max() )
+        near  = { k for key in self._span(hull) for k in self.cells.get(key, ()) }
+        if not near: return np.zeros(len(boxes))
+        other = np.array( [ self.boxes[k] for k in near ] )
+        w = np.minimum(boxes[:,None,2], other[None,:,2]) - np.maximum(boxes[:,None,0], other[None,:,0])
+        h = np.minimum(boxes[:,None,3], other[None,:,3]) - np.maximum(boxes[:,None,1], other[None,:,1])
+        return ( np.clip(w, 0, None) * np.clip(h, 0, None) ).sum(axis=1)
+
+def limit_ticks(limits, steps=(0.5,1,1)):
+    # tick positions for (lo, hi) limits, half units of Iz and whole units of the flavours
+    return [ np.arange(lo, hi+step/2, step) for (lo, hi), step in zip(limits, steps) ]
+
+def facet_limits(states, fields, steps=(0.5,1,1)):
+    # common (lo, hi) limits of some quantum numbers over a set of states
+    limits = []
+    for f, step in zip(fields, steps):
+        vals = [ getattr(s, f) for s in states ]
+        lo = np.floor( min(vals)/step ) * step
+        hi = np.ceil ( max(vals)/step ) * step
+        if hi-lo < step:
+            lo -= step
+            hi += step
+        limits.append( (lo, hi) )
+    return limits
+
+def scaffold3d(xlim, ylim, zlim, xticks, yticks, zticks, zlabel='Charmness, $C$'):
+    # the hand-drawn grid, axes and tick labels of a 3d diagram as plain data,
+    # lines as (xs, ys, zs, style) and texts as (x, y, z, s, style), so that
+    # panels sharing limits compute it once
+    lines = []
+    texts = []
+    # grid lines
+    xlf    = xlim[0]
+    xrt    = xlim[1]
+    ybk    = ylim[1]
+    yfr    = ylim[0]
+    zpt    = zlim[0]
+    for v in xticks:
+        lines.append( ((v,v), (ybk,ybk), zlim, dict(group='grid', lw=1, c='0.7', alpha=0.5)) )
+        lines.append( ((v,v), (yfr,yfr), zlim, dict(group='grid', lw=1, c='0.7', alpha=0.5, zorder=20)) )
+        for z in zticks:
+            lines.append( ((v,v), ylim, (z,z), dict(group='grid', lw=1, c='0.7', alpha=0.5)) )
+    for v in yticks:
+        for z in zticks:
+            lines.append( (xlim, (v,v), (z,z), dict(group='grid', lw=1, c='0.7', alpha=0.5)) )
+        if v==yticks[0] or v==yticks[-1]: continue
+        lines.append( ((xlf,xlf), (v,v), zlim, dict(group='grid', lw=1, c='0.7', alpha=0.5)) )
+        lines.append( ((xrt,xrt), (v,v), zlim, dict(group='grid', lw=1, c='0.7', alpha=0.5)) )
+    for v in zticks:
+        lines.append( (xlim, (yfr,yfr), (v,v), dict(group='grid', lw=1, c='0.7', alpha=0.5, zorder=20)) )
+
+    # x axis
+    lines.append( (xlim, (yfr,yfr), (zpt,zpt), dict(group='axes', c='k', ls='-', zorder=20)) )
+    for v in xticks:
+        lines.append( ((v,v), (yfr,yfr), (zpt,zpt-0.02), dict(group='ticks', c='k', ls='-')) )
+        texts.append( (v, yfr, zpt-0.05*(zlim[1]-zlim[0]), str(v), dict(ha='center', va='center')) )
+    texts.append( (xlim[0] + (xlim[1]-xlim[0])/2, yfr, zpt-0.13*(zlim[1]-zlim[0]), 'Isospin, $I_z$', dict(ha='center', va='center')) )
+    # y axis
+    lines.append( ((xrt,xrt), ylim, (zpt,zpt), dict(group='axes', c='k', ls='-')) )
+    for v in yticks:
+        lines.append( ((xrt,xrt+0.02), (v,v), (zpt,zpt), dict(group='ticks', c='k', ls='-')) )
+        texts.append( (xrt+0.05*(xlim[1]-xlim[0]), v, zpt, str(v), dict(ha='center', va='center')) )
+    texts.append( (xrt+0.13*(xlim[1]-xlim[0]), ylim[0] + (ylim[1]-ylim[0])/2, zpt, 'Strangeness, $S$', dict(ha='center', va='center', zdir='y')) )
+    # z axis
+    lines.append( ((xrt,xrt), (ybk,ybk), zlim, dict(group='axes', c='k', ls='-')) )
+    for v in zticks:
+        lines.append( ((xrt,xrt+0.02), (ybk,ybk), (v,v), dict(group='ticks', c='k', ls='-')) )
+        if v==zticks[0]: continue
+        texts.append( (xrt+0.05*(xlim[1]-xlim[0]), ybk, v, str(v), dict(ha='center', va='center')) )
+    texts.append( (xrt+0.13*(xlim[1]-xlim[0]), ybk, zlim[0] + (zlim[1]-zlim[0])/2, zlabel, dict(ha='center', va='center', zdir='z')) )
+
+    return lines, texts
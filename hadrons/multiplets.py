@@ -0,0 +1,176 @@
+# flavour SU(N) multiplets from first principles: the irreducible
+# representations in a product of quarks and antiquarks and their weight
+# diagrams, with the multiplicity of every site
+#
+#   decompose([u, d, s], 1, 1)       # the light mesons, 3 x 3bar -> 8 + 1
+#   decompose([u, d, s, c], 3)       # the charm baryons, 4 x 4 x 4 -> 20 (twice) + 20' + 4bar
+#
+# an irrep of SU(N) is a Young diagram with at most N rows; a quark is one box
+# and an antiquark a column of N-1 boxes, so the product is built by adding
+# boxes and columns with the Pieri rules, keeping full columns of N boxes (the
+# singlets) so that every diagram of a product has the same number of boxes
+# the weights of a diagram are the fillings of its boxes with the N flavours,
+# a weight mu (the number of boxes of each flavour) appears with the Kostka
+# multiplicity K(shape, mu), the number of semistandard tableaux of that shape
+# and content, which only depends on the sorted content and is memoized
+import functools
+import itertools
+
+import numpy as np
+
+from .core import columns, fraction, StateTable
+
+def add_box(shape, n):
+    # the diagrams of shape x (a quark), at most n rows
+    shape = tuple(shape) + (0,)*(n-len(shape))
+    for r in range(n):
+        if r==0 or shape[r-1]>shape[r]:
+            yield shape[:r] + (shape[r]+1,) + shape[r+1:]
+
+def add_column(shape, n, k):
+    # the diagrams of shape x (a column of k boxes), no two boxes in one row
+    shape = tuple(shape) + (0,)*(n-len(shape))
+    for rows in itertools.combinations(range(n), k):
+        new = list(shape)
+        for r in rows: new[r] += 1
+        if all( new[r-1]>=new[r] for r in range(1,n) ):
+            yield tuple(new)
+
+def reduced(shape, n):
+    # the diagram without its full columns of n boxes, padded to n-1 rows
+    shape = tuple(shape) + (0,)*(n-len(shape))
+    return tuple( [ x-shape[n-1] for x in shape[:n-1] ] )
+
+def dimension(shape, n):
+    # hook-content formula: the product over boxes of (n + column - row) / hook
+    shape = [ x for x in shape if x>0 ]
+    cols  = [ sum( [ 1 for x in shape if x>j ] ) for j in range(shape[0]) ] if shape else []
+    num = den = 1
+    for i, row in enumerate(shape):
+        for j in range(row):
+            num *= n + j - i
+            den *= (row-j-1) + (cols[j]-i-1) + 1
+    return num//den
+
+@functools.lru_cache(maxsize=None)
+def kostka(shape, content):
+    # number of semistandard tableaux of a shape filled with content[i] boxes
+    # of label i: the boxes with the last label form a horizontal strip, so
+    # sum over the shapes nu with shape/nu a horizontal strip of that size
+    shape = tuple( [ x for x in shape if x>0 ] )
+    if not content: return 1 if not shape else 0
+    if sum(shape)!=sum(content) or len(shape)>len(content): return 0
+    last, rest = content[-1], content[:-1]
+    # nu interlaces shape: shape[i] >= nu[i] >= shape[i+1]
+    lower  = shape[1:] + (0,)
+    ranges = [ range(lo, hi+1) for hi, lo in zip(shape, lower) ]
+    total  = 0
+    for nu in itertools.product(*ranges):
+        if sum(shape)-sum(nu)==last:
+            total += kostka(nu, rest)
+    return total
+
+@functools.lru_cache(maxsize=64)
+def compositions(boxes, n):
+    # every way to fill `boxes` boxes with n flavours, as a read-only (m, n) array
+    # of counts, by stars and bars
+    bars = np.array( list( itertools.combinations(range(boxes+n-1), n-1) ), dtype=np.intp ).reshape(-1, n-1)
+    edges = np.column_stack( ( np.full(len(bars), -1), bars, np.full(len(bars), boxes+n-1) ) )
+    comp  = np.diff(edges, axis=1) - 1
+    comp.setflags(write=False)
+    return comp
+
+def weights(shape, n):
+    # (contents, multiplicities) of all weights of a diagram, contents as an
+    # (m, n) array of flavour counts; the Kostka numbers are computed once per
+    # dominant (sorted) content and spread back to its permutations
+    comp = compositions( sum(shape), n )
+    dominant = -np.sort(-comp, axis=1)
+    uniq, inverse = np.unique(dominant, axis=0, return_inverse=True)
+    shape = tuple( [ x for x in shape if x>0 ] )
+    mult = np.array( [ kostka( shape, tuple( [ x for x in d if x>0 ] ) ) for d in uniq.tolist() ], dtype=np.int64 )
+    mult = mult[ inverse.reshape(-1) ]
+    keep = mult>0
+    return comp[keep], mult[keep]
+
+def label(shape, n, dim):
+    # the dimension, barred for the conjugate of a smaller diagram, e.g. '8', '10', '4bar'
+    shape = reduced(shape, n) + (0,)
+    conj  = tuple( [ shape[0]-x for x in reversed(shape) ] )
+    return str(dim) + ( 'bar' if (sum(shape), conj) > (sum(conj), shape) else '' )
+
+class irrep():
+    # one irreducible multiplet of a product: its diagram, dimension, how many
+    # times it occurs and its weight diagram, the (k, 8) exact quantum numbers
+    # of every distinct site in sixths (in the order of core.columns) with the
+    # multiplicity of each
+    def __init__(self, shape, n, count, quarks, antiquarks, nq, nqbar):
+        self.shape   = tuple(shape)
+        self.n       = n
+        self.count   = count
+        self.nq      = nq
+        self.nqbar   = nqbar
+        self.quarks  = list(quarks)
+        self.antiquarks = list(antiquarks)
+        self.dim     = dimension(shape, n)
+        self.name    = label(shape, n, self.dim)
+        self.contents, self.mult = weights(shape, n)
+        # a column of n boxes is a singlet, an antiquark the n-1 boxes
+        # left by removing a quark from one, so each antiquark shifts the
+        # weights by minus the sum of all the quarks
+        qn = np.array( [ q.qn for q in self.quarks ], dtype=np.int64 )
+        self.weights = self.contents @ qn - nqbar*qn.sum(axis=0)
+
+    def key(self, names=columns):
+        # exact quantum numbers of the sites in sixths, (k, len(names))
+        return self.weights[:, [ columns.index(f) for f in names ]]
+
+    def table(self):
+        # the multiplet as a StateTable ready for plot and plot3d, one row per
+        # state, so a site of multiplicity 2 (like Sigma0/Lambda0) gets two rows,
+        # each with a representative quark content of its weight
+        n     = self.n
+        table = self.quarks + self.antiquarks
+        rows  = []
+        for mu in self.contents.tolist():
+            a   = [ x-self.nqbar for x in mu ]
+            qs  = [ i for i in range(n) for _ in range(max(a[i],0)) ]
+            qbs = [ n+i for i in range(n) for _ in range(max(-a[i],0)) ]
+            # flavour neutral pairs of the first quark make up the rest
+            pad = self.nq - len(qs)
+            rows.append( qs + [0]*pad + qbs + [n]*pad )
+        content = np.repeat( np.array(rows, dtype=np.intp).reshape(len(rows), -1), self.mult, axis=0 )
+        titles  = [ '$'+''.join( [ table[j].title.strip('$') for j in row ] )+'$' for row in content ]
+        names   = [ self.name+':'+','.join( [ table[j].name for j in row ] ) for row in content ]
+        return StateTable( table, content, names, titles, check=False )
+
+    def __str__(self):
+        sites = ', '.join( [ '({:s})x{:d}'.format( ','.join( [ fraction(int(x)) for x in w ] ), int(m) )
+                             for w, m in zip(self.key(('Iz','S','C','Bt')), self.mult) ] )
+        return 'irrep({:s}{:s}, {:s})'.format( self.name, '' if self.count==1 else ' x{:d}'.format(self.count), sites )
+
+def decompose(quarks, nq, nqbar=0, antiquarks=None):
+    # the irreps of (quark)^nq x (antiquark)^nqbar under the flavour SU(N) of
+    # the N given quarks, largest first, e.g. decompose([u,d,s], 1, 1) gives
+    # the 8 and the 1 of the mesons
+    quarks = list(quarks)
+    n = len(quarks)
+    if n<2: raise ValueError('need at least two quark flavours')
+    if antiquarks is None: antiquarks = [ q.anti() for q in quarks ]
+    counts = { (0,)*n: 1 }
+    steps  = [ add_box ]*nq + [ lambda shape, n: add_column(shape, n, n-1) ]*nqbar
+    for step in steps:
+        new = {}
+        for shape, c in counts.items():
+            for s in step(shape, n):
+                new[s] = new.get(s, 0) + c
+        counts = new
+    irreps = [ irrep(shape, n, c, quarks, antiquarks, nq, nqbar) for shape, c in counts.items() ]
+    irreps.sort( key=lambda r: (-r.dim, r.shape) )
+    # distinct diagrams of the same dimension are told apart by primes, as the 20 and 20' of SU(4)
+    seen = {}
+    for r in irreps:
+        primes = seen.setdefault(r.name, [])
+        if r.shape not in primes: primes.append(r.shape)
+        r.name += "'"*primes.index(r.shape)
+    return irreps
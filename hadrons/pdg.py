@@ -0,0 +1,125 @@
+# bulk loader for the PDG mass and width table (the mass_width_YYYY.mcd text file)
+#
+# the file is streamed line by line, every hadron is mapped from its Monte Carlo
+# ID to a quark content and the result kept as a structured numpy array next to
+# the file, which later loads memory-mapped without parsing anything
+#
+# line format: up to four IDs in columns 1-32 (eight each), then mass with its errors,
+# width with its errors (missing for stable particles), the name and one
+# charge per ID, e.g.
+#       211                          1.39570390E-01 +1.8E-07 -1.8E-07 2.5284E-17 +5.0E-21 -5.0E-21 pi             +
+import glob
+import os
+
+import numpy as np
+
+from .core import StateTable
+
+# bump when the layout of the cached array changes
+version = 1
+
+record = np.dtype([
+    ('pdgid'  , np.int32),
+    ('name'   , 'U24'),
+    ('charge' , np.int8),
+    ('content', np.int8, 3),    # signed PDG quark codes, negative for antiquarks, 0 for none
+    ('mass'   , np.float64),    # GeV
+    ('width'  , np.float64),    # GeV
+])
+
+charges = { '--': -2, '-': -1, '0': 0, '+': 1, '++': 2 }
+
+# electric charge of the PDG quark codes 1..6 (d u s c b t) in thirds
+quark_charge = [ 0, -1, 2, -1, 2, -1, 2 ]
+
+def pdg_content(pdgid):
+    # signed quark codes of a hadron from the digits of its ID, n nr nL nq1 nq2 nq3 nJ,
+    # or None for anything that is not a meson or baryon with a well defined content
+    a = abs(pdgid)
+    if a>=1000000000: return None                  # nuclei
+    nJ, nq3, nq2, nq1 = a%10, a//10%10, a//100%10, a//1000%10
+    if nJ==0 or nq3==0 or nq2==0: return None        # quarks, leptons, bosons, K0L/K0S, diquarks
+    if nq1==0:
+        # meson: the heavier quark is nq2, an up type one (even code) is the quark
+        # and a down type one is the antiquark, e.g. 211 = (u,dbar) and 321 = (u,sbar)
+        content = (nq2, -nq3) if nq2%2==0 else (nq3, -nq2)
+    else:
+        content = (nq1, nq2, nq3)
+    if pdgid<0: content = tuple( [ -q for q in content ] )
+    return content
+
+def content_charge(content):
+    thirds = sum( [ quark_charge[abs(q)] * (1 if q>0 else -1) for q in content ] )
+    return thirds//3 if thirds%3==0 else None
+
+def antiname(name, content, charge):
+    # charged mesons conjugate to the opposite charge (pi+ -> pi-), everything
+    # else follows the PDG convention of a ~ (K0 -> K~0, p+ -> p~-)
+    opposite = { v: k for k, v in charges.items() }[-charge]
+    if len(content)==2 and charge!=0: return name+opposite
+    return name+'~'+opposite
+
+def read_mcd(path):
+    # stream the hadrons of an .mcd file as record tuples, the antiparticles
+    # that are not listed in the file are added after their particles
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            if line.startswith('*') or not line.strip(): continue
+            ids    = [ int(x) for x in line[:33].split() ]
+            tokens = line[33:].split()
+            if not ids or len(tokens)<3: continue
+            name, charge = tokens[-2], tokens[-1].split(',')
+            values = [ float(x) for x in tokens[:-2] ]
+            mass   = values[0]
+            width  = values[3] if len(values)>3 else 0.0
+            if len(charge)!=len(ids):
+                raise ValueError('{:s}:{:d}: {:d} IDs but {:d} charges'.format(path, number, len(ids), len(charge)))
+
+            for pdgid, c in zip(ids, charge):
+                content = pdg_content(pdgid)
+                if content is None: continue
+                q = charges[c]
+                if content_charge(content)!=q:
+                    raise ValueError('{:s}:{:d}: charge {:s} of {:d} does not match its quark content'.format(path, number, c, pdgid))
+                label = name+c
+                yield (pdgid, label, q, content+(0,)*(3-len(content)), mass, width)
+                if sorted(content)!=sorted( [ -x for x in content ] ):
+                    anti = tuple( [ -x for x in content ] )
+                    yield (-pdgid, antiname(name, content, q), -q, anti+(0,)*(3-len(anti)), mass, width)
+
+def cache_name(path):
+    # the cache is tied to the size and modification time of the source file
+    st = os.stat(path)
+    return '{:s}.{:d}-{:d}-v{:d}.npy'.format(path, st.st_size, st.st_mtime_ns, version)
+
+def load_records(path, cache=True):
+    # structured array of every hadron in the file, memory-mapped from the cache when it exists
+    name = cache_name(path)
+    if cache and os.path.exists(name):
+        return np.load(name, mmap_mode='r')
+    records = np.fromiter( read_mcd(path), dtype=record )
+    if cache:
+        tmp = name+'.tmp'
+        with open(tmp, 'wb') as f:
+            np.save(f, records)
+        os.replace(tmp, name)
+        for old in glob.glob( glob.escape(path)+'.*-v*.npy' ):
+            if old!=name: os.remove(old)
+    return records
+
+def load_mcd(path, quarks=None, cache=True):
+    # the hadrons of an .mcd file as a StateTable over the catalog quarks,
+    # with the pdgid, mass and width of every row in table.data
+    if quarks is None:
+        from . import catalog
+        quarks = catalog.quarks
+    order = 'duscbt'
+    table = [ quarks[f] for f in order ] + [ quarks[f+'bar'] for f in order ]
+    # signed quark code + 6 -> index into table, -1 pads the missing third quark
+    codes = np.array( [ 5+f for f in range(6,0,-1) ] + [ -1 ] + list(range(6)), dtype=np.intp )
+
+    records = load_records(path, cache)
+    content = codes[ records['content'].astype(np.intp) + 6 ]
+    names   = records['name'].astype(object)
+    data    = { f: np.asarray(records[f]) for f in ('pdgid', 'mass', 'width') }
+    return StateTable(table, content, names, names, check=False, data=data)
@@ -0,0 +1,527 @@
+# drawing the isospin diagrams with matplotlib
+#
+# artists that depend on the states are labelled for hadrons.blit, which draws
+# them over a cached background: '_state:<i>' for those of the i-th state,
+# '_states' for one artist holding every state in order ('_states:<rows>' in
+# facet panels, which relabel to rows of the whole figure) and '_state' for the
+# rest (outlines computed from the states); underscore labels stay out of legends
+import collections
+import functools
+import threading
+
+import matplotlib.pyplot as plt
+import mpl_toolkits.mplot3d as mpl3
+from mpl_toolkits.mplot3d import proj3d
+from matplotlib import cbook
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.mathtext import MathTextParser
+from matplotlib.textpath import text_to_path
+from matplotlib.transforms import offset_copy
+import numpy as np
+
+from .core import fraction, units
+from .stages import stage
+from .layout import spread, spread_patterns3d, guides2d, BoxIndex, limit_ticks, facet_limits, scaffold3d, layer_hulls
+
+class LineBatch():
+    # collects the lines of a diagram and draws them either as one artist per
+    # line (batch=False) or one artist per group and style (batch=True):
+    # a LineCollection in 2d, and in 3d a single nan-separated Line3D because
+    # Axes3D overwrites the zorder of collections with its depth sort
+    collection_style = { 'c': 'colors', 'color': 'colors', 'ls': 'linestyles', 'lw': 'linewidths' }
+
+    def __init__(self, ax, batch=False):
+        self.ax     = ax
+        self.batch  = batch
+        self.groups = {}
+
+    def plot(self, *xyz, group='lines', **style):
+        if not self.batch:
+            return self.ax.plot(*xyz, **style)
+        key = (group, len(xyz)) + tuple(sorted(style.items()))
+        self.groups.setdefault(key, []).append( np.column_stack( [ np.asarray(v, dtype=float) for v in xyz ] ) )
+
+    def draw(self):
+        for key, segs in self.groups.items():
+            style = dict(key[2:])
+            if key[1]==3:
+                gap = np.full( (1,3), np.nan )
+                pts = np.concatenate( [ p for seg in segs for p in (seg, gap) ][:-1] )
+                self.ax.plot( pts[:,0], pts[:,1], pts[:,2], **style )
+            else:
+                col = LineCollection( segs, **{ self.collection_style.get(k,k): v for k, v in style.items() } )
+                self.ax.add_collection(col, autolim=False)
+        self.groups = {}
+
+def plot(states, ax=None, rad=0.15, hexc=(0,0), hexr=1, tri=None, batch=False, limits=None, guides=None, hulls=False):
+
+    ax = ax or plt.gca()
+    lines = LineBatch(ax, batch)
+
+    # min, max
+    if limits is None:
+        ymin = min( [state.S for state in states] )
+        ymax = max( [state.S for state in states] )
+
+        xmin = min( [state.Iz for state in states] )
+        xmax = max( [state.Iz for state in states] )
+    else:
+        (xmin, xmax), (ymin, ymax) = limits
+
+    # axis set up
+    ax.set_xticks( np.linspace(xmin,xmax,5) )
+    ax.tick_params(axis='x', labelsize=14)
+    ax.set_xlabel('Isospin, $I_z$', fontsize=14)
+    ax.tick_params(axis='y', which='major', labelsize=14)
+    ax.set_ylabel('Strangeness, $S$', fontsize=14)
+
+    # buffer
+    buff = 0.2
+    xmin -= buff
+    xmax += buff
+    ymin -= buff
+    ymax += buff
+
+    # strangeness and charge lines
+    if guides is None:
+        guides = guides2d(xmin, xmax, ymin, hexc)
+    for xs, ys in guides:
+        lines.plot( xs, ys, group='guides', c='k', ls='--', lw=1 )
+
+    # draw the hexes
+    if hexr is not None:
+        hx = np.array([ -hexr, -hexr/2, hexr/2, hexr,    hexr/2, -hexr/2, -hexr ])
+        hy = np.array([         0,    hexr    , hexr    ,        0, -hexr    , -hexr    ,         0 ])
+        hx += hexc[0]
+        hy += hexc[1]
+        lines.plot( hx, hy, group='outline', c='r', ls='-', lw=3 )
+
+    # draw the triangle
+    if tri is not None:
+        lines.plot( tri[0], tri[1], group='outline', c='r', ls='-', lw=3 )
+
+    # or the outline of the states themselves
+    if hulls:
+        for _, vtxs in state_hulls(states, ('Iz','S')):
+            if len(vtxs)<2: continue
+            closed = np.concatenate( (vtxs, vtxs[:1]) )
+            lines.plot( closed[:,0], closed[:,1], group='hulls', c='r', ls='-', lw=3, label='_state' )
+    lines.draw()
+
+    # draw the states, spreading out any that share a site
+    x = np.array( [ state.Iz for state in states ], dtype=float )
+    y = np.array( [ state.S  for state in states ], dtype=float )
+    with stage('layout'):
+        dx, dy = spread( [ state.key(('Iz','S')) for state in states ] )
+    x += dx*rad
+    y += dy*rad
+
+    if batch:
+        circ = EllipseCollection( 0.3, 0.3, 0, units='xy', offsets=np.column_stack((x,y)), offset_transform=ax.transData,
+                                  edgecolors='r', facecolors='lightblue', linewidths=3, zorder=10, label='_states' )
+        ax.add_collection(circ, autolim=False)
+
+    for i, state in enumerate(states):
+        if not batch:
+            circ = plt.Circle( (x[i],y[i]), 0.15, ec='r', fc='lightblue', lw=3, zorder=10, label='_state:'+str(i) )
+            ax.add_patch(circ)
+        if state.title!='':
+            ax.text( x[i], y[i], state.title, ha='center', va='center', fontsize=16, zorder=20, label='_state:'+str(i) )
+
+    #ax.axis('off')
+    ax.set_xlim(xmin,xmax)
+    ax.set_ylim(ymin,ymax)
+    #ax.set_aspect('equal')#,'box')
+
+class MathtextCache():
+    # process-wide, size-bounded LRU of parsed and laid-out mathtext
+    # matplotlib memoizes MathTextParser._parse_cached per parser instance and
+    # every renderer owns its parser, so nothing is reused between figures;
+    # this replaces it with one cache keyed on the output type, string, dpi and
+    # font properties (which carry the font size)
+    # the layout itself depends on the dpi (and the output type and hinting),
+    # so Agg draws at the figure dpi never share entries with pdf or svg
+    # exports at 72 dpi, which share theirs with each other; hits and misses
+    # are counted per output type and dpi, e.g. 'vector@100'
+    def __init__(self, maxsize=2048):
+        self.maxsize = maxsize
+        self.entries = collections.OrderedDict()
+        self.lock    = threading.Lock()
+        self.counts  = {}
+        self.parse   = None
+
+    hits   = property( lambda self: sum( [ c[0] for c in self.counts.values() ] ) )
+    misses = property( lambda self: sum( [ c[1] for c in self.counts.values() ] ) )
+
+    def install(self):
+        # swap the cache in for the per-parser one, a no-op if matplotlib's
+        # internals are not what we expect
+        cached = getattr(MathTextParser, '_parse_cached', None)
+        parse  = getattr(cached, '__wrapped__', None)
+        if parse is None or self.parse is not None: return self
+        self.parse = parse
+        cache = self
+        def _parse_cached(parser, *args):
+            return cache.lookup(parser, *args)
+        MathTextParser._parse_cached = _parse_cached
+        return self
+
+    def lookup(self, parser, *args):
+        key = (parser._output_type,) + args
+        with self.lock:
+            counts = self.counts.setdefault( '{:s}@{:g}'.format(parser._output_type, args[1]), [0, 0] )
+            if key in self.entries:
+                counts[0] += 1
+                self.entries.move_to_end(key)
+                return self.entries[key]
+            counts[1] += 1
+        with stage('mathtext'):
+            value = self.parse(parser, *args)
+        with self.lock:
+            self.entries[key] = value
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.counts.clear()
+
+    def snapshot(self):
+        with self.lock:
+            return { out: tuple(c) for out, c in self.counts.items() }
+
+    def counts_since(self, snapshot):
+        # hits and misses per output type and dpi since a snapshot(), so that
+        # worker processes can report what their builds did to the parent
+        with self.lock:
+            since = { out: ( c[0]-snapshot.get(out, (0, 0))[0], c[1]-snapshot.get(out, (0, 0))[1] ) for out, c in self.counts.items() }
+        return { out: dict( hits=c[0], misses=c[1] ) for out, c in sorted( since.items() ) if c!=(0, 0) }
+
+    def info(self):
+        with self.lock:
+            outputs = { out: dict( hits=c[0], misses=c[1] ) for out, c in sorted( self.counts.items() ) }
+        return dict( hits=self.hits, misses=self.misses, outputs=outputs, size=len(self.entries), maxsize=self.maxsize )
+
+mathtext_cache = MathtextCache().install()
+
+@functools.lru_cache(maxsize=4096)
+def text_extent(s, fontsize):
+    # width, height and descent of a (math)text label in points, renderer independent
+    return text_to_path.get_text_width_height_descent( s, FontProperties(size=fontsize), ismath=cbook.is_math_text(s) )
+
+# candidate label directions around an anchor, in order of preference
+label_dirs = np.array( [ (1,0), (-1,0), (0,1), (0,-1), (1,1), (1,-1), (-1,1), (-1,-1) ], dtype=float )
+
+def text_boxes(ax):
+    # screen-space boxes, in points, of the texts already in a 3d axes
+    texts = ax.texts
+    if not texts: return np.zeros((0,4))
+    xyz   = np.array( [ t.get_position_3d() for t in texts ], dtype=float )
+    xs, ys, _ = proj3d.proj_transform( xyz[:,0], xyz[:,1], xyz[:,2], ax.get_proj() )
+    pts   = ax.transData.transform( np.column_stack((xs, ys)) ) * 72/ax.figure.dpi
+    sizes = np.array( [ text_extent(t.get_text(), t.get_fontsize())[:2] for t in texts ] )
+    # shift by the alignment, rotated labels are approximated by their unrotated box
+    fx = np.array( [ {'left':0, 'center':0.5, 'right':1}[t.get_horizontalalignment()] for t in texts ] )
+    fy = np.array( [ {'bottom':0, 'baseline':0, 'center':0.5, 'center_baseline':0.5, 'top':1}[t.get_verticalalignment()] for t in texts ] )
+    x0 = pts[:,0] - fx*sizes[:,0]
+    y0 = pts[:,1] - fy*sizes[:,1]
+    return np.column_stack( (x0, y0, x0+sizes[:,0], y0+sizes[:,1]) )
+
+def place_labels(ax, xyz, sizes, marker=3, gap=2, rings=(1,3), obstacles=()):
+    # pick an offset, in points, for each label so that labels avoid each
+    # other and the state markers in screen space
+    # xyz (n,3) are the 3d anchors and sizes (n,2) the label width and height
+    # in points; anchors are projected through the current view, every label
+    # gets candidate boxes around its anchor (all scored at once against a grid
+    # index of markers, `obstacles` and labels placed so far) and the cheapest
+    # is kept
+    xyz   = np.asarray(xyz, dtype=float).reshape(-1,3)
+    sizes = np.asarray(sizes, dtype=float).reshape(-1,2)
+    if len(xyz)==0: return np.zeros((0,2))
+
+    xs, ys, _ = proj3d.proj_transform( xyz[:,0], xyz[:,1], xyz[:,2], ax.get_proj() )
+    pts = ax.transData.transform( np.column_stack((xs, ys)) ) * 72/ax.figure.dpi
+
+    # candidate offsets of the label centres (n, k, 2), with the box edge
+    # `gap` points beyond the marker in each direction
+    dirs = np.concatenate( [ label_dirs*r for r in rings ] )
+    offs = dirs[None,:,:] * (marker + gap + sizes[:,None,:]/2)
+    offs[:,:,0] = np.where(dirs[None,:,0]==0, 0, offs[:,:,0])
+    offs[:,:,1] = np.where(dirs[None,:,1]==0, 0, offs[:,:,1])
+    ctr  = pts[:,None,:] + offs
+    half = np.broadcast_to( sizes[:,None,:]/2, ctr.shape )
+    cand = np.concatenate( (ctr-half, ctr+half), axis=2 )
+
+    # boxes leaving the axes are penalised by the area outside
+    bx0, by0, bx1, by1 = ax.bbox.extents * 72/ax.figure.dpi
+    area   = (cand[:,:,2]-cand[:,:,0]) * (cand[:,:,3]-cand[:,:,1])
+    inside = ( np.clip(np.minimum(cand[:,:,2], bx1) - np.maximum(cand[:,:,0], bx0), 0, None) *
+               np.clip(np.minimum(cand[:,:,3], by1) - np.maximum(cand[:,:,1], by0), 0, None) )
+    cost0  = 10*(area-inside) + 1e-3*np.arange(len(dirs))[None,:]
+
+    index = BoxIndex( max(sizes.max(), 2*marker, 1) )
+    for p in np.unique(pts, axis=0):
+        index.add( (p[0]-marker, p[1]-marker, p[0]+marker, p[1]+marker) )
+    for box in obstacles:
+        index.add( tuple(box) )
+
+    chosen = np.empty( (len(xyz),2) )
+    for i in range(len(xyz)):
+        k = np.argmin( cost0[i] + index.overlap(cand[i]) )
+        index.add( tuple(cand[i,k]) )
+        chosen[i] = offs[i,k]
+    return chosen
+
+def hex3d( hexc=(0,0), hexr=1, z=0 ):
+
+    hx = np.array([ -hexr, -hexr/2, hexr/2, hexr,    hexr/2, -hexr/2 ])
+    hy = np.array([         0,    hexr    , hexr    ,        0, -hexr    , -hexr     ])
+    hx += hexc[0]
+    hy += hexc[1]
+    hz = np.full_like(hx,z)
+
+    vtxs = np.column_stack( (hx,hy,hz) )
+
+    return mpl3.art3d.Poly3DCollection( [vtxs] )
+
+def tri3d( v1=(-0.5,-1), v2=(0,1), v3=(0.5,-1), z=1 ):
+
+    hx = np.array( [v1[0],v2[0],v3[0]] )
+    hy = np.array( [v1[1],v2[1],v3[1]] )
+    hz = np.full_like(hx,z)
+
+    vtxs = np.column_stack( (hx,hy,hz) )
+
+    return mpl3.art3d.Poly3DCollection( [vtxs] )
+
+def state_hulls(states, fields=('Iz','S','C')):
+    # convex outlines of the sites of a set of states, one per value of
+    # fields[2] (a single one when only two fields are given), as
+    # [(layer, (k,2) vertices)] in real units
+    sites = { s.key(fields) + ( (0,) if len(fields)==2 else () ) for s in states }
+    return [ (layer/units, vtxs/units) for layer, vtxs in layer_hulls( tuple(sorted(sites)) ) ]
+
+def hulls3d(states, layer='C'):
+    # the outlines of every layer of the states as one Poly3DCollection, with
+    # the layer value as z, or None when no layer has more than one site
+    polys = [ np.column_stack( (vtxs, np.full(len(vtxs), z)) ) for z, vtxs in state_hulls(states, ('Iz','S',layer)) if len(vtxs)>1 ]
+    if not polys: return None
+    return mpl3.art3d.Poly3DCollection(polys)
+
+def relabel_states(ax, rows):
+    # turn the state labels of a panel into rows of the whole figure
+    for a in ax.findobj():
+        label = a.get_label()
+        if not isinstance(label, str): continue
+        if label.startswith('_state:'):
+            a.set_label( '_state:'+str( rows[ int(label[7:]) ] ) )
+        elif label=='_states':
+            a.set_label( '_states:'+','.join( map(str, rows) ) )
+
+# how facet values are labelled
+facet_labels = { 'Q': 'Q', 'B': 'B', 'Iz': 'I_z', 'S': 'S', 'C': 'C', 'Bt': "B'", 'T': 'T' }
+
+def plot_facets(states, by='Bt', panel='plot3d', fig=None, ncols=3, panel_size=None, **kwargs):
+    # small multiples: one plot3d (or plot) panel per value of `by`, a field
+    # name or a tuple of them such as ('C','Bt'), in a single figure
+    # the panels share their limits and the grid/guide geometry, which is
+    # computed once instead of once per panel
+    by     = (by,) if isinstance(by, str) else tuple(by)
+    groups = {}
+    rows   = {}
+    for i, s in enumerate(states):
+        groups.setdefault( s.key(by), [] ).append(s)
+        rows.setdefault( s.key(by), [] ).append(i)
+    keys  = sorted(groups)
+    ncols = max( min(ncols, len(keys)), 1 )
+    nrows = -(-len(keys) // ncols)
+    if fig is None:
+        w, h = panel_size or ( (7,6) if panel=='plot3d' else (6,6) )
+        fig = plt.figure( figsize=(w*ncols, h*nrows) )
+
+    if panel=='plot3d':
+        limits   = facet_limits(states, ('Iz','S','C'))
+        scaffold = scaffold3d( *limits, *limit_ticks(limits) )
+        kwargs   = dict( dict(mes=None, bar=None), **kwargs )
+    else:
+        limits   = facet_limits(states, ('Iz','S'))
+        guides   = guides2d( limits[0][0]-0.2, limits[0][1]+0.2, limits[1][0]-0.2, kwargs.get('hexc',(0,0)) )
+        kwargs   = dict( dict(hexr=None), **kwargs )
+
+    axes = []
+    for k, key in enumerate(keys):
+        if panel=='plot3d':
+            ax = fig.add_subplot(nrows, ncols, k+1, projection='3d')
+            plot3d( groups[key], ax=ax, limits=limits, scaffold=scaffold, **kwargs )
+        else:
+            ax = fig.add_subplot(nrows, ncols, k+1)
+            plot( groups[key], ax=ax, limits=limits, guides=guides, **kwargs )
+        ax.set_title( ', '.join( [ '${:s} = {:s}$'.format(facet_labels[f], fraction(v)) for f, v in zip(by, key) ] ), fontsize=14 )
+        relabel_states( ax, rows[key] )
+        axes.append(ax)
+    return fig, axes
+
+def plot3d(states=None, ax=None, mes=0, bar=None, content=True, labels='auto', view=(18,-84), batch=False,
+           limits=None, scaffold=None, hulls=False):
+
+    ax = ax or plt.gca()
+    lines = LineBatch(ax, batch)
+
+    if mes is not None:
+        # hex
+        shape = hex3d()
+        shape.set_color('lightblue')
+        ax.add_collection(shape)
+
+        # tri
+        tri1 = tri3d( (-0.5,0), (0, 1), (0.5,0), z= 1 )
+        tri2 = tri3d( (-0.5,0), (0,-1), (0.5,0), z=-1 )
+        tri1.set_color('lightblue')
+        tri2.set_color('lightblue')
+        ax.add_collection(tri1)
+        ax.add_collection(tri2)
+
+        # lines
+        lines.plot( (-0.5,-1    ,-0.5), (0, 0, 0), (1,0,-1), group='edges', c='k', ls='-', lw=1 )
+        lines.plot( ( 0.5, 1    , 0.5), (0, 0, 0), (1,0,-1), group='edges', c='k', ls='-', lw=1 )
+        lines.plot( ( 0    ,-0.5,-0.5), (1, 1, 0), (1,0,-1), group='edges', c='k', ls='-', lw=1 )
+        lines.plot( ( 0    , 0.5, 0.5), (1, 1, 0), (1,0,-1), group='edges', c='k', ls='-', lw=1 )
+        lines.plot( (-0.5,-0.5, 0    ), (0,-1,-1), (1,0,-1), group='edges', c='k', ls='-', lw=1, zorder=50 )
+        lines.plot( ( 0.5, 0.5, 0    ), (0,-1,-1), (1,0,-1), group='edges', c='k', ls='-', lw=1, zorder=50 )
+
+    if bar is not None:
+        if bar==0:
+            # hex
+            shape = hex3d( hexc=(0,-1), hexr=1, z=0 )
+            shape.set_color('lightblue')
+            ax.add_collection(shape)
+            # tri
+            tri1 = tri3d( (0,-2), (-    1,0), (    1,0), z= 1 )
+            tri2 = tri3d( (0,-1), (-0.5,0), (0.5,0), z= 2 )
+            tri1.set_color('lightblue')
+            tri2.set_color('lightblue')
+            ax.add_collection(tri1)
+            ax.add_collection(tri2)
+            # lines
+            lines.plot( (-0.5, -1, -1), (0,0,-1), (2,1,0), group='edges', c='k', ls='-', lw=1, zorder=10 )
+            lines.plot( (-1,-0.5), (0,0), (1,0), group='edges', c='k', ls='-', lw=1, zorder=10 )
+            lines.plot( (0.5, 1, 1), (0,0,-1), (2,1,0), group='edges', c='k', ls='-', lw=1, zorder=10 )
+            lines.plot( (1,0.5), (0,0), (1,0), group='edges', c='k', ls='-', lw=1, zorder=10 )
+            lines.plot( (0,0,-0.5), (-1,-2,-2),(2,1,0), group='edges', c='k', ls='-', lw=1,zorder=10)
+            lines.plot( (0,0.5),(-2,-2),(1,0), group='edges', c='k', ls='-', lw=1,zorder=10)
+
+
+        if bar==1:
+            # tri
+            tri1 = tri3d( (0,-3), (-1.5,0), (1.5,0), z= 0 )
+            tri2 = tri3d( (0,-2), (-1    ,0), (1    ,0), z= 1 )
+            tri3 = tri3d( (0,-1), (-0.5,0), (0.5,0), z= 2 )
+            tri1.set_color('lightblue')
+            tri2.set_color('lightblue')
+            tri3.set_color('lightblue')
+            tri1.set_edgecolor('k')
+            tri2.set_edgecolor('k')
+            tri3.set_edgecolor('k')
+            ax.add_collection(tri1)
+            ax.add_collection(tri2)
+            ax.add_collection(tri3)
+            # lines
+            lines.plot( (0, 0    ), (0,-3), (3,0), group='edges', c='k', ls='-', lw=1, zorder=10 )
+            lines.plot( (0,-1.5), (0, 0), (3,0), group='edges', c='k', ls='-', lw=1, zorder=10 )
+            lines.plot( (0, 1.5), (0, 0), (3,0), group='edges', c='k', ls='-', lw=1, zorder=10 )
+
+    # outlines from the states, for any multiplet
+    if hulls:
+        shape = hulls3d(states)
+        if shape is not None:
+            shape.set_color('lightblue')
+            shape.set_edgecolor('k')
+            shape.set_label('_state')
+            ax.add_collection(shape)
+
+    # add states
+    #x = [ state.Iz for state in states ]
+    #y = [ state.S    for state in states ]
+    #z = [ state.C    for state in states ]
+    rad = 0.025
+    ysc = 5
+    xps = np.array( [ state.Iz for state in states ], dtype=float )
+    yps = np.array( [ state.S  for state in states ], dtype=float )
+    zps = np.array( [ state.C  for state in states ], dtype=float )
+    with stage('layout'):
+        dx, dy = spread( [ state.key(('Iz','S','C')) for state in states ], patterns=spread_patterns3d )
+    xps += dx*rad
+    yps += dy*rad*ysc
+
+    ax.plot( xps, yps, zps, 'ko', zorder=20, label='_states' )
+
+    # axes
+    ax.set_xlabel('Isospin, $I_z$', fontsize=12)
+    ax.set_ylabel('Strangeness, $S$', fontsize=12)
+    ax.set_zlabel('Charmness, $D$', fontsize=12)
+    if mes is not None:
+        ax.margins(x=0,y=0,z=0)
+        ax.set_xlim(-1,1)
+        ax.set_ylim(-1,1)
+        ax.set_zlim(-1,1)
+        ax.set_xticks( np.linspace(-1,1,5) )
+        ax.set_yticks( np.linspace(-1,1,3) )
+        ax.set_zticks( np.linspace(-1,1,3) )
+    if bar is not None:
+        if bar == 0:
+            ax.set_xlim(-1,1)
+            ax.set_ylim(-2,0)
+            ax.set_zlim(-0,2)
+            ax.set_xticks( np.linspace(-1,1,5) )
+            ax.set_yticks( np.linspace(-2,0,3) )
+            ax.set_zticks( np.linspace( 0,2,3) )
+        if bar == 1:
+            ax.set_xlim(-1.5,1.5)
+            ax.set_ylim(-3,0)
+            ax.set_zlim(-0,3)
+            ax.set_xticks( np.linspace(-1.5,1.5,7) )
+            ax.set_yticks( np.linspace(-3,0,4) )
+            ax.set_zticks( np.linspace( 0,3,4) )
+    if limits is not None:
+        for lim, ticks, set_lim, set_ticks in zip( limits, limit_ticks(limits), (ax.set_xlim, ax.set_ylim, ax.set_zlim), (ax.set_xticks, ax.set_yticks, ax.set_zticks) ):
+            set_lim(*lim)
+            set_ticks(ticks)
+
+    ax.view_init(elev=view[0],azim=view[1])
+
+    # make the panes transparent
+    ax.xaxis.set_pane_color((1.0, 1.0, 1.0, 0.0))
+    ax.yaxis.set_pane_color((1.0, 1.0, 1.0, 0.0))
+    ax.zaxis.set_pane_color((1.0, 1.0, 1.0, 0.0))
+    # make the grid lines transparent
+    ax.xaxis._axinfo["grid"]['color'] =    (1,1,1,0)
+    ax.yaxis._axinfo["grid"]['color'] =    (1,1,1,0)
+    ax.zaxis._axinfo["grid"]['color'] =    (1,1,1,0)
+    # draw grid lines and axes by hand because matplotlib adds a buffer
+    with stage('grid'):
+        if scaffold is None:
+            scaffold = scaffold3d( ax.get_xlim(), ax.get_ylim(), ax.get_zlim(), ax.get_xticks(), ax.get_yticks(), ax.get_zticks() )
+        for xs, ys, zs, style in scaffold[0]:
+            lines.plot( xs, ys, zs, **style )
+        for x, y, z, s, style in scaffold[1]:
+            ax.text( x, y, z, s, **style )
+        lines.draw()
+
+    # state labels, placed in screen space for the current view
+    if labels=='auto':
+        with stage('labels'):
+            texts = [ (i, state.title, 14) for i, state in enumerate(states) if state.title!='' ]
+            if content:
+                texts += [ (i, ''.join( [q.title for q in state.quarks] ), 8) for i, state in enumerate(states) ]
+            rows  = [ i for i, s, fs in texts ]
+            xyz   = np.column_stack( (xps[rows], yps[rows], zps[rows]) )
+            sizes = np.array( [ text_extent(s, fs)[:2] for i, s, fs in texts ] ).reshape(-1,2)
+            offs  = place_labels(ax, xyz, sizes, obstacles=text_boxes(ax))
+            for (i, s, fs), (ox, oy) in zip(texts, offs):
+                ax.text( xps[i], yps[i], zps[i], s, ha='center', va='center', zorder=20, fontsize=fs, label='_state:'+str(i),
+                         transform=offset_copy(ax.transData, fig=ax.figure, x=ox, y=oy, units='points') )
+
+    ax.axis('off')
@@ -0,0 +1,90 @@
+# conservation checks over large batches of candidate processes
+#
+#   initial, final = processes(catalog.hadron_table, [ (['Dp'], ['Kzb', 'pip']), (['p'], ['pip', 'piz']) ])
+#   c = conserve(catalog.hadron_table, initial, final, weak=True)
+#   c.allowed, c.weak, c.violated, c.delta('S')
+#
+# a batch is two padded (n, k) arrays of row indices into a StateTable, -1 for
+# no state, and every check is one gather and sum over all processes: the -1
+# padding picks a zero row appended to the quantum numbers, as in StateTable
+import numpy as np
+
+from .core import columns, units
+
+# quantum numbers that the strong and electromagnetic interactions conserve
+conserved = ('Q', 'B', 'S', 'C', 'Bt', 'T')
+flavours  = ('S', 'C', 'Bt', 'T')
+
+def processes(table, entries):
+    # padded (n, ki) and (n, kf) row index arrays of (initial names, final names) pairs
+    rows = { name: i for i, name in enumerate(table.names) }
+    entries = list(entries)
+    ki = max( [ len(e[0]) for e in entries ], default=0 )
+    kf = max( [ len(e[1]) for e in entries ], default=0 )
+    initial = np.full( (len(entries), ki), -1, dtype=np.intp )
+    final   = np.full( (len(entries), kf), -1, dtype=np.intp )
+    for n, (ins, outs) in enumerate(entries):
+        try:
+            initial[n,:len(ins)]  = [ rows[s] for s in ins ]
+            final[n,:len(outs)]   = [ rows[s] for s in outs ]
+        except KeyError as err:
+            raise ValueError('unknown state '+str(err)+' in process '+str(n))
+    return initial, final
+
+class Conservation():
+    # the outcome of a batch: `change` is the (n, 8) change final - initial of
+    # every quantum number in sixths (in the order of core.columns), and the
+    # masks say which processes conserve everything (`strong`), conserve Q and
+    # B with every flavour changing by at most one unit (`weak`) and which are
+    # `allowed` at all; `violated` is the first quantity in `conserved` that a
+    # process breaks beyond what is allowed, '' for none, and `open` whether the
+    # final masses fit in the initial ones when the table has a mass column
+    def __init__(self, change, weak=False, open=None):
+        self.change = change
+        cols = [ columns.index(f) for f in conserved ]
+        bad  = change[:, cols]!=0
+        self.strong = ~bad.any(axis=1)
+        flav = np.abs( change[:, [ columns.index(f) for f in flavours ]] )
+        self.weak = ~bad[:,:2].any(axis=1) & bad[:,2:].any(axis=1) & (flav<=units).all(axis=1)
+        self.allowed = self.strong | self.weak if weak else self.strong.copy()
+        # past Q and B, flavour changes only count as violations when not allowed
+        if weak: bad[:,2:] &= ~self.weak[:,None]
+        first = np.where( bad.any(axis=1), bad.argmax(axis=1), len(conserved) )
+        self.violated = np.array( list(conserved) + [''], dtype=object )[first]
+        self.open = open
+
+    def delta(self, f):
+        # change of one quantum number per process in natural units
+        n = self.change[:, columns.index(f)]
+        return n//units if f in flavours else n/units
+
+    def __len__(self):
+        return len(self.change)
+
+def conserve(table, initial, final, weak=False, chunk=1<<18):
+    # check every process of a batch, initial and final are (n, k) row indices
+    # into table with -1 padding; the batch is walked in chunks of `chunk`
+    # processes so that the gathered (chunk, k, 8) block stays small
+    initial = np.asarray(initial, dtype=np.intp)
+    final   = np.asarray(final, dtype=np.intp)
+    if initial.ndim==1: initial = initial[:,None]
+    if final.ndim==1:   final   = final[:,None]
+    if len(initial)!=len(final):
+        raise ValueError('{:d} initial but {:d} final states'.format(len(initial), len(final)))
+    n = len(table)
+    for idx in (initial, final):
+        if idx.size and ( idx.max()>=n or idx.min()<-1 ):
+            raise IndexError('state index out of range for a table of {:d} rows'.format(n))
+
+    qn   = np.concatenate( ( table.qn.astype(np.int16), np.zeros((1, len(columns)), dtype=np.int16) ) )
+    mass = table.data.get('mass')
+    if mass is not None: mass = np.append( np.asarray(mass, dtype=float), 0.0 )
+
+    change = np.empty( (len(initial), len(columns)), dtype=np.int16 )
+    fits   = np.empty( len(initial), dtype=bool ) if mass is not None else None
+    for lo in range(0, len(initial), chunk):
+        i, f = initial[lo:lo+chunk], final[lo:lo+chunk]
+        change[lo:lo+chunk] = qn[f].sum(axis=1, dtype=np.int16) - qn[i].sum(axis=1, dtype=np.int16)
+        if mass is not None:
+            fits[lo:lo+chunk] = mass[f].sum(axis=1) <= mass[i].sum(axis=1)
+    return Conservation(change, weak, fits)
@@ -0,0 +1,313 @@
+# a small http server that renders diagrams on request
+#
+#   python -m hadrons.server --port 8000 -j 2 --cache-mb 64
+#
+#   GET  /render?states=pip,pim,piz&kind=plot3d&mes=0&format=svg
+#   GET  /render?catalog=baryons&S=-1&C=(0:1)&kind=plot3d&bar=1   (quantum number filters)
+#   POST /render   with the same fields as a JSON object
+#   GET  /figures/st_mes_s0.png                                    (a stock figure)
+#   GET  /stats
+#
+# every request is reduced to a canonical form whose hash keys a size-bounded
+# LRU of the rendered bytes, identical requests in flight share one render and
+# renders run in a bounded pool of worker processes that import matplotlib once
+import argparse
+import collections
+import concurrent.futures
+import hashlib
+import http.server
+import importlib
+import io
+import json
+import math
+import threading
+import urllib.parse
+
+from . import catalog
+from .core import columns
+
+content_types = { 'png': 'image/png', 'svg': 'image/svg+xml', 'pdf': 'application/pdf' }
+
+class ByteCache():
+    # LRU of rendered outputs bounded by their total size in bytes
+    def __init__(self, maxbytes):
+        self.maxbytes = maxbytes
+        self.entries  = collections.OrderedDict()
+        self.size     = 0
+        self.lock     = threading.Lock()
+        self.hits     = 0
+        self.misses   = 0
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        if len(value)>self.maxbytes: return
+        with self.lock:
+            if key in self.entries:
+                self.size -= len( self.entries.pop(key) )
+            self.entries[key] = value
+            self.size += len(value)
+            while self.size>self.maxbytes:
+                self.size -= len( self.entries.popitem(last=False)[1] )
+
+    def info(self):
+        with self.lock:
+            return dict( hits=self.hits, misses=self.misses, entries=len(self.entries), bytes=self.size, maxbytes=self.maxbytes )
+
+# request fields: how to read them from a query string and check them
+def parse_bool(v):
+    if isinstance(v, bool): return v
+    if str(v).lower() in ('1', 'true', 'yes', 'on'): return True
+    if str(v).lower() in ('0', 'false', 'no', 'off'): return False
+    raise ValueError('not a boolean: '+str(v))
+
+def parse_none(parse):
+    return lambda v: None if v is None or str(v).lower() in ('', 'none', 'null') else parse(v)
+
+def parse_pair(v):
+    v = v.split(',') if isinstance(v, str) else list(v)
+    if len(v)!=2: raise ValueError('expected two numbers: '+str(v))
+    return [ float(x) for x in v ]
+
+def parse_size(v):
+    return [ parse_positive(float)(x) for x in parse_pair(v) ]
+
+def parse_positive(parse):
+    def positive(v):
+        v = parse(v)
+        if not ( math.isfinite(v) and v>0 ): raise ValueError('expected a positive number: '+str(v))
+        return v
+    return positive
+
+def parse_choice(*choices):
+    def parse(v):
+        if v not in choices: raise ValueError('expected one of '+', '.join( str(c) for c in choices )+': '+str(v))
+        return v
+    return parse
+
+def parse_list(v):
+    return [ x for x in v.split(',') if x ] if isinstance(v, str) else [ str(x) for x in v ]
+
+def parse_columns(v):
+    v = parse_list(v)
+    unknown = [ f for f in v if f not in columns ]
+    if not v: raise ValueError('expected at least one quantum number')
+    if unknown: raise ValueError('unknown quantum number(s) '+', '.join(unknown)+', use some of '+', '.join(columns))
+    return v
+
+arguments = {
+    'plot'   : dict( rad=float, hexc=parse_pair, hexr=parse_none(float), batch=parse_bool, hulls=parse_bool ),
+    'plot3d' : dict( mes=parse_none(int), bar=parse_none(int), content=parse_bool, view=parse_pair, batch=parse_bool,
+                     labels=parse_none( parse_choice('auto') ), hulls=parse_bool ),
+    'facets' : dict( by=parse_columns, panel=parse_choice('plot', 'plot3d'), ncols=parse_positive(int), hulls=parse_bool ),
+}
+
+# filled in for every field not given, so that equivalent requests hash alike;
+# plot3d draws no meson or baryon outline unless asked for
+defaults = {
+    'plot'   : dict( rad=0.15, hexc=[0.0,0.0], hexr=1.0, batch=False, hulls=False ),
+    'plot3d' : dict( mes=None, bar=None, content=True, view=[18,-84], batch=False, labels='auto', hulls=False ),
+    'facets' : dict( by=['Bt'], panel='plot3d', ncols=3, hulls=False ),
+}
+
+def select_states(fields):
+    # names of the requested states in catalog order: an explicit list or a
+    # catalog, narrowed down by quantum number filters through catalog.index
+    states = { 'mesons': catalog.mesons, 'baryons': catalog.baryons,
+               'all': dict( catalog.mesons, **catalog.baryons ) }[ fields.get('catalog', 'all') ]
+    names = list(states)
+    if 'states' in fields:
+        wanted = parse_list(fields['states'])
+        unknown = [ n for n in wanted if n not in states ]
+        if unknown: raise ValueError('unknown state(s): '+', '.join(unknown))
+        names = [ n for n in names if n in set(wanted) ]
+    target = {}
+    for f in columns:
+        if f not in fields: continue
+        v = fields[f]
+        if isinstance(v, str) and ':' in v:
+            lo, hi = v.strip('()[]').split(':')
+            target[f] = ( float(lo) if lo else None, float(hi) if hi else None )
+        elif isinstance(v, list):
+            target[f] = tuple(v)
+        else:
+            target[f] = float(v)
+    if target:
+        keep  = set( catalog.index.query(**target).names )
+        names = [ n for n in names if n in keep ]
+    if not names: raise ValueError('no states selected')
+    return names
+
+def canonical(fields):
+    # the full, normalized description of a render, with every default filled in
+    kind = fields.get('kind', 'plot3d')
+    if kind not in arguments: raise ValueError('kind must be one of '+', '.join(arguments))
+    unknown = set(fields) - set(arguments[kind]) - set(columns) - { 'kind', 'states', 'catalog', 'format', 'dpi', 'figsize' }
+    if unknown: raise ValueError('unknown field(s) for '+kind+': '+', '.join(sorted(unknown)))
+    fmt = parse_choice(*content_types)( fields.get('format', 'png') )
+    args = dict( defaults[kind], **{ k: parse(fields[k]) for k, parse in arguments[kind].items() if k in fields } )
+    return dict( kind=kind, states=select_states(fields), args=args, format=fmt,
+                 dpi=parse_none( parse_positive(int) )( fields.get('dpi') ),
+                 figsize=parse_size( fields.get('figsize', (10,8) if kind!='plot' else (8,8)) ),
+                 save=dict( bbox_inches='tight', pad_inches=0.1 ) )
+
+def stock(name, fmt):
+    # the canonical request of a stock figure
+    from .build import figures
+    if name not in figures: raise ValueError('unknown figure: '+name)
+    spec = figures[name]
+    return dict( kind=spec['kind'], states=spec['states'], args=spec['args'], format=parse_choice(*content_types)(fmt),
+                 dpi=None, figsize=list(spec['figsize']), save=spec['save'] )
+
+def request_key(req):
+    return hashlib.sha256( json.dumps(req, sort_keys=True).encode() ).hexdigest()
+
+def init_worker():
+    import matplotlib
+    matplotlib.use('Agg')
+    # the drawing code, so that the first render does not pay for importing it
+    importlib.import_module('.build', __package__)
+
+def render(req):
+    # draw a canonical request and return the bytes of its output
+    import matplotlib.pyplot as plt
+    from .build import new_figure
+    states = dict( catalog.mesons, **catalog.baryons )
+    args   = dict( req['args'] )
+    if 'by' in args: args['by'] = tuple(args['by'])
+    if 'hexc' in args: args['hexc'] = tuple(args['hexc'])
+    if 'view' in args: args['view'] = tuple(args['view'])
+    fig = new_figure( req['kind'], [ states[n] for n in req['states'] ], req['figsize'], args )
+    buf = io.BytesIO()
+    try:
+        fig.savefig( buf, format=req['format'], dpi=req['dpi'] or fig.dpi, **req['save'] )
+    finally:
+        plt.close(fig)
+    return buf.getvalue()
+
+class Renderer():
+    # the cache in front of the worker pool, with one shared render per key in flight
+    def __init__(self, jobs=2, cache_bytes=64*2**20, queue=16):
+        self.cache   = ByteCache(cache_bytes)
+        self.pool    = concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=init_worker)
+        self.slots   = threading.BoundedSemaphore(queue)
+        self.pending = {}
+        self.lock    = threading.Lock()
+        self.renders = 0
+
+    def get(self, req, timeout=120):
+        key  = request_key(req)
+        data = self.cache.get(key)
+        if data is not None: return key, data
+        with self.lock:
+            future = self.pending.get(key)
+            if future is None:
+                if not self.slots.acquire(blocking=False):
+                    raise Busy()
+                future = self.pool.submit(render, req)
+                self.pending[key] = future
+                self.renders += 1
+                future.add_done_callback( lambda f: self.done(key, f) )
+        return key, future.result(timeout)
+
+    def done(self, key, future):
+        if future.exception() is None:
+            self.cache.put(key, future.result())
+        with self.lock:
+            self.pending.pop(key, None)
+        self.slots.release()
+
+    def info(self):
+        with self.lock:
+            return dict( cache=self.cache.info(), renders=self.renders, in_flight=len(self.pending) )
+
+class Busy(Exception):
+    pass
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    renderer = None
+    quiet    = False
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        if url.path=='/stats':
+            return self.reply( 200, json.dumps( self.renderer.info() ).encode(), 'application/json' )
+        if url.path=='/render':
+            fields = dict( urllib.parse.parse_qsl(url.query) )
+            return self.serve( lambda: canonical(fields) )
+        if url.path.startswith('/figures/'):
+            name, _, fmt = url.path[len('/figures/'):].rpartition('.')
+            return self.serve( lambda: stock(name, fmt) )
+        self.error(404, 'not found: '+url.path)
+
+    def do_POST(self):
+        if urllib.parse.urlsplit(self.path).path!='/render':
+            return self.error(404, 'not found: '+self.path)
+        body = self.rfile.read( int( self.headers.get('Content-Length', 0) ) )
+        try:
+            fields = json.loads(body or b'{}')
+        except ValueError as err:
+            return self.error(400, 'invalid json: '+str(err))
+        self.serve( lambda: canonical(fields) )
+
+    def serve(self, make):
+        try:
+            req = make()
+        except (ValueError, KeyError, TypeError) as err:
+            return self.error(400, str(err))
+        etag = '"'+request_key(req)+'"'
+        if self.headers.get('If-None-Match')==etag:
+            return self.reply(304, b'', None, etag)
+        try:
+            key, data = self.renderer.get(req)
+        except Busy:
+            return self.error(503, 'too many renders queued, retry later')
+        except Exception as err:
+            return self.error(500, 'render failed: '+repr(err))
+        self.reply(200, data, content_types[req['format']], etag)
+
+    def reply(self, code, data, ctype, etag=None):
+        self.send_response(code)
+        if ctype: self.send_header('Content-Type', ctype)
+        if etag:  self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def error(self, code, message):
+        self.reply( code, json.dumps( dict(error=message) ).encode(), 'application/json' )
+
+    def log_message(self, *args):
+        if not self.quiet: super().log_message(*args)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m hadrons.server', description='Serve isospin diagrams over http')
+    parser.add_argument('--host', default='127.0.0.1', help='address to bind (default %(default)s)')
+    parser.add_argument('--port', type=int, default=8000, help='port to listen on (default %(default)s)')
+    parser.add_argument('-j', '--jobs', type=int, default=2, help='render worker processes (default %(default)s)')
+    parser.add_argument('--cache-mb', type=float, default=64, help='size of the rendered output cache in MiB (default %(default)s)')
+    parser.add_argument('--queue', type=int, default=16, help='renders in flight before answering 503 (default %(default)s)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='do not log requests')
+    opts = parser.parse_args(argv)
+
+    Handler.renderer = Renderer( opts.jobs, int(opts.cache_mb*2**20), opts.queue )
+    Handler.quiet    = opts.quiet
+    server = http.server.ThreadingHTTPServer( (opts.host, opts.port), Handler )
+    print('serving on http://{:s}:{:d}/ with {:d} worker(s)'.format(opts.host, opts.port, opts.jobs), flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        Handler.renderer.pool.shutdown()
+
+if __name__ == "__main__":
+    main()
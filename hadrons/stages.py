@@ -0,0 +1,106 @@
+# per-stage instrumentation of figure builds
+#
+# the build and drawing code wraps each stage in `stage(name)`: catalog,
+# artists (with the layout and labels inside it), draw (with mathtext) and
+# the export of each format; nothing is recorded unless a Profile is active,
+# in which case every stage gets its wall time, call count, the process RSS
+# high-water mark and, when it is handed the figure, the number of artists,
+# and each finished stage is passed to the functions in `hooks`
+# tracemalloc slows the drawing code down several times over, so the peak
+# traced memory of each stage is only recorded by a Profile(memory=True),
+# meant for a separate pass whose timings are thrown away (see add_memory)
+import contextlib
+import resource
+import time
+import tracemalloc
+
+# the active Profile of this process, if any
+current = None
+
+# functions called as hook(figure, path, record) when a stage ends
+hooks = []
+
+def count_artists(fig):
+    return len( fig.findobj() )
+
+class Profile():
+    def __init__(self, memory=False):
+        self.memory  = memory
+        self.figures = {}
+        self.stack   = []
+        self.name    = None
+
+    def tracing(self):
+        return self.memory and tracemalloc.is_tracing()
+
+    def enter(self, name):
+        # the peak so far belongs to the enclosing stage, restart it for this one
+        frame = dict( name=name, peak=0, base=0 )
+        if self.tracing():
+            now, peak = tracemalloc.get_traced_memory()
+            if self.stack: self.stack[-1]['peak'] = max( self.stack[-1]['peak'], peak )
+            tracemalloc.reset_peak()
+            frame['base'] = now
+        self.stack.append(frame)
+        return frame
+
+    def leave(self, frame, record):
+        self.stack.pop()
+        if self.tracing():
+            peak = max( frame['peak'], tracemalloc.get_traced_memory()[1] )
+            if self.stack: self.stack[-1]['peak'] = max( self.stack[-1]['peak'], peak )
+            record['peak_mb'] = max( record.get('peak_mb', 0.0), (peak-frame['base'])/2**20 )
+        record['maxrss_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/2**10
+
+    @contextlib.contextmanager
+    def figure(self, name):
+        # collect the stages of one figure build
+        global current
+        previous, current = current, self
+        started = self.memory and not tracemalloc.is_tracing()
+        if started: tracemalloc.start()
+        self.name  = name
+        self.stack = []
+        record = self.figures[name] = dict( stages={} )
+        frame  = self.enter(None)
+        start  = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['wall'] = time.perf_counter()-start
+            self.leave(frame, record)
+            if started: tracemalloc.stop()
+            current = previous
+
+    @contextlib.contextmanager
+    def stage(self, name, fig=None):
+        # nested stages are recorded as parent/child paths and repeated ones
+        # (a panel per facet, a mathtext parse per string) are accumulated
+        path  = '/'.join( [ f['name'] for f in self.stack[1:] ] + [name] )
+        frame = self.enter(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall   = time.perf_counter()-start
+            record = self.figures[self.name]['stages'].setdefault( path, dict(wall=0.0, calls=0) )
+            record['wall']  += wall
+            record['calls'] += 1
+            self.leave(frame, record)
+            if fig is not None: record['artists'] = count_artists(fig)
+            for hook in hooks:
+                hook(self.name, path, record)
+
+def add_memory(record, traced):
+    # copy the peak memory of a traced figure record onto the untraced record
+    # of the same build, stages the traced pass never entered have none
+    if 'peak_mb' in traced: record['peak_mb'] = traced['peak_mb']
+    for path, r in traced['stages'].items():
+        if path in record['stages'] and 'peak_mb' in r:
+            record['stages'][path]['peak_mb'] = r['peak_mb']
+    return record
+
+def stage(name, fig=None):
+    # a stage of the active profile, or nothing at all when not profiling
+    if current is None: return contextlib.nullcontext()
+    return current.stage(name, fig)
@@ -0,0 +1,31 @@
+# quantum number tables for the terminal
+from tabulate import tabulate
+
+# the fractions are formatted from the exact sixths held by quarks and states
+
+def print_quarks(quarks):
+    rows    = []
+    heads = ['Name','Q','B','Iz','Y','S','C','B\'','T']
+    for key, item in quarks.items():
+        Q, B, Iz, Y = item.key(('Q','B','Iz','Y'))
+        Q = '{: d}/3'.format( Q//2 )
+        B = '{: d}/3'.format( B//2 )
+        Iz = '0' if Iz==0 else '{: d}/2'.format( Iz//3 )
+        Y = '{: d}/3'.format( Y//2 )
+        rows.append( [ item.name, Q, B, Iz, Y, item.S, item.C, item.Bt, item.T ] )
+    print('\033[1m Quarks \033[0m')
+    print(tabulate(rows,tablefmt='pretty',headers=heads,colalign=('left','right','right','right','right','right','right','right','right')))
+
+def print_states(states, head='States'):
+    rows    = []
+    heads = ['Name','Quarks','Q','B','Iz','Y','S','C','B\'','T']
+    for key, item in states.items():
+        quarks = '(' + ','.join( [qs.name for qs in item.quarks] ) + ')'
+        Q, B, Iz, Y = item.key(('Q','B','Iz','Y'))
+        Q = '{: d}/3'.format( Q//2 )
+        B = '{: d}/3'.format( B//2 )
+        Iz = '0' if Iz==0 else '{: d}/2'.format( Iz//3 )
+        Y = '{: d}/3'.format( Y//2 )
+        rows.append( [ item.name, quarks, Q, B, Iz, Y, item.S, item.C, item.Bt, item.T ] )
+    print('\033[1m %s \033[0m'%head)
+    print(tabulate(rows,tablefmt='pretty',headers=heads,colalign=('left','left','right','right','right','right','right','right','right','right')))
@@ -0,0 +1,7 @@
+# shared setup of the tests: headless matplotlib and the repository root
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+
+root = os.path.dirname( os.path.dirname( os.path.abspath(__file__) ) )
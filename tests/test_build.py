@@ -0,0 +1,93 @@
+# the build driver: target selection, format checks, multi-format export and the rebuild cache
+import json
+import os
+
+import matplotlib.image
+import pytest
+
+from hadrons import build
+
+def test_select_figures():
+    assert build.select_figures([]) == list(build.figures)
+    assert build.select_figures(['st_mes_*']) == ['st_mes_s0', 'st_mes_s1']
+    # build order, not the order of the patterns
+    assert build.select_figures(['st_bar_s0', 'ch_*']) == ['ch_mes_s0', 'ch_mes_s1', 'ch_bar_s0', 'ch_bar_s1', 'st_bar_s0']
+    with pytest.raises(ValueError):
+        build.select_figures(['nope'])
+
+def test_check_formats():
+    build.check_formats(['pdf', 'png', 'png@300', 'svg'])
+    for bad in (['pngx'], ['png@x'], ['png@0'], ['st_mes_s0']):
+        with pytest.raises(ValueError):
+            build.check_formats(bad)
+
+def test_bad_format_draws_nothing(tmp_path):
+    with pytest.raises(SystemExit):
+        build.main(['-q', '-o', str(tmp_path), '--formats', 'png', 'svgg', 'st_mes_s0'])
+    assert os.listdir(tmp_path) == []
+
+def test_parallel_build(tmp_path, capsys):
+    build.main(['-q', '-j', '2', '-o', str(tmp_path), 'st_mes_*', '--formats', 'png'])
+    assert 'built 2 of 2' in capsys.readouterr().out
+    assert sorted( os.listdir(tmp_path/'png') ) == ['st_mes_s0.png', 'st_mes_s1.png']
+
+def test_rebuild_cache(tmp_path, capsys):
+    args = ['-q', '-o', str(tmp_path), 'st_mes_s0', '--formats', 'png']
+    build.main(args)
+    assert 'built 1 of 1' in capsys.readouterr().out
+    build.main(args)
+    assert 'built 0 of 1' in capsys.readouterr().out
+    # a changed key, as after editing the figure or its code, rebuilds it
+    manifest = build.load_manifest(str(tmp_path))
+    assert set( manifest.values() ) == { build.figure_key('st_mes_s0') }
+    with open( os.path.join(str(tmp_path), build.manifest_name), 'w' ) as f:
+        json.dump( { path: 'stale' for path in manifest }, f )
+    build.main(args)
+    assert 'built 1 of 1' in capsys.readouterr().out
+    # so does a missing output, and -f rebuilds anyway
+    os.remove( os.path.join(str(tmp_path), 'png', 'st_mes_s0.png') )
+    build.main(args)
+    assert 'built 1 of 1' in capsys.readouterr().out
+    build.main(args+['-f'])
+    assert 'built 1 of 1' in capsys.readouterr().out
+
+def test_figure_key():
+    # stable within a process and different between figures
+    assert build.figure_key('st_mes_s0') == build.figure_key('st_mes_s0')
+    assert len( { build.figure_key(name) for name in build.figures } ) == len(build.figures)
+
+def test_export_formats(tmp_path):
+    # one layout pass for every format; a png at another dpi written before
+    # the one at the figure dpi must not change the latter
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    spec = build.figures['ch_mes_s0']
+    fig  = Figure(figsize=spec['figsize'])
+    FigureCanvasAgg(fig)
+    build.new_figure( spec['kind'], build.figure_states('ch_mes_s0'), spec['figsize'], spec['args'], fig=fig )
+    pixels = build.render_rgba(fig, **spec['save'])
+    outputs = [ (str(tmp_path/'a.png'), 50), (str(tmp_path/'b.pdf'), None), (str(tmp_path/'c.svg'), None), (str(tmp_path/'d.png'), None) ]
+    build.export(fig, outputs, **spec['save'])
+    small = matplotlib.image.imread(outputs[0][0])
+    full  = matplotlib.image.imread(outputs[3][0])
+    assert full.shape == pixels.shape and abs( small.shape[0] - full.shape[0]/2 ) <= 1
+    assert ( (full*255).round() == pixels ).all()
+    assert open(outputs[1][0], 'rb').read(5) == b'%PDF-'
+    assert b'<svg' in open(outputs[2][0], 'rb').read()
+
+def test_profile(tmp_path, capsys):
+    # the mathtext counts of the worker processes add up in the report,
+    # and the peak memory of the stages only comes from the traced pass
+    path = str(tmp_path/'profile.json')
+    build.main(['-q', '-f', '-j', '2', '-o', str(tmp_path), 'ch_mes_*', '--formats', 'png', '--profile', path])
+    report = json.load(open(path))
+    counts = [ r['mathtext'] for r in report['figures'].values() ]
+    assert report['mathtext']['misses'] > 0
+    assert report['mathtext']['hits']+report['mathtext']['misses'] == sum( [ c['hits']+c['misses'] for o in counts for c in o.values() ] )
+    assert not any( [ 'peak_mb' in r for r in report['figures'].values() ] )
+
+    build.main(['-q', '-f', '-o', str(tmp_path), 'ch_mes_s0', '--formats', 'png', '--profile', path, '--profile-memory'])
+    record = json.load(open(path))['figures']['ch_mes_s0']
+    assert record['peak_mb'] > 0 and record['stages']['export:png']['peak_mb'] > 0
+    # the traced pass draws into a scratch directory
+    assert sorted( os.listdir(tmp_path/'png') ) == ['ch_mes_s0.png', 'ch_mes_s1.png']
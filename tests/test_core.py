@@ -0,0 +1,156 @@
+# the StateTable, the multiquark generator, exact quantum numbers and the interning of quarks and states
+from fractions import Fraction
+import pickle
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from hadrons import catalog
+from hadrons.core import StateTable, fraction, generate, quark, sixths, state
+
+u, d, s, c = catalog.u, catalog.d, catalog.s, catalog.c
+
+class fake():
+    # a quark stand-in with any quantum numbers, quark() itself refuses inconsistent ones
+    def __init__(self, name, qn):
+        self.name  = name
+        self.title = name
+        self.qn    = tuple(qn)
+
+def test_table_columns():
+    table = StateTable.from_entries([ ('pip', '', [u, catalog.dbar]), ('p', '', [u, u, d]), ('lbcp', '', [u, d, c]) ])
+    assert list(table.Q) == [1, 1, 1]
+    assert list(table.B) == [0, 1, 1]
+    assert list(table.C) == [0, 0, 1]
+    assert table[1].name == 'p' and table[-1].name == 'lbcp'
+    assert list( table.take(np.array([2, 0])).names ) == ['lbcp', 'pip']
+    with pytest.raises(IndexError):
+        table[3]
+
+def test_table_padding():
+    # a meson and a baryon in one table, the meson padded with -1
+    table = StateTable.from_entries([ ('pip', '', [u, catalog.dbar]), ('p', '', [u, u, d]) ])
+    assert table.content.shape == (2, 3) and table.content[0, 2] == -1
+    assert [ len(st.quarks) for st in table ] == [2, 3]
+
+def test_check_rejects_inconsistent_rows():
+    # Y = 2(Q - Iz) fails for x: Q=1/3 (2 sixths), Iz=0, Y=0
+    x = fake('x', [2, 0, 0, 0, 0, 0, 0, 0])
+    with pytest.raises(RuntimeError) as err:
+        StateTable([u, d, x], [[0, 1], [2, 0], [0, 2]], ['good', 'bad1', 'bad2'])
+    assert '2 state(s)' in str(err.value) and 'bad1' in str(err.value) and 'bad2' in str(err.value)
+    assert len( StateTable([u, d, x], [[0, 1], [2, 0]], check=False) ) == 2
+
+def test_catalog_consistent():
+    catalog.hadron_table.check()
+    Q, Iz, Y = catalog.hadron_table.key(('Q', 'Iz', 'Y')).astype(int).T
+    assert ( Y == 2*(Q-Iz) ).all()
+
+def contents_of(quarks, kind, batch=4096):
+    rows = []
+    for k, table in generate(quarks, kinds=(kind,), batch=batch):
+        rows += [ tuple( sorted( [ q.name for q in st.quarks ] ) ) for st in table ]
+    return rows
+
+def test_generate_dedupes():
+    # every content once, whatever the order of its quarks: n^2 mesons,
+    # (n+2 choose 3) baryons and (n+1 choose 2)^2 tetraquarks of n flavours
+    quarks = [u, d, s, c]
+    for kind, count in ( ('meson', 16), ('baryon', 20), ('tetraquark', 100), ((1, 2), 40) ):
+        rows = contents_of(quarks, kind)
+        assert len(rows) == count and len( set(rows) ) == count
+
+def test_generate_batches():
+    quarks = [u, d, s, c, catalog.b]
+    assert contents_of(quarks, 'pentaquark', batch=7) == contents_of(quarks, 'pentaquark')
+    assert all( [ len(table)<=7 for k, table in generate(quarks, kinds=('baryon',), batch=7) ] )
+
+def test_generate_quantum_numbers():
+    for kind, table in generate([u, d, s], kinds=('meson', 'baryon')):
+        assert set(table.B) == ( {0} if kind=='meson' else {1} )
+        table.check()
+
+def test_sixths():
+    assert sixths(2/3) == 4 and sixths(-1/3) == -2 and sixths(Fraction(1, 2)) == 3 and sixths(-1) == -6
+    with pytest.raises(ValueError):
+        sixths(0.1)
+    assert [ fraction(n) for n in (4, -2, 3, 6, 0, -12) ] == ['2/3', '-1/3', '1/2', '1', '0', '-2']
+
+def test_exact_keys():
+    # quantum numbers are int8 sixths, so sums of thirds are exact
+    assert u.qn[:3] == (4, 2, 3) and u.Q == 2/3 and u.S == 0 and isinstance(s.S, int)
+    p = catalog.baryons['p']
+    assert p.key(('Q', 'B', 'Iz')) == (6, 6, 3) and p.Q == 1 and p.B == 1
+    assert catalog.hadron_table.qn.dtype == np.int8
+    assert catalog.mesons['pip'].key(('Q', 'S')) == (6, 0)
+    assert catalog.mesons['Kp'].key(('Q', 'S')) == (6, 6)
+    assert len( { st.key() for st in catalog.meson_table } ) < len(catalog.meson_table)     # pi0, eta, ... share a key
+
+def test_overflow():
+    with pytest.raises(OverflowError):
+        StateTable([c], [[0]*20])
+
+def test_quark_interned():
+    assert quark('u', '$u$', Q=2/3, Iz=0.5) is u
+    assert u.anti() is catalog.ubar and catalog.ubar.anti() is u
+    assert pickle.loads( pickle.dumps(u) ) is u
+
+def test_quark_conflict():
+    with pytest.raises(ValueError):
+        quark('u', '$u$', Q=-1/3, Iz=-0.5)
+    with pytest.raises(ValueError):
+        quark('u', '$U$', Q=2/3, Iz=0.5)
+    assert u.title == '$u$'
+
+def test_state_interned():
+    a = state('test_pip', '$a$', [u, catalog.dbar])
+    assert state('test_pip', '$a$', [catalog.dbar, u]) is a
+    assert state('test_pip', '$a$', [u, catalog.dbar], 1) is not a
+    assert pickle.loads( pickle.dumps(a) ) is a
+    b = pickle.loads( pickle.dumps( state.single('test_pip', '$a$', [u, catalog.dbar]) ) )
+    assert b is not a and b.key() == a.key() and b.quarks == a.quarks
+
+def test_state_title_conflict():
+    a = state('test_kp', '$a$', [u, catalog.sbar])
+    with pytest.raises(ValueError):
+        state('test_kp', '$b$', [u, catalog.sbar])
+    assert a.title=='$a$'
+
+def test_standalone_state():
+    # the same quantum numbers as the row of a table, without the table
+    a = state('test_sigma', '$a$', [u, d, s], 1/2)
+    row = StateTable.from_states([a])[0]
+    assert a.key() == row.key() and a.quarks == row.quarks and a.spin == 1/2
+    assert (a.Q, a.B, a.Iz, a.S, a.Y) == (row.Q, row.B, row.Iz, row.S, row.Y) == (0, 1, 0, -1, 0)
+    with pytest.raises(OverflowError):
+        state.single('test_many', '', [c]*20)
+
+def test_standalone_memory():
+    # a standalone state holds two tuples, about 300 bytes against over 1100
+    # for a state on a one-row StateTable
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        states = [ state.single('test_pim', '$a$', [d, catalog.ubar]) for i in range(1000) ]
+        size   = ( tracemalloc.get_traced_memory()[0] - before )/len(states)
+    finally:
+        tracemalloc.stop()
+    assert size < 400
+
+def test_unnamed_conjugates_not_shared():
+    # states of the same content each keep their own conjugate, linked both ways
+    pi  = state('test_pi',  '$a$', [u, catalog.dbar])
+    rho = state('test_rho', '$b$', [u, catalog.dbar])
+    assert pi.anti() is not rho.anti()
+    assert pi.anti().anti() is pi and rho.anti().anti() is rho
+    assert pi.anti() is pi.anti()
+    assert sorted( [ q.name for q in pi.anti().quarks ] ) == ['d', 'ubar']
+    pip, rhop = catalog.mesons['pip'], catalog.mesons['rhop']
+    assert pip.anti() is not rhop.anti() and rhop.anti().anti() is rhop
+
+def test_named_conjugate_relinks():
+    a = state('test_ks', '$a$', [d, catalog.sbar])
+    b = a.anti('test_ksb', '$b$')
+    assert b.name=='test_ksb' and b.anti() is a and a.anti() is b
+    assert a.anti('test_ksb', '$b$') is b
@@ -0,0 +1,51 @@
+# the stock figures against their golden images, and the committed outputs against the goldens
+import os
+
+import matplotlib
+import matplotlib.image
+import numpy as np
+import pytest
+
+from hadrons import golden
+from hadrons.build import figures
+
+from conftest import root
+
+directory = os.path.join(root, 'golden')
+
+# text rasterization changes between matplotlib versions
+pytestmark = pytest.mark.skipif( golden.golden_version(directory) not in (None, matplotlib.__version__),
+                                 reason='goldens drawn with another matplotlib' )
+
+@pytest.mark.parametrize('name', list(figures))
+def test_golden(name):
+    name, status, fraction, secs = golden.check(name, directory)
+    assert status=='ok', '{:s}: {:s}, {:.4%} of pixels differ, see {:s}'.format(name, status, fraction, os.path.join(directory, 'diff', name+'.png'))
+
+@pytest.mark.parametrize('name', list(figures))
+def test_committed_png(name):
+    # the png shown in the README is what the code draws
+    png = matplotlib.image.imread( os.path.join(root, 'png', name+'.png') )
+    ref = matplotlib.image.imread( os.path.join(directory, name+'.png') )
+    assert png.shape==ref.shape and np.array_equal(png, ref), 'png/'+name+'.png is stale, rebuild it with python -m hadrons -f '+name
+
+def test_distance():
+    white = np.full((2, 2, 4), 255, dtype=np.uint8)
+    black = white.copy(); black[...,:3] = 0
+    assert np.allclose( golden.distance(white, black), 0.933, atol=1e-3 )
+    assert not golden.distance(white, white).any()
+    # a transparent pixel is white
+    clear = black.copy(); clear[...,3] = 0
+    assert np.allclose( golden.distance(white, clear), 0 )
+
+def test_heatmap_on_failure(tmp_path):
+    # a changed golden fails with a heatmap of the changed pixels
+    name = 'st_mes_s0'
+    pixels = golden.render(name)
+    pixels[100:120, 100:200, :3] = 0
+    matplotlib.image.imsave( str(tmp_path/(name+'.png')), pixels, format='png' )
+    name, status, fraction, secs = golden.check(name, str(tmp_path))
+    assert status=='differs' and fraction>0
+    heat = matplotlib.image.imread( str(tmp_path/'diff'/(name+'.png')) )
+    assert heat.shape[:2]==pixels.shape[:2]
+    assert ( heat[100:120, 100:200, 0]==1 ).all()
@@ -0,0 +1,48 @@
+# point, range and content queries of StateIndex and the minimal contents
+import numpy as np
+
+from hadrons import catalog
+from hadrons.core import generate
+from hadrons.index import StateIndex, minimal_contents
+
+table = catalog.hadron_table
+
+def scan(**target):
+    # the rows of a plain scan over the table, for comparison
+    keep = np.ones(len(table), dtype=bool)
+    for f, v in target.items():
+        col = np.array( [ getattr(s, f) for s in table ] )
+        if isinstance(v, tuple):
+            lo, hi = v
+            if lo is not None: keep &= col>=lo-1e-9
+            if hi is not None: keep &= col<=hi+1e-9
+        else:
+            keep &= np.abs(col-v)<1e-9
+    return np.flatnonzero(keep)
+
+def test_rows_match_scan():
+    for target in ( dict(S=-1), dict(S=-1, C=0), dict(Q=(0, None), B=1), dict(Iz=(-0.5, 0.5), B=0, C=(1, None)), dict() ):
+        assert list( catalog.index.rows(**target) ) == list( scan(**target) )
+
+def test_query_names():
+    names = set( catalog.index.query(Q=1, B=1, S=0, C=0, Bt=0).names )
+    assert names == { 'p', 'delp' }
+
+def test_contents():
+    assert set( catalog.index.with_content(['u', 'sbar']).names ) == { 'Kp', 'Kstp' }
+    assert len( catalog.index.contents(['t', 't']) ) == 0
+
+def test_minimal_contents():
+    found = minimal_contents(B=1, S=-2, Q=0, C=0, Bt=0, T=0)
+    assert [ sorted( [ q.name for q in s.quarks ] ) for s in found ] == [ ['s', 's', 'u'] ]
+    # a pentaquark is the smallest content with B=1 and S=+1
+    found = minimal_contents(B=1, S=1, C=0, Bt=0, T=0)
+    assert len(found) and all( [ len(s.quarks)==5 for s in found ] )
+
+def test_out_of_range():
+    # bounds beyond the int8 sixths are clipped, values beyond them match nothing
+    diquarks = StateIndex( next( generate(catalog.quarks.values(), kinds=((2, 0),)) )[1] )
+    assert len( diquarks.query(Q=-2/3, Iz=(-300, None)) ) == 6
+    assert len( diquarks.query(Q=-2/3, Iz=(None, 300)) ) == 6
+    assert len( diquarks.query(S=-30) ) == 0 and len( diquarks.query(S=30) ) == 0
+    assert len( diquarks.query(S=(1, -1)) ) == 0 and len( diquarks.query(S=(-300, -200)) ) == 0
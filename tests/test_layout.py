@@ -0,0 +1,67 @@
+# matplotlib-free diagram geometry: the overlap spread and the multiplet hulls
+import numpy as np
+
+from hadrons.layout import layer_hulls, spread, spread_patterns, spread_patterns3d
+
+def offsets(coords, **kw):
+    dx, dy = spread(coords, **kw)
+    return np.column_stack( (dx, dy) )
+
+def test_spread_patterns():
+    for n in (1, 2, 3, 4):
+        assert np.allclose( offsets([ (0, 0) ]*n), spread_patterns[n] )
+    assert np.allclose( offsets([ (0, 0) ]*3, patterns=spread_patterns3d), [ (0, 1), (-1, -1), (1, -1) ] )
+    assert len( spread([])[0] ) == 0
+
+def test_spread_groups_by_site():
+    # each site counts its own states, in order, however they interleave
+    coords = [ (0, 0), (1, 0), (0, 0), (2, 2), (1, 0), (1, 0) ]
+    off = offsets(coords)
+    assert np.allclose( off[[0, 2]], spread_patterns[2] )
+    assert np.allclose( off[[1, 4, 5]], spread_patterns[3] )
+    assert np.allclose( off[3], (0, 0) )
+
+def test_spread_ring():
+    # five to eight states on a ring whose neighbours are two radii apart
+    for n in range(5, 9):
+        off  = offsets([ (0, 0) ]*n)
+        dist = np.hypot( *(off - np.roll(off, 1, axis=0)).T )
+        assert np.allclose(dist, 2)
+        assert np.allclose( off.mean(axis=0), 0, atol=1e-12 )
+        assert np.allclose( off[0], (0, 1/np.sin(np.pi/n)) )
+
+def test_spread_lattice():
+    # more than `ring` states fill a square lattice centred on the site with no two on one point
+    for n in (9, 10, 16, 17):
+        off = offsets([ (0, 0) ]*n)
+        cols = int( np.ceil( np.sqrt(n) ) )
+        assert len( set( map(tuple, off.tolist()) ) ) == n
+        assert np.allclose( off[:, 0] % 2, (cols-1) % 2 )
+        assert off[:, 0].min() == -(cols-1) and off[:, 0].max() <= cols-1
+    assert len( set( map(tuple, offsets([ (0, 0) ]*6, ring=4).tolist()) ) ) == 6
+
+def hulls(points):
+    return { layer: v.tolist() for layer, v in layer_hulls( tuple(sorted(points)) ) }
+
+def test_hull_square():
+    # inner and edge midpoints are not vertices, the corners go counter clockwise
+    square = [ (x, y, 0) for x in (-2, 0, 2) for y in (-2, 0, 2) ]
+    v = np.array( hulls(square)[0] )
+    assert sorted( map(tuple, v.tolist()) ) == [ (-2, -2), (-2, 2), (2, -2), (2, 2) ]
+    area = 0.5*np.sum( v[:,0]*np.roll(v[:,1], -1) - np.roll(v[:,0], -1)*v[:,1] )
+    assert area == 16
+
+def test_hull_degenerate():
+    # a collinear layer is the segment between its ends, a single site itself
+    assert sorted( hulls([ (0, 0, 0), (3, 3, 0), (6, 6, 0), (-3, -3, 0) ])[0] ) == [ [-3, -3], [6, 6] ]
+    assert hulls([ (3, -6, 0) ]) == { 0: [ [3, -6] ] }
+    assert layer_hulls(()) == ()
+
+def test_hull_layers():
+    # one hull per layer in layer order, each from its own sites only
+    points = [ (0, 0, 6), (6, 0, 6), (0, 6, 6), (1, 1, -6), (0, 0, 0), (6, 0, 0) ]
+    assert [ layer for layer, v in layer_hulls( tuple(sorted(points)) ) ] == [ -6, 0, 6 ]
+    h = hulls(points)
+    assert h[-6] == [ [1, 1] ]
+    assert sorted( h[0] ) == [ [0, 0], [6, 0] ]
+    assert sorted( h[6] ) == [ [0, 0], [0, 6], [6, 0] ]
@@ -0,0 +1,37 @@
+# SU(N) decompositions and weight diagrams
+from hadrons import catalog
+from hadrons.multiplets import decompose, dimension, kostka
+
+u, d, s, c = catalog.u, catalog.d, catalog.s, catalog.c
+
+def names(irreps):
+    return [ (r.name, r.count) for r in irreps ]
+
+def test_mesons():
+    irreps = decompose([u, d, s], 1, 1)
+    assert names(irreps) == [ ('8', 1), ('1', 1) ]
+    octet = irreps[0]
+    assert octet.mult.sum() == 8
+    # the centre of the octet, (Iz, S) = (0, 0), is doubly occupied
+    centre = [ m for w, m in zip(octet.key(('Iz', 'S')).tolist(), octet.mult) if w==[0, 0] ]
+    assert centre == [2]
+
+def test_baryons():
+    assert names( decompose([u, d, s], 3) ) == [ ('10', 1), ('8', 2), ('1', 1) ]
+    assert names( decompose([u, d, s, c], 3) ) == [ ('20', 2), ("20'", 1), ('4bar', 1) ]
+
+def test_dimensions_add_up():
+    for quarks, nq, nqbar in ( ([u, d, s, c], 2, 2), ([u, d], 4, 0), ([u, d, s], 2, 1) ):
+        irreps = decompose(quarks, nq, nqbar)
+        assert sum( [ r.dim*r.count for r in irreps ] ) == len(quarks)**(nq+nqbar)
+        assert all( [ r.mult.sum()==r.dim for r in irreps ] )
+
+def test_hook_content_and_kostka():
+    assert dimension((2, 1), 3) == 8 and dimension((3,), 3) == 10 and dimension((1, 1, 1), 3) == 1
+    assert kostka((2, 1), (1, 1, 1)) == 2 and kostka((3,), (1, 1, 1)) == 1
+
+def test_table():
+    octet = decompose([u, d, s], 1, 1)[0]
+    table = octet.table()
+    assert len(table) == 8
+    assert sorted( map(tuple, table.key(('Iz', 'S')).tolist()) ) == sorted( [ tuple(w) for w, m in zip(octet.key(('Iz', 'S')).tolist(), octet.mult) for _ in range(m) ] )
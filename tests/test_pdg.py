@@ -0,0 +1,55 @@
+# loading PDG mass and width tables
+import os
+
+import numpy as np
+import pytest
+
+from hadrons.pdg import load_mcd, pdg_content, cache_name
+
+lines = [
+    '* a comment line',
+    ( '211', '1.39570390E-01 +1.8E-07 -1.8E-07 2.5284E-17 +5.0E-21 -5.0E-21 pi', '+' ),
+    ( '111', '1.3497700E-01 +5.0E-07 -5.0E-07 7.81E-09 +1.2E-10 -1.2E-10 pi', '0' ),
+    ( '311', '4.97611E-01 +1.3E-05 -1.3E-05 K', '0' ),
+    ( '2212', '9.3827208816E-01 +2.9E-10 -2.9E-10 p', '+' ),
+    ( '2224 2214 2114 1114', '1.232E+00 +2.0E-03 -2.0E-03 1.17E-01 +3.0E-03 -3.0E-03 Delta(1232)', '++,+,0,-' ),
+]
+
+def write(path):
+    with open(path, 'w') as f:
+        for line in lines:
+            f.write( line if isinstance(line, str) else '{:<33s}{:s} {:s}'.format(*line) )
+            f.write('\n')
+
+def test_pdg_content():
+    assert pdg_content(211) == (2, -1)
+    assert pdg_content(-321) == (-2, 3)
+    assert pdg_content(2212) == (2, 2, 1)
+    assert pdg_content(11) is None and pdg_content(130) is None
+
+def test_load_mcd(tmp_path):
+    path = str(tmp_path/'mass_width.mcd')
+    write(path)
+    table = load_mcd(path)
+    names = list(table.names)
+    # antiparticles are added after their particles, the neutral pion is its own
+    assert names == [ 'pi+', 'pi-', 'pi0', 'K0', 'K~0', 'p+', 'p~-',
+                      'Delta(1232)++', 'Delta(1232)~--', 'Delta(1232)+', 'Delta(1232)~-',
+                      'Delta(1232)0', 'Delta(1232)~0', 'Delta(1232)-', 'Delta(1232)~+' ]
+    pip = table[0]
+    assert pip.Q == 1 and pip.B == 0 and abs(pip.mass-0.13957039) < 1e-12
+    assert table[3].S == 1 and table[4].S == -1
+    assert table[6].B == -1 and table[6].Q == -1
+    assert os.path.exists( cache_name(path) )
+
+    # the memory-mapped cache loads the same table
+    again = load_mcd(path)
+    assert list(again.names) == names and np.array_equal(again.qn, table.qn)
+    assert np.array_equal( again.data['mass'], table.data['mass'] )
+
+def test_charge_mismatch(tmp_path):
+    path = str(tmp_path/'bad.mcd')
+    with open(path, 'w') as f:
+        f.write( '{:<33s}{:s} {:s}\n'.format('211', '1.39570390E-01 +1.8E-07 -1.8E-07 pi', '-') )
+    with pytest.raises(ValueError):
+        load_mcd(path, cache=False)
@@ -0,0 +1,43 @@
+# drawing: automatic label placement of the 3d diagrams
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from mpl_toolkits.mplot3d import proj3d
+
+from hadrons.build import figures, figure_states, new_figure
+from hadrons.plotting import text_boxes, text_extent
+
+def projected(ax, xyz):
+    # screen positions, in points, of 3d data points for the current view
+    xs, ys, _ = proj3d.proj_transform( *np.asarray(xyz, dtype=float).T, ax.get_proj() )
+    return ax.transData.transform( np.column_stack((xs, ys)) ) * 72/ax.figure.dpi
+
+def overlap(a, b):
+    return min(a[2], b[2]) - max(a[0], b[0]) > 1e-6 and min(a[3], b[3]) - max(a[1], b[1]) > 1e-6
+
+@pytest.mark.parametrize('name', [ n for n in figures if n.startswith('ch_') ])
+def test_labels_clear(name):
+    # the placed labels of a stock figure overlap neither each other, the state markers nor the tick labels
+    spec = figures[name]
+    fig  = Figure(figsize=spec['figsize'])
+    FigureCanvasAgg(fig)
+    new_figure( spec['kind'], figure_states(name), spec['figsize'], spec['args'], fig=fig )
+    fig.canvas.draw()
+    ax = fig.axes[0]
+    labels = [ t for t in ax.texts if t.get_label().startswith('_state:') ]
+    ticks  = [ b for t, b in zip(ax.texts, text_boxes(ax)) if not t.get_label().startswith('_state') ]
+    assert len(labels) == 2*len(figure_states(name))
+
+    boxes = []
+    for t in labels:
+        ctr = projected(ax, [ t.get_position_3d() ])[0]
+        off = ( t.get_transform().transform((0, 0)) - ax.transData.transform((0, 0)) ) * 72/fig.dpi
+        w, h, d = text_extent(t.get_text(), t.get_fontsize())
+        boxes.append( (ctr[0]+off[0]-w/2, ctr[1]+off[1]-h/2, ctr[0]+off[0]+w/2, ctr[1]+off[1]+h/2) )
+    dots    = [ l for l in ax.lines if l.get_label()=='_states' ][0]
+    markers = [ (x-3, y-3, x+3, y+3) for x, y in projected( ax, np.column_stack( dots.get_data_3d() ) ) ]
+    for i, a in enumerate(boxes):
+        assert not any( [ overlap(a, b) for b in boxes[i+1:] ] ), labels[i].get_text()
+        assert not any( [ overlap(a, b) for b in markers ] ), labels[i].get_text()
+        assert not any( [ overlap(a, b) for b in ticks ] ), labels[i].get_text()
@@ -0,0 +1,54 @@
+# batched conservation checks
+import numpy as np
+import pytest
+
+from hadrons import catalog
+from hadrons.pdg import load_mcd
+from hadrons.reactions import processes, conserve
+
+table = catalog.hadron_table
+
+def test_strong_and_weak():
+    initial, final = processes(table, [ (['rhoz'], ['pip', 'pim']),       # strong
+                                        (['Kp'], ['pip', 'piz']),         # weak, S changes by one
+                                        (['p'], ['pip', 'piz']),          # B violated
+                                        (['delpp'], ['p', 'pip']) ])        # strong
+    c = conserve(table, initial, final)
+    assert list(c.strong) == [True, False, False, True]
+    assert list(c.allowed) == list(c.strong)
+    assert list(c.violated) == ['', 'S', 'B', '']
+    w = conserve(table, initial, final, weak=True)
+    assert list(w.allowed) == [True, True, False, True]
+    assert list(w.violated) == ['', '', 'B', '']
+    assert list(w.delta('S')) == [0, -1, 0, 0]
+
+def test_chunks_agree():
+    rng = np.random.default_rng(1)
+    initial = rng.integers(-1, len(table), size=(1000, 2))
+    final   = rng.integers(-1, len(table), size=(1000, 3))
+    a = conserve(table, initial, final, weak=True)
+    b = conserve(table, initial, final, weak=True, chunk=7)
+    assert np.array_equal(a.change, b.change) and np.array_equal(a.allowed, b.allowed)
+
+def test_errors():
+    with pytest.raises(ValueError):
+        processes(table, [ (['nope'], ['pip']) ])
+    with pytest.raises(IndexError):
+        conserve(table, [[len(table)]], [[0]])
+    with pytest.raises(ValueError):
+        conserve(table, [[0], [1]], [[0]])
+
+def test_mass_threshold(tmp_path):
+    # a decay is open when the masses of the products add up to less than the initial mass
+    path = str(tmp_path/'mass_width.mcd')
+    with open(path, 'w') as f:
+        for ids, values, charges in ( ('211', '1.39570390E-01 +1.8E-07 -1.8E-07 pi', '+'),
+                                      ('111', '1.3497700E-01 +5.0E-07 -5.0E-07 pi', '0'),
+                                      ('2212', '9.3827208816E-01 +2.9E-10 -2.9E-10 p', '+'),
+                                      ('2224', '1.232E+00 +2.0E-03 -2.0E-03 1.17E-01 +3.0E-03 -3.0E-03 Delta(1232)', '++') ):
+            f.write( '{:<33s}{:s} {:s}\n'.format(ids, values, charges) )
+    mcd = load_mcd(path, cache=False)
+    initial, final = processes(mcd, [ (['Delta(1232)++'], ['p+', 'pi+']), (['pi0'], ['pi+', 'pi-']) ])
+    c = conserve(mcd, initial, final)
+    assert list(c.strong) == [True, True]
+    assert list(c.open) == [True, False]
@@ -0,0 +1,37 @@
+# request normalization of the render server and its answers to bad requests
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from hadrons import server
+
+def test_canonical():
+    req = server.canonical( dict(kind='facets', catalog='mesons', by='S,C', dpi='150', figsize='12,6') )
+    assert req['args']['by'] == ['S', 'C'] and req['dpi'] == 150 and req['figsize'] == [12.0, 6.0]
+    # equivalent requests hash alike
+    assert server.request_key(req) == server.request_key( server.canonical( dict(kind='facets', catalog='mesons', by=['S', 'C'], dpi=150, figsize=[12, 6]) ) )
+
+@pytest.mark.parametrize('fields', [ dict(kind='facets', by='S,X'), dict(kind='facets', by=''), dict(kind='facets', ncols='0'),
+                                     dict(dpi='0'), dict(dpi='-72'), dict(figsize='0,8'), dict(figsize='10,nan'), dict(figsize='10') ])
+def test_bad_fields(fields):
+    with pytest.raises(ValueError):
+        server.canonical( dict(catalog='mesons', **fields) )
+
+def test_bad_request_status():
+    # rejected before anything is rendered, so no worker pool is needed
+    httpd  = server.http.server.ThreadingHTTPServer( ('127.0.0.1', 0), server.Handler )
+    server.Handler.quiet = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = 'http://127.0.0.1:{:d}/render?'.format(httpd.server_address[1])
+        for query in ('kind=facets&by=X', 'dpi=0', 'figsize=-1,8'):
+            with pytest.raises(urllib.error.HTTPError) as err:
+                urllib.request.urlopen(url+query, timeout=10)
+            assert err.value.code == 400 and 'error' in json.loads( err.value.read() )
+    finally:
+        httpd.shutdown()
+        httpd.server_close()